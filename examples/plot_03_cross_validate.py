@@ -167,7 +167,6 @@ plt.show()
 
 # %%
 my_project_gs.delete_item("cross_validation")
-my_project_gs.delete_item("cross_validation_aggregated")
 
 # %%
 # .. note::
@@ -4,11 +4,13 @@ import logging
 
 import rich.logging
 
+from skore.item import MediaPolicy
 from skore.project import Project, load
 from skore.sklearn import cross_validate
 from skore.utils._show_versions import show_versions
 
 __all__ = [
+    "MediaPolicy",
     "Project",
     "cross_validate",
     "load",
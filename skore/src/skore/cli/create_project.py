@@ -150,6 +150,14 @@ def __create(
             f"Unable to create project file '{views_dir}'."
         ) from e
 
+    blobs_dir = project_directory / "blobs"
+    try:
+        blobs_dir.mkdir()
+    except Exception as e:
+        raise ProjectCreationError(
+            f"Unable to create project file '{blobs_dir}'."
+        ) from e
+
     p = load(project_directory)
     p.put_view("default", View(layout=[]))
 
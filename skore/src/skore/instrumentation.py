@@ -0,0 +1,184 @@
+"""Instrument the time spent and bytes processed in each phase of put and get.
+
+Listeners registered with :func:`add_listener` receive one :class:`Event` per
+phase, once that phase is over. Phases are nested; for instance a ``"put"`` event
+is emitted after the ``"object_to_item"`` and ``"put_item"`` events of the same
+call. The phases are:
+
+- ``"put"``: :meth:`skore.Project.put_one`, as a whole,
+- ``"object_to_item"``: the conversion of the value to an item, e.g. the call to
+  ``skops``, ``savefig``...,
+- ``"put_item"``: :meth:`skore.item.ItemRepository.put_item`, as a whole,
+- ``"get"``: :meth:`skore.Project.get`, as a whole,
+- ``"get_item"`` and ``"get_item_versions"``: the corresponding methods of
+  :class:`skore.item.ItemRepository`, as a whole,
+- ``"decode"``: the conversion of an item back to a value,
+- ``"storage.get"`` and ``"storage.set"``: the calls to the storage,
+- ``"disk.fetch"`` and ``"disk.store"``: the reading and unpickling (resp. the
+  pickling and writing) of a value by a disk storage; the remainder of the storage
+  call is spent in SQLite.
+
+When no listener is registered, instrumentation costs a single truth test per
+phase.
+
+Examples
+--------
+>>> from skore import instrumentation
+>>> events = []
+>>> with instrumentation.listening(events.append):
+...     with instrumentation.measure("put", key="key"):
+...         pass
+>>> events[0].phase, events[0].key
+('put', 'key')
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Event:
+    """The record of one phase of a put or a get.
+
+    Attributes
+    ----------
+    phase : str
+        The name of the phase.
+    duration : float
+        The time spent in the phase, in seconds.
+    key : str, optional
+        The key being put or got, if known.
+    item_type : str, optional
+        The name of the class of the item being put or got, if known.
+    nbytes : int, optional
+        The number of bytes processed by the phase, if known.
+        Except for disk phases, it is the total length of the bytes and strings
+        of the payload, not the exact size of its encoding.
+    error : str, optional
+        The name of the exception raised during the phase, if any.
+    """
+
+    phase: str
+    duration: float
+    key: str | None = None
+    item_type: str | None = None
+    nbytes: int | None = None
+    error: str | None = None
+
+
+Listener = Callable[[Event], Any]
+
+# Replaced rather than mutated, so that emitting never races with registration
+_listeners: tuple[Listener, ...] = ()
+
+
+def add_listener(listener: Listener):
+    """Register ``listener`` to be called with every subsequent :class:`Event`."""
+    global _listeners
+    _listeners = (*_listeners, listener)
+
+
+def remove_listener(listener: Listener):
+    """Unregister ``listener``.
+
+    Raises
+    ------
+    ValueError
+        If ``listener`` is not registered.
+    """
+    global _listeners
+
+    listeners = list(_listeners)
+    listeners.remove(listener)
+    _listeners = tuple(listeners)
+
+
+@contextmanager
+def listening(listener: Listener):
+    """Register ``listener`` for the duration of the ``with`` block."""
+    add_listener(listener)
+
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+class Measure:
+    """Measure the duration of a phase and emit it to the listeners.
+
+    The attributes ``key``, ``item_type`` and ``nbytes`` can be completed inside of
+    the ``with`` block.
+    """
+
+    __slots__ = ("phase", "key", "item_type", "nbytes", "start")
+
+    def __init__(self, phase, key=None, item_type=None, nbytes=None):
+        self.phase = phase
+        self.key = key
+        self.item_type = item_type
+        self.nbytes = nbytes
+
+    def __enter__(self) -> Measure:
+        """Start measuring."""
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Stop measuring and emit the event."""
+        event = Event(
+            phase=self.phase,
+            duration=perf_counter() - self.start,
+            key=self.key,
+            item_type=self.item_type,
+            nbytes=self.nbytes,
+            error=None if exc_type is None else exc_type.__name__,
+        )
+
+        for listener in _listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception(f"Instrumentation listener {listener!r} failed.")
+
+
+_NO_MEASURE = nullcontext()
+
+
+def measure(phase: str, **kwargs) -> Measure | nullcontext:
+    """Measure the phase executed in the ``with`` block.
+
+    If no listener is registered, return a no-op context manager whose target is
+    None; callers must then skip any extra work done only for instrumentation.
+
+    Parameters
+    ----------
+    phase : str
+        The name of the phase.
+    **kwargs
+        The initial ``key``, ``item_type`` or ``nbytes`` of the event.
+    """
+    if not _listeners:
+        return _NO_MEASURE
+
+    return Measure(phase, **kwargs)
+
+
+def payload_size(value: Any) -> int:
+    """Return the total length of the bytes and strings nested in ``value``."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(payload_size(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(v) for v in value)
+    return 0
@@ -2,52 +2,38 @@
 
 from __future__ import annotations
 
-from contextlib import suppress
-from typing import Any
-
 from skore.item.cross_validation_item import CrossValidationItem
 from skore.item.item import Item, ItemTypeError
 from skore.item.item_repository import ItemRepository
-from skore.item.media_item import MediaItem
+from skore.item.media_item import MediaItem, MediaPolicy, media_policy
 from skore.item.numpy_array_item import NumpyArrayItem
 from skore.item.pandas_dataframe_item import PandasDataFrameItem
 from skore.item.pandas_series_item import PandasSeriesItem
 from skore.item.primitive_item import PrimitiveItem
+from skore.item.registry import ItemRegistry, registry
+from skore.item.scipy_sparse_matrix_item import ScipySparseMatrixItem
 from skore.item.sklearn_base_estimator_item import SklearnBaseEstimatorItem
 
-
-def object_to_item(object: Any) -> Item:
-    """Transform an object into an Item."""
-    for cls in (
-        PrimitiveItem,
-        PandasDataFrameItem,
-        PandasSeriesItem,
-        NumpyArrayItem,
-        SklearnBaseEstimatorItem,
-        MediaItem,
-    ):
-        with suppress(ImportError, ItemTypeError):
-            # ImportError:
-            #     The factories are responsible to import third-party libraries in a
-            #     lazy way. If library is missing, an ImportError exception will
-            #     automatically be thrown.
-            # ItemTypeError:
-            #     The factories are responsible for checking that parameters are of the
-            #     correct type. If not, they throw a ItemTypeError exception.
-            return cls.factory(object)
-
-    raise NotImplementedError(f"Type '{object.__class__}' is not supported.")
+object_to_item = registry.object_to_item
+register_item_type = registry.register
 
 
 __all__ = [
     "CrossValidationItem",
     "Item",
+    "ItemRegistry",
     "ItemRepository",
+    "ItemTypeError",
     "MediaItem",
+    "MediaPolicy",
     "NumpyArrayItem",
     "PandasDataFrameItem",
     "PandasSeriesItem",
     "PrimitiveItem",
+    "ScipySparseMatrixItem",
     "SklearnBaseEstimatorItem",
+    "media_policy",
     "object_to_item",
+    "register_item_type",
+    "registry",
 ]
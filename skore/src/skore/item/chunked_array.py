@@ -0,0 +1,311 @@
+"""ChunkedArray.
+
+This module defines the storage of large NumPy arrays in fixed-size N-dimensional
+chunks, and the ChunkedArray class, which reads them lazily.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import product
+from math import ceil, prod
+from typing import Any, Union
+
+import numpy
+import numpy.lib.format
+
+from skore.item.numpy_array_item import array_from_npy, array_to_npy
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def guess_chunk_shape(shape: tuple[int, ...], itemsize: int, size: int) -> tuple:
+    """Return a chunk shape of at most ``size`` bytes, as balanced as possible.
+
+    Axes are halved in turn, starting from the first, until chunks are small enough.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        The shape of the array.
+    itemsize : int
+        The size of an element of the array, in bytes.
+    size : int
+        The maximum size of a chunk, in bytes.
+
+    Returns
+    -------
+    tuple[int, ...]
+        The shape of a chunk.
+    """
+    chunk_shape = [max(dim, 1) for dim in shape]
+    axis = 0
+
+    while prod(chunk_shape) * itemsize > size and any(d > 1 for d in chunk_shape):
+        if chunk_shape[axis] > 1:
+            chunk_shape[axis] = ceil(chunk_shape[axis] / 2)
+
+        axis = (axis + 1) % len(chunk_shape)
+
+    return tuple(chunk_shape)
+
+
+def chunk_grid(shape: Sequence[int], chunk_shape: Sequence[int]) -> tuple:
+    """Return the number of chunks along each axis."""
+    return tuple(ceil(dim / chunk) for dim, chunk in zip(shape, chunk_shape))
+
+
+class ArrayChunks(Sequence):
+    """The ``.npy`` representations of the chunks of an array, in C order.
+
+    Chunks are encoded on access: iterating over them reads the array chunk by chunk,
+    so that arrays larger than memory, such as ``numpy.memmap``, can be stored.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to split in chunks.
+    chunk_shape : tuple[int, ...]
+        The shape of the chunks.
+    """
+
+    def __init__(self, array: numpy.ndarray, chunk_shape: tuple[int, ...]):
+        self.array = array
+        self.chunk_shape = tuple(chunk_shape)
+        self.grid = chunk_grid(array.shape, chunk_shape)
+
+    def __len__(self) -> int:
+        """Return the number of chunks."""
+        return prod(self.grid)
+
+    def __getitem__(self, index: int) -> bytes:
+        """Return the ``.npy`` representation of the chunk at ``index``."""
+        if not -len(self) <= index < len(self):
+            raise IndexError("Chunk index out of range.")
+
+        position = numpy.unravel_index(index % len(self), self.grid)
+        chunk = self.array[
+            tuple(
+                slice(i * size, (i + 1) * size)
+                for i, size in zip(position, self.chunk_shape)
+            )
+        ]
+
+        return array_to_npy(numpy.ascontiguousarray(chunk))
+
+
+def _range_to_slice(selection: range) -> slice:
+    # A negative stop would count from the end
+    stop = selection.stop if selection.stop >= 0 else None
+    return slice(selection.start, stop, selection.step)
+
+
+class ChunkedArray:
+    """A read-only NumPy-like array, whose chunks are loaded on demand.
+
+    Indexing a ``ChunkedArray`` with integers, slices (of any step), ellipsis, and
+    at most one integer or boolean array, returns the same NumPy array as indexing
+    the original array, loading only the chunks overlapping the selection.
+
+    Use ``numpy.asarray`` to load the whole array.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        The shape of the array.
+    dtype : numpy.dtype
+        The dtype of the array.
+    chunk_shape : tuple[int, ...]
+        The shape of the chunks.
+    chunks : Sequence[bytes-like]
+        The ``.npy`` representations of the chunks, in C order.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: numpy.dtype,
+        chunk_shape: tuple[int, ...],
+        chunks: Sequence[Buffer],
+    ):
+        self.shape = tuple(shape)
+        self.dtype = numpy.dtype(dtype)
+        self.chunk_shape = tuple(chunk_shape)
+        self.chunks = chunks
+        self.grid = chunk_grid(self.shape, self.chunk_shape)
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of the array."""
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        """The number of elements of the array."""
+        return prod(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the array, once loaded."""
+        return self.size * self.dtype.itemsize
+
+    def __len__(self) -> int:
+        """Return the length of the first axis."""
+        if not self.shape:
+            raise TypeError("len() of unsized object")
+
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        """Represent the array, without loading it."""
+        return (
+            f"ChunkedArray(shape={self.shape}, dtype={self.dtype}, "
+            f"chunk_shape={self.chunk_shape})"
+        )
+
+    def __array__(self, dtype=None, copy=None) -> numpy.ndarray:
+        """Load the whole array."""
+        array = self[...]
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def chunk(self, position: tuple[int, ...]) -> numpy.ndarray:
+        """Load the chunk at ``position`` in the grid of chunks, as a read-only view."""
+        index = int(numpy.ravel_multi_index(position, self.grid)) if self.grid else 0
+        return array_from_npy(self.chunks[index])
+
+    def __normalize(self, key: Any) -> tuple[list, list[bool]]:
+        """Return the selection and whether it is dropped, for each axis."""
+        key = key if isinstance(key, tuple) else (key,)
+
+        if sum(k is Ellipsis for k in key) > 1:
+            raise IndexError("An index can only have a single ellipsis ('...').")
+        # Not ``Ellipsis in key``, which compares arrays elementwise
+        if any(k is Ellipsis for k in key):
+            i = next(i for i, k in enumerate(key) if k is Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = key[:i] + fill + key[i + 1 :]
+
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        if len(key) > self.ndim:
+            raise IndexError(
+                f"Too many indices for array: array is {self.ndim}-dimensional, "
+                f"but {len(key)} were indexed."
+            )
+
+        selections = []
+        dropped = []
+
+        for k, dim in zip(key, self.shape):
+            if isinstance(k, slice):
+                selections.append(range(*k.indices(dim)))
+                dropped.append(False)
+            elif isinstance(k, (int, numpy.integer)):
+                if not -dim <= k < dim:
+                    raise IndexError(f"Index {k} is out of bounds for size {dim}.")
+
+                selections.append(range(k % dim, k % dim + 1))
+                dropped.append(True)
+            else:
+                k = numpy.asarray(k)
+
+                if k.dtype == bool:
+                    if k.shape != (dim,):
+                        raise IndexError("Boolean index does not match the axis.")
+                    k = numpy.flatnonzero(k)
+                elif k.ndim != 1 or k.dtype.kind not in "iu":
+                    raise IndexError(
+                        "Only integers, slices, ellipsis and 1-D integer or boolean "
+                        "arrays are valid indices."
+                    )
+                elif k.size and not (-dim <= k.min() and k.max() < dim):
+                    raise IndexError(f"Index is out of bounds for size {dim}.")
+
+                selections.append(k % dim if dim else k)
+                dropped.append(False)
+
+        if sum(isinstance(s, numpy.ndarray) for s in selections) > 1:
+            raise IndexError("Only one integer or boolean array index is supported.")
+
+        return selections, dropped
+
+    @staticmethod
+    def __split(selection, chunk: int) -> list[tuple[int, Any, Any]]:
+        """Split the selection of an axis by chunk.
+
+        Return, for each overlapping chunk, its position, the selection within the
+        chunk and the position of the selected elements in the output.
+        """
+        if isinstance(selection, numpy.ndarray):
+            positions = selection // chunk
+
+            return [
+                (
+                    int(position),
+                    selection[mask] - position * chunk,
+                    numpy.flatnonzero(mask),
+                )
+                for position in numpy.unique(positions)
+                for mask in (positions == position,)
+            ]
+
+        if not selection:
+            return []
+
+        first, last = sorted((selection[0], selection[-1]))
+        step = abs(selection.step)
+        splits = []
+
+        for position in range(first // chunk, last // chunk + 1):
+            start, stop = position * chunk, (position + 1) * chunk
+
+            # The positions in the selection of the elements within the chunk
+            if selection.step > 0:
+                lo = ceil((start - selection.start) / step)
+                hi = ceil((stop - selection.start) / step)
+            else:
+                lo = (selection.start - stop) // step + 1
+                hi = (selection.start - start) // step + 1
+
+            lo, hi = max(lo, 0), min(hi, len(selection))
+
+            if lo < hi:
+                within = selection[lo:hi]
+                splits.append(
+                    (
+                        position,
+                        _range_to_slice(
+                            range(
+                                within.start - start, within.stop - start, within.step
+                            )
+                        ),
+                        slice(lo, hi),
+                    )
+                )
+
+        return splits
+
+    def __getitem__(self, key: Any) -> numpy.ndarray:
+        """Load the selection ``key``, reading only the chunks it overlaps."""
+        selections, dropped = self.__normalize(key)
+        output = numpy.empty(tuple(len(s) for s in selections), dtype=self.dtype)
+        splits = [
+            self.__split(selection, chunk)
+            for selection, chunk in zip(selections, self.chunk_shape)
+        ]
+
+        for parts in product(*splits):
+            positions, within, into = zip(*parts) if parts else ((), (), ())
+            output[into] = self.chunk(positions)[within]
+
+        output = output[tuple(0 if drop else slice(None) for drop in dropped)]
+
+        # As NumPy, integers are then advanced indices too: if they are not next to
+        # the array index, the axis of the array index comes first
+        arrays = [i for i, s in enumerate(selections) if isinstance(s, numpy.ndarray)]
+        advanced = [i for i, drop in enumerate(dropped) if drop] + arrays
+
+        if arrays and max(advanced) - min(advanced) + 1 != len(advanced):
+            output = numpy.moveaxis(output, sum(not d for d in dropped[: arrays[0]]), 0)
+
+        return output
@@ -6,19 +6,25 @@ This class represents the output of a cross-validation workflow.
 from __future__ import annotations
 
 import contextlib
-import hashlib
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 import numpy
 import plotly.graph_objects
-import plotly.io
 
+from skore.item.fingerprint import fingerprint
 from skore.item.item import Item, ItemTypeError
+from skore.item.numpy_array_item import array_from_npy, array_to_npy
+from skore.item.plotly_encoding import figure_from_json, figure_to_json
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from typing import Union
+
     import sklearn.base
 
+    Buffer = Union[bytes, bytearray, memoryview]
+
 
 def plot_cross_validation(cv_results: dict) -> plotly.graph_objects.Figure:
     """Plot the result of a cross-validation run.
@@ -142,14 +148,15 @@ def plot_cross_validation(cv_results: dict) -> plotly.graph_objects.Figure:
 
 
 def plot_cross_validation_aggregation(
-    cv_results_items_versions: list[CrossValidationItem],
+    cv_results_items_versions: list[CrossValidationItem] | list[dict],
 ) -> plotly.graph_objects.Figure:
     """Plot the result of the aggregation of several cross-validation runs.
 
     Parameters
     ----------
-    cv_results_items_versions : list[CrossValidationItem]
-        A list of outputs of scikit-learn's cross_validate function.
+    cv_results_items_versions : list[CrossValidationItem] | list[dict]
+        A list of outputs of scikit-learn's cross_validate function, as items or
+        as their serialized results.
 
     Returns
     -------
@@ -163,7 +170,9 @@ def plot_cross_validation_aggregation(
 
     _cv_results = cv_results_items_versions.copy()
 
-    df = pandas.DataFrame([v.cv_results_serialized for v in _cv_results])
+    df = pandas.DataFrame(
+        [v if isinstance(v, dict) else v.cv_results_serialized for v in _cv_results]
+    )
     df = df.apply(pandas.Series.explode)
     df = df.reset_index(names="run_number")
 
@@ -226,20 +235,132 @@ def plot_cross_validation_aggregation(
     return fig
 
 
-def _hash_numpy(arr: numpy.ndarray) -> str:
-    """Compute a hash string from a numpy array.
+def _is_range(array: numpy.ndarray) -> bool:
+    """Return True if ``array`` is a non-empty range of consecutive integers."""
+    return bool(len(array)) and bool(numpy.all(numpy.diff(array) == 1))
+
+
+def _fold_assignment(train: list, test: list) -> numpy.ndarray | None:
+    """Return the fold of each sample, if the splits are those of a K-fold.
+
+    The splits are those of a K-fold, e.g. ``KFold`` or ``StratifiedKFold``, when
+    the sorted test sets partition the samples, and each train set is the sorted
+    complement of its test set.
+    """
+    n_samples = sum(map(len, test))
+
+    # Samples are assigned to no fold yet, i.e. to ``len(test)``
+    folds = numpy.full(n_samples, len(test), dtype=numpy.min_scalar_type(len(test)))
+
+    for fold, indices in enumerate(test):
+        if (
+            not len(indices)
+            or indices.dtype.kind not in "iu"
+            or indices[0] < 0
+            or indices[-1] >= n_samples
+            or numpy.any(numpy.diff(indices) <= 0)
+            or numpy.any(folds[indices] != len(test))
+        ):
+            return None
+
+        folds[indices] = fold
+
+    if any(
+        not numpy.array_equal(indices, numpy.flatnonzero(folds != fold))
+        for fold, indices in enumerate(train)
+    ):
+        return None
+
+    return folds
+
+
+def encode_indices(indices: dict) -> tuple[dict, bytes | None]:
+    """Encode the train and test indices of the splits of a cross-validation.
+
+    The indices are encoded, from the most to the least compact:
+
+    - as the fold of each sample, for K-folds; see :func:`_fold_assignment`,
+    - as ranges, for splits of consecutive samples, e.g. ``TimeSeriesSplit``,
+    - otherwise, as the smallest unsigned integers which can hold them.
+
+    Parameters
+    ----------
+    indices : dict
+        The ``"train"`` and ``"test"`` indices of each split, as returned by
+        scikit-learn's cross_validate function with ``return_indices=True``.
+
+    Returns
+    -------
+    tuple[dict, bytes | None]
+        The JSON-serializable specification of the indices, and the ``.npy``
+        representation of the integers it refers to, if any.
+    """
+    train = [numpy.asarray(array) for array in indices["train"]]
+    test = [numpy.asarray(array) for array in indices["test"]]
+
+    if (folds := _fold_assignment(train, test)) is not None:
+        return {"folds": len(test)}, array_to_npy(folds)
+
+    spec: dict = {"train": [], "test": []}
+    arrays = []
+
+    for name, splits in (("train", train), ("test", test)):
+        for array in splits:
+            if _is_range(array):
+                spec[name].append({"range": [int(array[0]), int(array[-1]) + 1]})
+            else:
+                spec[name].append({"length": len(array)})
+                arrays.append(array)
+
+    if not arrays:
+        return spec, None
+
+    values = numpy.concatenate(arrays)
+    dtype = numpy.min_scalar_type(values.max() if len(values) else 0)
+
+    return spec, array_to_npy(values.astype(dtype))
+
+
+def decode_indices(spec: dict, npy: Buffer | None) -> dict[str, list[numpy.ndarray]]:
+    """Decode the indices encoded with :func:`encode_indices`.
 
     Parameters
     ----------
-    arr : numpy array
-        The numpy array whose hash will be computed.
+    spec : dict
+        The specification of the indices.
+    npy : bytes-like, optional
+        The ``.npy`` representation of the integers the specification refers to.
 
     Returns
     -------
-    hash : str
-        A hash corresponding to the input array.
+    dict[str, list[numpy.ndarray]]
+        The ``"train"`` and ``"test"`` indices of each split, as integer arrays.
     """
-    return hashlib.sha256(bytes(memoryview(arr))).hexdigest()
+    values = None if npy is None else array_from_npy(npy)
+
+    if "folds" in spec:
+        folds = range(spec["folds"])
+
+        return {
+            "train": [numpy.flatnonzero(values != fold) for fold in folds],
+            "test": [numpy.flatnonzero(values == fold) for fold in folds],
+        }
+
+    indices: dict = {"train": [], "test": []}
+    offset = 0
+
+    for name in ("train", "test"):
+        for split in spec[name]:
+            if "range" in split:
+                indices[name].append(numpy.arange(*split["range"]))
+            else:
+                length = split["length"]
+                indices[name].append(
+                    values[offset : offset + length].astype(numpy.intp)
+                )
+                offset += length
+
+    return indices
 
 
 # Data used for training, passed as input to scikit-learn
@@ -256,13 +377,17 @@ class CrossValidationItem(Item):
     with its creation and update timestamps.
     """
 
+    __blobs__ = ("cv_indices_npy",)
+
     def __init__(
         self,
         cv_results_serialized: dict,
         estimator_info: dict,
         X_info: dict,
         y_info: dict,
-        plot_bytes: bytes,
+        plot_bytes: bytes | None = None,
+        cv_indices_spec: dict | None = None,
+        cv_indices_npy: Buffer | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
@@ -278,10 +403,22 @@ class CrossValidationItem(Item):
             The estimator that was cross-validated.
         X_info : dict
             A summary of the data, input of scikit-learn's cross_validation function.
+            Its ``"hash"`` is the fingerprint of the data, see
+            :func:`skore.item.fingerprint.fingerprint`. Items stored by earlier
+            versions of skore hold the SHA-256 of the bytes of the data as an array
+            instead: the hashes of the same data differ across these versions.
         y_info : dict
             A summary of the target, input of scikit-learn's cross_validation function.
-        plot_bytes : bytes
-            A plot of the cross-validation results, in the form of bytes.
+            Its ``"hash"`` is computed as that of ``X_info``.
+        plot_bytes : bytes, optional
+            A plot of the cross-validation results, in the form of bytes. Recent
+            items have none: their plot is derived from ``cv_results_serialized``.
+        cv_indices_spec : dict, optional
+            The specification of the train and test indices of each split, if they
+            were returned; see :func:`encode_indices`.
+        cv_indices_npy : bytes-like, optional
+            The ``.npy`` representation of the integers ``cv_indices_spec`` refers
+            to, if any.
         created_at : str
             The creation timestamp in ISO format.
         updated_at : str
@@ -294,6 +431,73 @@ class CrossValidationItem(Item):
         self.X_info = X_info
         self.y_info = y_info
         self.plot_bytes = plot_bytes
+        self.cv_indices_spec = cv_indices_spec
+        self.cv_indices_npy = cv_indices_npy
+
+    @cached_property
+    def cv_indices(self) -> dict[str, list[numpy.ndarray]] | None:
+        """
+        The train and test indices of each split, if they were returned.
+
+        They are decoded on first access, as integer arrays, then cached.
+        """
+        if self.cv_indices_spec is None:
+            indices = self.cv_results_serialized.get("indices")
+
+            # Items stored before the indices were encoded hold them as lists
+            return (
+                None
+                if indices is None
+                else {
+                    name: [numpy.asarray(split) for split in indices[name]]
+                    for name in ("train", "test")
+                }
+            )
+
+        return decode_indices(self.cv_indices_spec, self.cv_indices_npy)
+
+    @staticmethod
+    def describe_data(
+        X: Data,
+        y: Target | None,
+        sample_size: int | None = None,
+        version: Hashable | None = None,
+    ) -> tuple[dict, dict | None]:
+        """
+        Describe the data and target of a cross-validation, fingerprinting them.
+
+        Parameters
+        ----------
+        X
+            The data, input of scikit-learn's cross_validation function.
+        y
+            The target, input of scikit-learn's cross_validation function.
+        sample_size : int, optional
+            The number of rows from which the data and target are fingerprinted, if
+            they have more, by default None, i.e. all the rows.
+        version : Hashable, optional
+            The version of the data and target, for their fingerprints to be
+            memoized, by default None.
+
+        Returns
+        -------
+        tuple[dict, dict | None]
+            The description of ``X``, its shape and fingerprint, and the
+            description of ``y``, its fingerprint, or None if there is no target.
+        """
+        y_info = None if y is None else {"hash": fingerprint(y, sample_size, version)}
+
+        # Datasets are fingerprinted in chunks, without being converted to arrays
+        if not hasattr(X, "shape"):
+            X = numpy.asarray(X)
+
+        X_info = {
+            "nb_rows": X.shape[0],
+            "nb_cols": X.shape[1],
+            "hash": fingerprint(X, sample_size, version),
+        }
+
+        return X_info, y_info
 
     @classmethod
     def factory(
@@ -302,6 +506,7 @@ class CrossValidationItem(Item):
         estimator: sklearn.base.BaseEstimator,
         X: Data,
         y: Target | None,
+        data_info: tuple[dict, dict | None] | None = None,
     ) -> CrossValidationItem:
         """
         Create a new CrossValidationItem instance.
@@ -316,6 +521,11 @@ class CrossValidationItem(Item):
             The data, input of scikit-learn's cross_validation function.
         y
             The target, input of scikit-learn's cross_validation function.
+        data_info : tuple[dict, dict | None], optional
+            The description of ``X`` and ``y``, as returned by
+            :meth:`describe_data`, so that they are not fingerprinted again when
+            several items are created for the same data. By default, they are
+            described here.
 
         Returns
         -------
@@ -326,14 +536,13 @@ class CrossValidationItem(Item):
             raise ItemTypeError(f"Type '{cv_results.__class__}' is not supported.")
 
         cv_results_serialized = {}
+        cv_indices_spec, cv_indices_npy = None, None
+
         for k, v in cv_results.items():
             if k == "estimator":
                 continue
             if k == "indices":
-                cv_results_serialized["indices"] = {
-                    "train": tuple(arr.tolist() for arr in v["train"]),
-                    "test": tuple(arr.tolist() for arr in v["test"]),
-                }
+                cv_indices_spec, cv_indices_npy = encode_indices(v)
             if isinstance(v, numpy.ndarray):
                 cv_results_serialized[k] = v.tolist()
 
@@ -342,45 +551,54 @@ class CrossValidationItem(Item):
             "params": repr(estimator.get_params()),
         }
 
-        y_array = y if isinstance(y, numpy.ndarray) else numpy.array(y)
-        y_info = None if y is None else {"hash": _hash_numpy(y_array)}
-
-        X_array = X if isinstance(X, numpy.ndarray) else numpy.array(X)
-        X_info = {
-            "nb_rows": X_array.shape[0],
-            "nb_cols": X_array.shape[1],
-            "hash": _hash_numpy(X_array),
-        }
-
-        # Keep plot itself as well as bytes so we can cache it
-        plot = plot_cross_validation(cv_results_serialized)
-        plot_bytes = plotly.io.to_json(plot, engine="json").encode("utf-8")
+        X_info, y_info = cls.describe_data(X, y) if data_info is None else data_info
 
-        instance = cls(
+        # The plot is not built here, but derived from the results when requested
+        return cls(
             cv_results_serialized=cv_results_serialized,
             estimator_info=estimator_info,
             X_info=X_info,
             y_info=y_info,
-            plot_bytes=plot_bytes,
+            cv_indices_spec=cv_indices_spec,
+            cv_indices_npy=cv_indices_npy,
         )
 
-        # Cache plot
-        instance.plot = plot
+    @cached_property
+    def plot(self) -> plotly.graph_objects.Figure:
+        """
+        A plot of the cross-validation results.
+
+        It is built from ``cv_results_serialized`` on first access, then cached.
+        """
+        if self.plot_bytes is None:
+            return plot_cross_validation(self.cv_results_serialized)
 
-        return instance
+        return figure_from_json(self.plot_bytes)
 
     @cached_property
-    def plot(self):
-        """A plot of the cross-validation results."""
-        return plotly.io.from_json(self.plot_bytes.decode("utf-8"))
+    def plot_json(self) -> bytes:
+        """The JSON representation of :attr:`plot`, built on first access."""
+        if self.plot_bytes is None:
+            return figure_to_json(self.plot)
+
+        return self.plot_bytes
 
 
 class CrossValidationAggregationItem(Item):
-    """Aggregated outputs of several cross-validation workflow runs."""
+    """
+    Aggregated outputs of several cross-validation workflow runs.
+
+    The aggregation holds the results of each run, without their indices, from
+    which its plot is built on first access. Older items hold their plot instead.
+
+    Aggregations are no longer stored by :func:`skore.cross_validate`: the UI
+    builds the latest one on read, from the versions of the cross-validation item.
+    """
 
     def __init__(
         self,
-        plot_bytes: bytes,
+        plot_bytes: bytes | None = None,
+        cv_results_summaries: list[dict] | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
@@ -389,8 +607,13 @@ class CrossValidationAggregationItem(Item):
 
         Parameters
         ----------
-        plot_bytes : bytes
+        plot_bytes : bytes, optional
             A plot of the aggregated cross-validation results, in the form of bytes.
+            Recent items have none: their plot is built from
+            ``cv_results_summaries``.
+        cv_results_summaries : list[dict], optional
+            The serialized results of each run, from the oldest to the current,
+            without their indices.
         created_at : str
             The creation timestamp in ISO format.
         updated_at : str
@@ -399,6 +622,7 @@ class CrossValidationAggregationItem(Item):
         super().__init__(created_at, updated_at)
 
         self.plot_bytes = plot_bytes
+        self.cv_results_summaries = cv_results_summaries
 
     @classmethod
     def factory(
@@ -418,23 +642,53 @@ class CrossValidationAggregationItem(Item):
         CrossValidationAggregationItem
             A new CrossValidationAggregationItem instance.
         """
-        plot = plot_cross_validation_aggregation(cv_results_items_versions)
-
-        plot_bytes = plotly.io.to_json(plot, engine="json").encode("utf-8")
-
-        instance = cls(
-            plot_bytes=plot_bytes,
+        return cls.factory_cv_results(
+            [item.cv_results_serialized for item in cv_results_items_versions]
         )
 
-        # Cache plot
-        instance.plot = plot
+    @classmethod
+    def factory_cv_results(
+        cls,
+        cv_results_serialized_versions: list[dict],
+    ) -> CrossValidationAggregationItem:
+        """
+        Create a new CrossValidationAggregationItem instance from serialized results.
+
+        Parameters
+        ----------
+        cv_results_serialized_versions : list[dict]
+            The ``cv_results_serialized`` of the cross_validate items to be
+            aggregated, which can thus be read without constructing the items.
 
-        return instance
+        Returns
+        -------
+        CrossValidationAggregationItem
+            A new CrossValidationAggregationItem instance.
+        """
+        # The plot is not built here, but derived from the results when requested
+        return cls(
+            cv_results_summaries=[
+                {k: v for k, v in cv_results_serialized.items() if k != "indices"}
+                for cv_results_serialized in cv_results_serialized_versions
+            ]
+        )
 
     @cached_property
-    def plot(self):
+    def plot(self) -> plotly.graph_objects.Figure:
         """An aggregation plot of all the cross-validation results.
 
-        Results are shown from the oldest to the current.
+        Results are shown from the oldest to the current. The plot is built from
+        ``cv_results_summaries`` on first access, then cached.
         """
-        return plotly.io.from_json(self.plot_bytes.decode("utf-8"))
+        if self.plot_bytes is None:
+            return plot_cross_validation_aggregation(self.cv_results_summaries)
+
+        return figure_from_json(self.plot_bytes)
+
+    @cached_property
+    def plot_json(self) -> bytes:
+        """The JSON representation of :attr:`plot`, built on first access."""
+        if self.plot_bytes is None:
+            return figure_to_json(self.plot)
+
+        return self.plot_bytes
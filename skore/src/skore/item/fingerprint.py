@@ -0,0 +1,285 @@
+"""Fingerprints of datasets, e.g. the data and target of a cross-validation.
+
+A fingerprint is the SHA-256 digest of the shape, types and values of a dataset. It
+is computed in chunks of at most ``CHUNK_SIZE`` bytes, without converting the
+dataset: dataframes are hashed column by column, sparse matrices from their stored
+elements, and non-contiguous arrays one block of rows at a time. The peak memory
+needed is thus bounded, whatever the size of the dataset.
+
+Large datasets can be fingerprinted from a uniform random sample of their rows,
+which is much faster but only detects changes to the sampled rows.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import weakref
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+CHUNK_SIZE = 2**22
+
+# The fingerprints of the memoized datasets, by identity and version
+_memo: dict[tuple[int, Hashable], tuple[weakref.ref, str]] = {}
+_memo_lock = threading.Lock()
+
+
+def _sample_positions(n_rows: int, sample_size: int | None):
+    """Return sorted random rows if there are more than ``sample_size``, or None."""
+    import numpy
+
+    if sample_size is None or n_rows <= sample_size:
+        return None
+
+    # Seeded, so that the fingerprint of a dataset is deterministic
+    rng = numpy.random.default_rng(0)
+    return numpy.sort(rng.choice(n_rows, sample_size, replace=False))
+
+
+def _row_blocks(n_rows: int, row_size: int, positions) -> list:
+    """Split the rows, or the sampled ``positions``, in blocks of ``CHUNK_SIZE``."""
+    rows_per_block = max(1, CHUNK_SIZE // max(1, row_size))
+
+    if positions is None:
+        return [
+            slice(start, min(start + rows_per_block, n_rows))
+            for start in range(0, n_rows, rows_per_block)
+        ]
+
+    return [
+        positions[start : start + rows_per_block]
+        for start in range(0, len(positions), rows_per_block)
+    ]
+
+
+def _object_hashes(values: Any, hash_function) -> numpy.ndarray:
+    """Hash Python objects, which have no stable bytes, with pandas if possible."""
+    import numpy
+
+    try:
+        hashes = hash_function(values)
+    except (ImportError, TypeError):
+        # e.g. lists, which pandas cannot hash
+        return numpy.frombuffer(repr(values.tolist()).encode(), dtype=numpy.uint8)
+
+    if values.dtype != object:
+        return hashes
+
+    # pandas hashes objects by their string, e.g. 1 and "1" alike: types are hashed
+    # too, for the objects of different types to have different fingerprints
+    types = numpy.array([type(value).__qualname__ for value in values], dtype=object)
+
+    return numpy.concatenate([hashes, _hash_array(types)])
+
+
+def _hash_array(values: numpy.ndarray) -> numpy.ndarray:
+    import pandas.util
+
+    return pandas.util.hash_array(values)
+
+
+def _update_values(digest, values: numpy.ndarray):
+    """Hash the values of a block of an array, in row-major order."""
+    import numpy
+
+    if values.dtype.hasobject:
+        values = _object_hashes(values.ravel(order="C"), _hash_array)
+
+    if not values.flags.c_contiguous:
+        values = numpy.ascontiguousarray(values)
+
+    digest.update(memoryview(values.reshape(-1).view(numpy.uint8)))
+
+
+def _update_array(digest, array: numpy.ndarray, positions):
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+
+    if array.ndim == 0:
+        _update_values(digest, array.reshape(1))
+        return
+
+    # A contiguous array is hashed through views, without any copy; the others are
+    # copied one block of rows at a time
+    if positions is None and array.flags.c_contiguous:
+        flat = array.reshape(-1)
+        step = max(1, CHUNK_SIZE // array.itemsize)
+
+        for start in range(0, flat.size, step):
+            _update_values(digest, flat[start : start + step])
+
+        return
+
+    row_size = array.itemsize * (array.size // max(1, len(array)))
+
+    for rows in _row_blocks(len(array), row_size, positions):
+        _update_values(digest, array[rows])
+
+
+def _update_series(digest, series: pandas.Series, positions):
+    import pandas.util
+
+    digest.update(f"{series.name!r}{series.dtype}".encode())
+    numeric = series.dtype.kind in "biufcmM" and not hasattr(series.dtype, "na_value")
+
+    def hash_series(block):
+        return pandas.util.hash_pandas_object(block, index=False).to_numpy()
+
+    for rows in _row_blocks(len(series), 8, positions):
+        block = series.iloc[rows]
+
+        # The values of NumPy dtypes are hashed without copy, the others by pandas,
+        # e.g. strings, categories or nullable integers
+        _update_values(
+            digest, block.to_numpy() if numeric else _object_hashes(block, hash_series)
+        )
+
+
+def _update_dataframe(digest, dataframe: pandas.DataFrame, positions):
+    digest.update(f"{dataframe.shape}".encode())
+
+    # Column by column, to not convert a dataframe of mixed types to one array
+    for _, column in dataframe.items():
+        _update_series(digest, column, positions)
+
+
+def _update_sparse_matrix(digest, matrix, positions):
+    digest.update(f"{matrix.format}{matrix.dtype.str}{matrix.shape}".encode())
+
+    if positions is not None:
+        matrix = matrix.tocsr()[positions]
+
+    if matrix.format == "coo":
+        arrays = (matrix.row, matrix.col, matrix.data)
+    else:
+        if matrix.format not in ("csr", "csc", "bsr"):
+            matrix = matrix.tocsr()
+
+        arrays = (matrix.indptr, matrix.indices, matrix.data)
+
+    for array in arrays:
+        _update_array(digest, array, None)
+
+
+def _fingerprint(data: Any, sample_size: int | None) -> str:
+    import numpy
+
+    # Datasets of libraries which are not imported cannot be passed
+    pandas = sys.modules.get("pandas")
+    sparse = sys.modules.get("scipy.sparse")
+    digest = hashlib.sha256()
+
+    if pandas is not None and isinstance(data, pandas.DataFrame):
+        positions = _sample_positions(len(data), sample_size)
+        _update_dataframe(digest, data, positions)
+    elif pandas is not None and isinstance(data, pandas.Series):
+        positions = _sample_positions(len(data), sample_size)
+        _update_series(digest, data, positions)
+    elif sparse is not None and sparse.issparse(data):
+        positions = _sample_positions(data.shape[0], sample_size)
+        _update_sparse_matrix(digest, data, positions)
+    else:
+        array = numpy.asarray(data)
+        positions = _sample_positions(len(array) if array.ndim else 1, sample_size)
+        _update_array(digest, array, positions)
+
+    # Fingerprints of samples differ from those of whole datasets
+    if positions is not None:
+        digest.update(f"sample_size={len(positions)}".encode())
+
+    return digest.hexdigest()
+
+
+def _immutable_version(data: Any) -> Hashable | None:
+    """Return the version of a read-only array, which cannot change, or None.
+
+    Only arrays over a read-only buffer cannot change: arrays which own their data
+    can be made writeable again, even if they are read-only.
+    """
+    import numpy
+
+    if not isinstance(data, numpy.ndarray):
+        return None
+
+    base = data
+
+    while isinstance(base, numpy.ndarray):
+        if base.flags.writeable:
+            return None
+
+        base = base.base
+
+    if base is None:
+        return None
+
+    # e.g. the bytes from which the array was read, or a read-only memory mapping
+    try:
+        if not memoryview(base).readonly:
+            return None
+    except TypeError:
+        return None
+
+    return ("read-only", data.dtype.str, data.shape, data.strides)
+
+
+def fingerprint(
+    data: Any, sample_size: int | None = None, version: Hashable | None = None
+) -> str:
+    """Compute the fingerprint of a dataset.
+
+    Parameters
+    ----------
+    data : array-like
+        The dataset: a NumPy array, a pandas DataFrame or Series, a SciPy sparse
+        matrix, or anything convertible to a NumPy array, e.g. nested lists.
+    sample_size : int, optional
+        The number of rows from which the fingerprint is computed, if the dataset
+        has more, by default None, i.e. all the rows.
+    version : Hashable, optional
+        The version of the dataset, e.g. a counter incremented whenever it is
+        modified in place. The fingerprint is memoized for the object and its
+        version, as long as the object is alive. The fingerprints of arrays over
+        read-only buffers, e.g. bytes or read-only memory mappings, are always
+        memoized, as they cannot be modified; other arrays need a version, even
+        if read-only, as they can be made writeable again.
+
+    Returns
+    -------
+    str
+        The hexadecimal fingerprint of the dataset.
+    """
+    if version is None:
+        version = _immutable_version(data)
+
+    if version is None:
+        return _fingerprint(data, sample_size)
+
+    key = (id(data), (version, sample_size))
+
+    with _memo_lock:
+        ref, value = _memo.get(key, (None, None))
+
+    if ref is not None and ref() is data:
+        return value
+
+    value = _fingerprint(data, sample_size)
+
+    def forget(_, key=key):
+        with _memo_lock:
+            _memo.pop(key, None)
+
+    try:
+        ref = weakref.ref(data, forget)
+    except TypeError:
+        # Objects which are not weakly referenceable, e.g. lists, are not memoized
+        return value
+
+    with _memo_lock:
+        _memo[key] = (ref, value)
+
+    return value
@@ -37,8 +37,16 @@ class Item(ABC):
         The creation timestamp of the item.
     updated_at : str
         The last update timestamp of the item.
+    __blobs__ : tuple[str, ...]
+        The names of the parameters holding potentially large binary payloads,
+        either bytes-like objects or sequences of bytes-like objects.
+        Repositories can store them apart from the other parameters, and give them
+        back as any bytes-like object, e.g. a ``memoryview`` over a memory mapping,
+        or as a sequence of them which loads each one on access.
     """
 
+    __blobs__: tuple[str, ...] = ()
+
     def __init__(
         self,
         created_at: Optional[str] = None,
@@ -6,23 +6,114 @@ storing, retrieving, and deleting items in a storage system.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Iterator, Sequence
+from contextlib import suppress
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from skore.item.item import Item
     from skore.persistence.abstract_storage import AbstractStorage
 
 
-from skore.item.cross_validation_item import (
-    CrossValidationAggregationItem,
-    CrossValidationItem,
-)
-from skore.item.media_item import MediaItem
-from skore.item.numpy_array_item import NumpyArrayItem
-from skore.item.pandas_dataframe_item import PandasDataFrameItem
-from skore.item.pandas_series_item import PandasSeriesItem
-from skore.item.primitive_item import PrimitiveItem
-from skore.item.sklearn_base_estimator_item import SklearnBaseEstimatorItem
+from skore.instrumentation import measure, payload_size
+from skore.item.media_chunks import FileChunks
+from skore.item.registry import registry
+from skore.persistence.abstract_storage import StorageIsReadOnly
+
+
+class BlobSequence(Sequence):
+    """A sequence of blobs, each loaded from the blob storage on access.
+
+    Parameters
+    ----------
+    storage : AbstractStorage
+        The blob storage.
+    digests : list[str]
+        The keys of the blobs in the storage.
+    """
+
+    def __init__(self, storage: AbstractStorage, digests: list[str]):
+        self.storage = storage
+        self.digests = digests
+
+    def __len__(self) -> int:
+        """Return the number of blobs."""
+        return len(self.digests)
+
+    def __getitem__(self, index):
+        """Load the blob at ``index``."""
+        if isinstance(index, slice):
+            return BlobSequence(self.storage, self.digests[index])
+
+        return self.storage[self.digests[index]]
+
+
+class StoredItem:
+    """A version of an item as stored, whose blobs are only loaded on request.
+
+    Parameters
+    ----------
+    value : dict
+        The stored version of the item.
+    blob_storage : AbstractStorage, optional
+        The blob storage, in which the blobs of the item may be stored.
+    """
+
+    def __init__(self, value: dict, blob_storage: AbstractStorage | None):
+        self.value = value
+        self.blob_storage = blob_storage
+
+    @property
+    def item_class(self) -> type[Item]:
+        """The class of the item."""
+        return ItemRepository.ITEM_CLASS_NAME_TO_ITEM_CLASS[
+            self.value["item_class_name"]
+        ]
+
+    @property
+    def created_at(self) -> str:
+        """The creation timestamp of the item."""
+        return self.value["item"]["created_at"]
+
+    @property
+    def updated_at(self) -> str:
+        """The last update timestamp of the item."""
+        return self.value["item"]["updated_at"]
+
+    def get_parameter(self, name: str) -> Any:
+        """Get a parameter of the item, loading it if it is a blob stored apart."""
+        digest = self.value.get("blobs", {}).get(name)
+
+        if digest is None:
+            return self.value["item"][name]
+        if isinstance(digest, list):
+            return BlobSequence(self.blob_storage, digest)
+
+        return self.blob_storage[digest]
+
+    def get_parameter_nbytes(self, name: str) -> int | None:
+        """Get the size of a bytes-like parameter, without loading it if possible.
+
+        Returns None if the parameter is None.
+        """
+        with suppress(KeyError):
+            return self.value["blob_sizes"][name]
+
+        parameter = self.get_parameter(name)
+
+        return None if parameter is None else memoryview(parameter).nbytes
+
+    def construct(self) -> Item:
+        """Construct the item, loading its blobs."""
+        item = self.value["item"]
+
+        if "blobs" in self.value:
+            item = item | {
+                name: self.get_parameter(name) for name in self.value["blobs"]
+            }
+
+        return self.item_class(**item)
 
 
 class ItemRepository:
@@ -33,20 +124,30 @@ class ItemRepository:
 
     Additionally, it keeps a record of all previously inserted items, by treating the
     storage as a map from keys to *lists of* values.
+
+    Large binary parameters of items, listed in their ``__blobs__``, can be stored
+    apart in a blob storage, under the SHA-256 of their content. Blobs are therefore
+    deduplicated, and never modified once written: any buffer given back by the blob
+    storage, such as a memory mapping, remains valid for as long as it is referenced.
+
+    As blobs can be shared by several items, they are not deleted with the items,
+    whether deleted or overwritten: blobs which are no longer referenced by any item
+    are only deleted by :meth:`vacuum`.
     """
 
-    ITEM_CLASS_NAME_TO_ITEM_CLASS = {
-        "MediaItem": MediaItem,
-        "NumpyArrayItem": NumpyArrayItem,
-        "PandasDataFrameItem": PandasDataFrameItem,
-        "PandasSeriesItem": PandasSeriesItem,
-        "PrimitiveItem": PrimitiveItem,
-        "CrossValidationItem": CrossValidationItem,
-        "CrossValidationAggregationItem": CrossValidationAggregationItem,
-        "SklearnBaseEstimatorItem": SklearnBaseEstimatorItem,
-    }
+    # Smaller blobs are kept inline, with the other parameters of their item;
+    # diskcache only stores larger values in their own file, which can be mapped.
+    # Sequences of blobs are always stored apart, to be loaded one at a time.
+    BLOB_MIN_SIZE = 2**15
+
+    # The registered item classes, by name; see :class:`skore.item.ItemRegistry`
+    ITEM_CLASS_NAME_TO_ITEM_CLASS = registry.item_classes
 
-    def __init__(self, storage: AbstractStorage):
+    def __init__(
+        self,
+        storage: AbstractStorage,
+        blob_storage: AbstractStorage | None = None,
+    ):
         """
         Initialize the ItemRepository with a storage system.
 
@@ -54,23 +155,69 @@ class ItemRepository:
         ----------
         storage : AbstractStorage
             The storage system to be used by the repository.
+        blob_storage : AbstractStorage, optional
+            The storage system to be used for large binary parameters of items.
+            If None, they are stored with the other parameters.
         """
         self.storage = storage
-
-    @staticmethod
-    def __deconstruct_item(item: Item) -> dict:
-        return {
+        self.blob_storage = blob_storage
+
+    def __deconstruct_item(self, item: Item) -> dict:
+        parameters = dict(item.__parameters__)
+        blobs = {}
+        blob_sizes = {}
+
+        for name in item.__blobs__:
+            blob = parameters[name]
+
+            if blob is None:
+                continue
+
+            if isinstance(blob, (bytes, bytearray, memoryview)):
+                if (
+                    self.blob_storage is not None
+                    and memoryview(blob).nbytes >= self.BLOB_MIN_SIZE
+                ):
+                    blobs[name] = self.__put_blob(blob)
+                    blob_sizes[name] = memoryview(blob).nbytes
+                    del parameters[name]
+            elif self.blob_storage is not None:
+                # Sequences can be lazy, each blob is put as soon as it is read
+                blobs[name] = [self.__put_blob(b) for b in blob]
+                del parameters[name]
+            elif isinstance(blob, (FileChunks, Iterator)):
+                # The whole file would be read in memory, to be stored at once
+                raise ValueError(
+                    f"Files stored in chunks, as '{name}' of {type(item).__name__}, "
+                    "require a blob storage."
+                )
+            else:
+                parameters[name] = [bytes(b) for b in blob]
+
+        value = {
             "item_class_name": item.__class__.__name__,
-            "item": item.__parameters__,
+            "item": parameters,
         }
 
-    @staticmethod
-    def __construct_item(value) -> Item:
-        item_class_name = value["item_class_name"]
-        item_class = ItemRepository.ITEM_CLASS_NAME_TO_ITEM_CLASS[item_class_name]
-        item = value["item"]
+        if blobs:
+            value["blobs"] = blobs
+        if blob_sizes:
+            # So that the size of a blob is known without loading it
+            value["blob_sizes"] = blob_sizes
+
+        return value
+
+    def __construct_item(self, value) -> Item:
+        return StoredItem(value, self.blob_storage).construct()
+
+    def __put_blob(self, blob) -> str:
+        digest = sha256(blob).hexdigest()
+
+        if digest not in self.blob_storage:
+            # Storages only store plain bytes as raw binary
+            self.blob_storage[digest] = bytes(blob)
 
-        return item_class(**item)
+        return digest
 
     def get_item(self, key) -> Item:
         """
@@ -89,7 +236,15 @@ class ItemRepository:
         Item
             The retrieved item.
         """
-        return ItemRepository.__construct_item(self.storage[key][-1])
+        with measure("get_item", key=key) as event:
+            value = self.__get(key)[-1]
+            item = self.__construct_item(value)
+
+            if event is not None:
+                event.item_type = value["item_class_name"]
+                event.nbytes = payload_size(value)
+
+            return item
 
     def get_item_versions(self, key) -> list[Item]:
         """
@@ -107,7 +262,123 @@ class ItemRepository:
         list[Item]
             The retrieved list of items.
         """
-        return [ItemRepository.__construct_item(value) for value in self.storage[key]]
+        with measure("get_item_versions", key=key) as event:
+            values = self.__get(key)
+            items = [self.__construct_item(value) for value in values]
+
+            if event is not None:
+                event.item_type = values[-1]["item_class_name"]
+                event.nbytes = payload_size(values)
+
+            return items
+
+    def get_stored_item_versions(self, key) -> list[StoredItem]:
+        """
+        Get all the versions of an item associated with `key`, as stored.
+
+        The items are not constructed, and their blobs are only loaded on request,
+        e.g. to describe large items without loading them.
+
+        Parameters
+        ----------
+        key : Any
+            The key used to identify the item in storage.
+
+        Returns
+        -------
+        list[StoredItem]
+            The stored versions, from oldest to newest.
+        """
+        with measure("get_stored_item_versions", key=key) as event:
+            values = self.__get(key)
+
+            if event is not None:
+                event.item_type = values[-1]["item_class_name"]
+
+            return [StoredItem(value, self.blob_storage) for value in values]
+
+    def get_item_summary(self, key) -> dict | None:
+        """
+        Get the summary statistics of the latest item associated with `key`.
+
+        The item is not constructed, and its blobs are not loaded.
+
+        Parameters
+        ----------
+        key : Any
+            The key used to identify the item in storage.
+
+        Returns
+        -------
+        dict | None
+            The summary statistics, or None if the item has none.
+        """
+        with measure("get_item_summary", key=key) as event:
+            value = self.__get(key)[-1]
+
+            if event is not None:
+                event.item_type = value["item_class_name"]
+
+            return value["item"].get("summary")
+
+    def get_derived(self, name: str, fingerprint: str, compute: Callable[[], Any]):
+        """
+        Get a value derived from some content, computing and storing it if needed.
+
+        Derived values, such as representations of items, are costly to compute
+        but never change for a given content: they are stored in the blob storage
+        under ``name`` and ``fingerprint``, the digest of the content. A value which
+        is not stored is always computed, and then stored if the blob storage is
+        present and writable; otherwise it is computed again on each request.
+
+        Parameters
+        ----------
+        name : str
+            The name of the derived value, e.g. ``"estimator_html_repr"``.
+        fingerprint : str
+            The digest of the content the value is derived from.
+        compute : Callable[[], Any]
+            The function computing the value.
+
+        Returns
+        -------
+        Any
+            The derived value.
+        """
+        if self.blob_storage is None:
+            return compute()
+
+        # Blobs are stored under their hexdigest, derived values never collide
+        key = f"{name}:{fingerprint}"
+
+        with suppress(KeyError):
+            return self.blob_storage[key]
+
+        value = compute()
+
+        with suppress(StorageIsReadOnly):
+            self.blob_storage[key] = value
+
+        return value
+
+    def delete_derived(self, name: str, fingerprint: str):
+        """
+        Delete a value derived from some content, if it is stored.
+
+        Nothing is deleted if the blob storage is absent or read-only.
+
+        Parameters
+        ----------
+        name : str
+            The name of the derived value, e.g. ``"estimator_html_repr"``.
+        fingerprint : str
+            The digest of the content the value is derived from.
+        """
+        if self.blob_storage is None:
+            return
+
+        with suppress(KeyError, StorageIsReadOnly):
+            del self.blob_storage[f"{name}:{fingerprint}"]
 
     def put_item(self, key, item: Item) -> None:
         """
@@ -122,20 +393,43 @@ class ItemRepository:
         item : Item
             The item to be stored.
         """
-        _item = ItemRepository.__deconstruct_item(item)
+        with measure("put_item", key=key) as event:
+            _item = self.__deconstruct_item(item)
+
+            if event is not None:
+                event.item_type = _item["item_class_name"]
+                event.nbytes = payload_size(_item)
+
+            if key in self.storage:
+                items = self.__get(key)
+                _item["item"]["created_at"] = items[0]["item"]["created_at"]
 
-        if key in self.storage:
-            items = self.storage[key]
-            _item["item"]["created_at"] = items[0]["item"]["created_at"]
+                self.__set(key, items + [_item])
+            else:
+                self.__set(key, [_item])
 
-            self.storage[key] = items + [_item]
-        else:
-            self.storage[key] = [_item]
+    def __get(self, key) -> list[dict]:
+        with measure("storage.get", key=key) as event:
+            value = self.storage[key]
+
+            if event is not None:
+                event.nbytes = payload_size(value)
+
+            return value
+
+    def __set(self, key, value: list[dict]):
+        with measure("storage.set", key=key) as event:
+            if event is not None:
+                event.nbytes = payload_size(value)
+
+            self.storage[key] = value
 
     def delete_item(self, key):
         """
         Delete an item from storage.
 
+        Its blobs are kept in the blob storage, until deleted by :meth:`vacuum`.
+
         Parameters
         ----------
         key : Any
@@ -143,6 +437,51 @@ class ItemRepository:
         """
         del self.storage[key]
 
+    def vacuum(self, derived: bool = False) -> int:
+        """
+        Delete the blobs which are not referenced by any version of any item.
+
+        Blobs are looked up in all the items, then deleted: no item should be put
+        concurrently, e.g. by another process, as its blobs could be deleted.
+
+        Parameters
+        ----------
+        derived : bool, optional
+            Whether to delete the derived values too, see :meth:`get_derived`, by
+            default False. They are then computed again when next requested.
+
+        Returns
+        -------
+        int
+            The number of deleted blobs.
+
+        Raises
+        ------
+        StorageIsReadOnly
+            If there are blobs to delete from a read-only blob storage.
+        """
+        if self.blob_storage is None:
+            return 0
+
+        referenced = set()
+
+        for key in self.storage:
+            for version in self.__get(key):
+                for digest in version.get("blobs", {}).values():
+                    referenced.update(digest if isinstance(digest, list) else [digest])
+
+        # Derived values are stored under their name and fingerprint, never a digest
+        unreferenced = [
+            key
+            for key in self.blob_storage
+            if (derived if ":" in key else key not in referenced)
+        ]
+
+        for key in unreferenced:
+            del self.blob_storage[key]
+
+        return len(unreferenced)
+
     def keys(self) -> list[str]:
         """
         Get all keys of items stored in the repository.
@@ -0,0 +1,99 @@
+"""Chunks of media, to store and read back media larger than memory."""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from math import ceil
+from typing import BinaryIO, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class FileChunks(Sequence):
+    """The chunks of a binary file, or of a seekable binary file object.
+
+    Chunks are read on access: iterating over them reads the file chunk by chunk, so
+    that files larger than memory can be stored.
+
+    Parameters
+    ----------
+    file : str | os.PathLike | BinaryIO
+        The path of the file, or the seekable binary file object, positioned at the
+        start of its content.
+    size : int
+        The number of bytes to read from the start of the content.
+    chunk_size : int
+        The size of the chunks, except the last one which can be smaller.
+    """
+
+    def __init__(self, file: str | os.PathLike | BinaryIO, size: int, chunk_size: int):
+        self.file = file
+        self.start = 0 if isinstance(file, (str, os.PathLike)) else file.tell()
+        self.size = size
+        self.chunk_size = chunk_size
+
+    def __len__(self) -> int:
+        """Return the number of chunks."""
+        return ceil(self.size / self.chunk_size)
+
+    def __getitem__(self, index: int) -> bytes:
+        """Read the chunk at ``index``."""
+        if not -len(self) <= index < len(self):
+            raise IndexError("Chunk index out of range.")
+
+        offset = (index % len(self)) * self.chunk_size
+        length = min(self.chunk_size, self.size - offset)
+
+        if isinstance(self.file, (str, os.PathLike)):
+            with open(self.file, "rb") as file:
+                file.seek(offset)
+                return file.read(length)
+
+        self.file.seek(self.start + offset)
+        return self.file.read(length)
+
+
+def read_chunks(file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Read a binary file object chunk by chunk, until its end.
+
+    Contrary to :class:`FileChunks`, the file object does not need to be seekable,
+    e.g. a pipe, but the chunks can only be iterated over once.
+    """
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+class ChunksReader(io.RawIOBase):
+    """A read-only binary stream over chunks, which are only loaded when read.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes-like]
+        The chunks, e.g. a sequence of blobs loaded from the storage on access.
+    """
+
+    def __init__(self, chunks: Iterable[Buffer]):
+        self.chunks = iter(chunks)
+        self.chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        """Return True, the stream can be read."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read bytes into ``buffer``, returning their number, or 0 at the end."""
+        while not self.chunk:
+            chunk = next(self.chunks, None)
+
+            if chunk is None:
+                return 0
+
+            self.chunk = memoryview(chunk).cast("B")
+
+        size = min(len(buffer), len(self.chunk))
+        memoryview(buffer).cast("B")[:size] = self.chunk[:size]
+        self.chunk = self.chunk[size:]
+
+        return size
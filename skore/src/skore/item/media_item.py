@@ -5,17 +5,27 @@ This module defines the MediaItem class, which represents media items.
 
 from __future__ import annotations
 
+import io
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from io import BytesIO
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Union
 
 from skore.item.item import Item, ItemTypeError
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
     from altair.vegalite.v5.schema.core import TopLevelSpec as Altair
     from matplotlib.figure import Figure as Matplotlib
     from PIL.Image import Image as Pillow
     from plotly.basedatatypes import BaseFigure as Plotly
 
+    Buffer = Union[bytes, bytearray, memoryview]
+    Size = tuple[int, int]
+
 
 def lazy_is_instance(object: Any, cls_fullname: str) -> bool:
     """Return True if object is an instance of a class named `cls_fullname`."""
@@ -24,18 +34,136 @@ def lazy_is_instance(object: Any, cls_fullname: str) -> bool:
     }
 
 
+@dataclass(frozen=True)
+class MediaPolicy:
+    """
+    How Matplotlib and Plotly figures, and Pillow images, are converted to media.
+
+    Attributes
+    ----------
+    figure_format : {"svg", "png"}, optional
+        The format of Matplotlib figures, by default "svg". Figures with many
+        elements, e.g. scatter plots of many points, are much smaller and faster to
+        render once rasterized to PNG.
+    dpi : float, optional
+        The resolution of figures rasterized to PNG, by default the resolution of
+        the figure.
+    max_size : tuple[int, int], optional
+        The maximal width and height, in pixels, of figures rasterized to PNG and of
+        images, by default unlimited. Larger media are downscaled, keeping their
+        aspect ratio.
+    thumbnail_size : tuple[int, int], optional
+        The maximal width and height, in pixels, of the PNG thumbnail stored
+        alongside the media, by default 256x256. No thumbnail is stored if None,
+        nor if the media is already that small.
+    svg_thumbnail : bool, optional
+        Whether to store a thumbnail of Matplotlib figures in SVG, by default False.
+        The figure is then rendered twice, once as SVG and once rasterized.
+    plotly_bdata : bool, optional
+        Whether to encode the numeric arrays of Plotly figures as base64 typed
+        arrays, rather than as text, by default True. Large traces are then much
+        smaller and faster to encode and decode; see
+        :func:`skore.item.plotly_encoding.figure_to_json`.
+    plotly_float_precision : int, optional
+        The number of decimals to which the floats of the traces of Plotly figures
+        are rounded, by default None, i.e. not rounded.
+    """
+
+    figure_format: Literal["svg", "png"] = "svg"
+    dpi: float | None = None
+    max_size: Size | None = None
+    thumbnail_size: Size | None = (256, 256)
+    svg_thumbnail: bool = False
+    plotly_bdata: bool = True
+    plotly_float_precision: int | None = None
+
+    def __post_init__(self):
+        """Check the figure format."""
+        if self.figure_format not in ("svg", "png"):
+            raise ValueError(
+                f"Figure format must be 'svg' or 'png'; got '{self.figure_format}'."
+            )
+
+
+# The policy of the current context, if any
+_media_policy: ContextVar[MediaPolicy | None] = ContextVar("media_policy", default=None)
+
+
+@contextmanager
+def media_policy(policy: MediaPolicy):
+    """
+    Use ``policy`` to convert media in the current context, e.g. the current thread.
+
+    Parameters
+    ----------
+    policy : MediaPolicy
+        The policy used by the factories of :class:`MediaItem` when none is given.
+    """
+    token = _media_policy.set(policy)
+
+    try:
+        yield policy
+    finally:
+        _media_policy.reset(token)
+
+
+def _fit(size: tuple[float, float], max_size: Size) -> float:
+    """Return the scale at which ``size`` fits in ``max_size``, at most 1."""
+    return min(1.0, max_size[0] / size[0], max_size[1] / size[1])
+
+
+def _pillow_to_png(image: Pillow, max_size: Size | None = None) -> bytes:
+    if max_size is not None and _fit(image.size, max_size) < 1:
+        image = image.copy()
+        image.thumbnail(max_size)
+
+    with BytesIO() as stream:
+        try:
+            image.save(stream, format="png")
+        except OSError:
+            # Some modes, e.g. CMYK, cannot be written in PNG
+            image.convert("RGBA").save(stream, format="png")
+
+        return stream.getvalue()
+
+
+def _matplotlib_to_png(figure: Matplotlib, dpi: float, max_size: Size | None) -> bytes:
+    if max_size is not None:
+        width, height = figure.get_size_inches()
+        dpi *= _fit((width * dpi, height * dpi), max_size)
+
+    with BytesIO() as stream:
+        figure.savefig(stream, format="png", dpi=dpi)
+
+        return stream.getvalue()
+
+
 class MediaItem(Item):
     """
     A class to represent a media item.
 
     This class encapsulates various types of media along with metadata.
+
+    Matplotlib figures and Pillow images are converted according to a
+    :class:`MediaPolicy`, and come with a small PNG thumbnail, stored apart from the
+    media so that listing them does not require the full media.
+
+    Files and binary file objects larger than ``CHUNK_SIZE`` bytes are streamed to
+    the storage in chunks, and read back as a stream; see :meth:`media_stream`.
     """
 
+    __blobs__ = ("media_bytes", "thumbnail_bytes", "media_chunks")
+
+    # Files of more than ``CHUNK_SIZE`` bytes are stored in chunks of that size
+    CHUNK_SIZE = 2**22
+
     def __init__(
         self,
-        media_bytes: bytes,
+        media_bytes: bytes | None,
         media_encoding: str,
         media_type: str,
+        thumbnail_bytes: bytes | None = None,
+        media_chunks: Iterable[Buffer] | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
@@ -44,12 +172,17 @@ class MediaItem(Item):
 
         Parameters
         ----------
-        media_bytes : bytes
-            The raw bytes of the media content.
+        media_bytes : bytes | None
+            The raw bytes of the media content, unless it is stored in chunks.
         media_encoding : str
             The encoding of the media content.
         media_type : str
             The MIME type of the media content.
+        thumbnail_bytes : bytes, optional
+            The raw bytes of a small PNG preview of the media content.
+        media_chunks : Iterable[bytes-like], optional
+            The raw bytes of the media content, in consecutive chunks, for large
+            files.
         created_at : str, optional
             The creation timestamp in ISO format.
         updated_at : str, optional
@@ -60,6 +193,22 @@ class MediaItem(Item):
         self.media_bytes = media_bytes
         self.media_encoding = media_encoding
         self.media_type = media_type
+        self.thumbnail_bytes = thumbnail_bytes
+        self.media_chunks = media_chunks
+
+    def media_stream(self) -> BinaryIO:
+        """
+        Return a read-only binary stream over the media content.
+
+        The chunks of media stored in chunks are loaded one at a time, as the
+        stream is read: the media is never entirely in memory.
+        """
+        from skore.item.media_chunks import ChunksReader
+
+        if self.media_chunks is None:
+            return BytesIO(self.media_bytes)
+
+        return io.BufferedReader(ChunksReader(self.media_chunks))
 
     @classmethod
     def factory(cls, media, *args, **kwargs):
@@ -96,6 +245,10 @@ class MediaItem(Item):
             return cls.factory_pillow(media, *args, **kwargs)
         if lazy_is_instance(media, "plotly.basedatatypes.BaseFigure"):
             return cls.factory_plotly(media, *args, **kwargs)
+        if lazy_is_instance(media, "pathlib.PurePath") or lazy_is_instance(
+            media, "_io._IOBase"
+        ):
+            return cls.factory_file(media, *args, **kwargs)
 
         raise ItemTypeError(f"Type '{media.__class__}' is not supported.")
 
@@ -129,6 +282,86 @@ class MediaItem(Item):
             media_type=media_type,
         )
 
+    @classmethod
+    def factory_file(
+        cls,
+        media: str | os.PathLike | BinaryIO,
+        media_type: str | None = None,
+        media_encoding: str = "utf-8",
+    ) -> MediaItem:
+        """
+        Create a new MediaItem instance from a file, or a binary file object.
+
+        Parameters
+        ----------
+        media : str | os.PathLike | BinaryIO
+            The path of the file, or the binary file object, which is read from its
+            current position to its end.
+        media_type : str, optional
+            The MIME type of the media content, by default guessed from the
+            extension of the file, or "application/octet-stream".
+        media_encoding : str, optional
+            The encoding of the media content, by default "utf-8".
+
+        Returns
+        -------
+        MediaItem
+            A new MediaItem instance.
+
+        Notes
+        -----
+        Files of more than ``CHUNK_SIZE`` bytes are not read at once: they are read
+        chunk by chunk when the item is stored, so that each chunk is hashed and
+        written to the storage before the next one is read. The file must therefore
+        not be modified, nor the file object closed, until the item is stored.
+        Non-seekable file objects, e.g. pipes, are always read in chunks, which can
+        only be stored once. Chunks are only stored in a blob storage, such as that
+        of projects loaded with :func:`skore.load`: storing them elsewhere raises a
+        ``ValueError``, rather than reading the whole file in memory.
+        """
+        import mimetypes
+        import os
+
+        from skore.item.media_chunks import FileChunks, read_chunks
+
+        if isinstance(media, (str, os.PathLike)):
+            media_type = media_type or mimetypes.guess_type(media)[0]
+            size = os.path.getsize(media)
+            file = None
+        elif isinstance(media, io.IOBase) and not isinstance(media, io.TextIOBase):
+            name = getattr(media, "name", None)
+            media_type = media_type or (
+                mimetypes.guess_type(name)[0] if isinstance(name, str) else None
+            )
+            file, size = media, None
+
+            if media.seekable():
+                start = media.tell()
+                size = media.seek(0, io.SEEK_END) - start
+                media.seek(start)
+        else:
+            raise ItemTypeError(f"Type '{media.__class__}' is not supported.")
+
+        media_type = media_type or "application/octet-stream"
+
+        if size is not None and size <= cls.CHUNK_SIZE:
+            if file is None:
+                with open(media, "rb") as file:
+                    return cls.factory_bytes(file.read(), media_encoding, media_type)
+
+            return cls.factory_bytes(file.read(size), media_encoding, media_type)
+
+        return cls(
+            media_bytes=None,
+            media_encoding=media_encoding,
+            media_type=media_type,
+            media_chunks=(
+                read_chunks(file, cls.CHUNK_SIZE)
+                if size is None
+                else FileChunks(media, size, cls.CHUNK_SIZE)
+            ),
+        )
+
     @classmethod
     def factory_str(cls, media: str, media_type: str = "text/markdown") -> MediaItem:
         """
@@ -178,7 +411,9 @@ class MediaItem(Item):
         )
 
     @classmethod
-    def factory_matplotlib(cls, media: Matplotlib) -> MediaItem:
+    def factory_matplotlib(
+        cls, media: Matplotlib, policy: MediaPolicy | None = None
+    ) -> MediaItem:
         """
         Create a new MediaItem instance from a Matplotlib figure.
 
@@ -186,24 +421,53 @@ class MediaItem(Item):
         ----------
         media : Matplotlib
             The Matplotlib figure to store.
+        policy : MediaPolicy, optional
+            How to convert the figure, by default the policy of the current context;
+            see :func:`media_policy`.
 
         Returns
         -------
         MediaItem
             A new MediaItem instance.
         """
-        with BytesIO() as stream:
-            media.savefig(stream, format="svg")
-            media_bytes = stream.getvalue()
+        policy = policy or _media_policy.get() or MediaPolicy()
+        dpi = policy.dpi or media.get_dpi()
 
-            return cls(
-                media_bytes=media_bytes,
-                media_encoding="utf-8",
-                media_type="image/svg+xml",
-            )
+        if policy.figure_format == "png":
+            media_bytes = _matplotlib_to_png(media, dpi, policy.max_size)
+            media_type = "image/png"
+        else:
+            with BytesIO() as stream:
+                media.savefig(stream, format="svg")
+                media_bytes = stream.getvalue()
+                media_type = "image/svg+xml"
+
+        thumbnail_bytes = None
+
+        if policy.thumbnail_size is not None and policy.figure_format == "svg":
+            if policy.svg_thumbnail:
+                thumbnail_bytes = _matplotlib_to_png(media, dpi, policy.thumbnail_size)
+        elif policy.thumbnail_size is not None:
+            size = media.get_size_inches() * dpi
+
+            if policy.max_size is not None:
+                size *= _fit(size, policy.max_size)
+
+            # Figures rasterized in fewer pixels than the thumbnail need none
+            if _fit(size, policy.thumbnail_size) < 1:
+                thumbnail_bytes = _matplotlib_to_png(media, dpi, policy.thumbnail_size)
+
+        return cls(
+            media_bytes=media_bytes,
+            media_encoding="utf-8",
+            media_type=media_type,
+            thumbnail_bytes=thumbnail_bytes,
+        )
 
     @classmethod
-    def factory_pillow(cls, media: Pillow) -> MediaItem:
+    def factory_pillow(
+        cls, media: Pillow, policy: MediaPolicy | None = None
+    ) -> MediaItem:
         """
         Create a new MediaItem instance from a Pillow image.
 
@@ -211,24 +475,40 @@ class MediaItem(Item):
         ----------
         media : Pillow
             The Pillow image to store.
+        policy : MediaPolicy, optional
+            How to convert the image, by default the policy of the current context;
+            see :func:`media_policy`.
 
         Returns
         -------
         MediaItem
             A new MediaItem instance.
         """
-        with BytesIO() as stream:
-            media.save(stream, format="png")
-            media_bytes = stream.getvalue()
+        policy = policy or _media_policy.get() or MediaPolicy()
+        media_bytes = _pillow_to_png(media, policy.max_size)
+        thumbnail_bytes = None
 
-            return cls(
-                media_bytes=media_bytes,
-                media_encoding="utf-8",
-                media_type="image/png",
-            )
+        if policy.thumbnail_size is not None:
+            size = media.size
+
+            if policy.max_size is not None:
+                size = [length * _fit(size, policy.max_size) for length in size]
+
+            # Images of fewer pixels than the thumbnail need none
+            if _fit(size, policy.thumbnail_size) < 1:
+                thumbnail_bytes = _pillow_to_png(media, policy.thumbnail_size)
+
+        return cls(
+            media_bytes=media_bytes,
+            media_encoding="utf-8",
+            media_type="image/png",
+            thumbnail_bytes=thumbnail_bytes,
+        )
 
     @classmethod
-    def factory_plotly(cls, media: Plotly) -> MediaItem:
+    def factory_plotly(
+        cls, media: Plotly, policy: MediaPolicy | None = None
+    ) -> MediaItem:
         """
         Create a new MediaItem instance from a Plotly figure.
 
@@ -236,15 +516,23 @@ class MediaItem(Item):
         ----------
         media : Plotly
             The Plotly figure to store.
+        policy : MediaPolicy, optional
+            How to encode the figure, by default the policy of the current context;
+            see :func:`media_policy`.
 
         Returns
         -------
         MediaItem
             A new MediaItem instance.
         """
-        import plotly.io
+        from skore.item.plotly_encoding import figure_to_json
 
-        media_bytes = plotly.io.to_json(media, engine="json").encode("utf-8")
+        policy = policy or _media_policy.get() or MediaPolicy()
+        media_bytes = figure_to_json(
+            media,
+            bdata=policy.plotly_bdata,
+            float_precision=policy.plotly_float_precision,
+        )
 
         return cls(
             media_bytes=media_bytes,
@@ -7,13 +7,95 @@ from __future__ import annotations
 
 from functools import cached_property
 from json import dumps, loads
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 from skore.item.item import Item, ItemTypeError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import numpy
 
+    from skore.item.chunked_array import ChunkedArray
+
+    Buffer = Union[bytes, bytearray, memoryview]
+
+
+def array_to_npy(array: numpy.ndarray) -> bytes:
+    """Encode an array in the NumPy ``.npy`` format, without pickling.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to encode, whose dtype must not contain Python objects.
+
+    Returns
+    -------
+    bytes
+        The ``.npy`` representation of the array.
+    """
+    from io import BytesIO
+
+    import numpy.lib.format
+
+    with BytesIO() as stream:
+        numpy.lib.format.write_array(stream, array, allow_pickle=False)
+        return stream.getvalue()
+
+
+def array_from_npy(buffer: Buffer, offset: int = 0) -> numpy.ndarray:
+    """Decode an array in the NumPy ``.npy`` format without copying its data.
+
+    The returned array is a read-only view over ``buffer``, which it keeps alive.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The buffer holding the ``.npy`` representation of the array.
+    offset : int, optional
+        The position of the representation in ``buffer``, by default 0.
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only view over ``buffer``.
+    """
+    from io import BytesIO
+    from math import prod
+
+    import numpy
+    import numpy.lib.format
+
+    view = memoryview(buffer).cast("B")
+
+    # Magic string (6 bytes), version (2 bytes) then header length (2 or 4 bytes)
+    major = view[offset + 6]
+    header_length_size = 2 if major == 1 else 4
+    header_length = int.from_bytes(
+        view[offset + 8 : offset + 8 + header_length_size], "little"
+    )
+    data_offset = offset + 8 + header_length_size + header_length
+
+    with BytesIO(view[offset:data_offset]) as stream:
+        version = numpy.lib.format.read_magic(stream)
+        shape, fortran_order, dtype = (
+            numpy.lib.format.read_array_header_1_0(stream)
+            if version == (1, 0)
+            else numpy.lib.format.read_array_header_2_0(stream)
+        )
+
+    array = numpy.frombuffer(view, dtype=dtype, count=prod(shape), offset=data_offset)
+    array = (
+        array.reshape(shape[::-1]).transpose()
+        if fortran_order
+        else array.reshape(shape)
+    )
+
+    # The buffer may be writable, the view never is
+    array.flags.writeable = False
+
+    return array
+
 
 class NumpyArrayItem(Item):
     """
@@ -22,9 +104,20 @@ class NumpyArrayItem(Item):
     This class encapsulates a NumPy array along with its creation and update timestamps.
     """
 
+    __blobs__ = ("array_npy", "array_chunks")
+
+    # Arrays of at least ``CHUNKED_MIN_SIZE`` bytes are stored in chunks of at most
+    # ``CHUNK_SIZE`` bytes
+    CHUNKED_MIN_SIZE = 2**26
+    CHUNK_SIZE = 2**22
+
     def __init__(
         self,
-        array_json: str,
+        array_json: str | None = None,
+        array_npy: Buffer | None = None,
+        array_chunks: Sequence[Buffer] | None = None,
+        array_chunks_spec: dict | None = None,
+        summary: dict | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
@@ -33,8 +126,18 @@ class NumpyArrayItem(Item):
 
         Parameters
         ----------
-        array_json : str
-            The JSON representation of the array.
+        array_json : str, optional
+            The JSON representation of the array, for arrays of Python objects.
+        array_npy : bytes-like, optional
+            The ``.npy`` representation of the array, for all other arrays unless
+            they are large.
+        array_chunks : Sequence[bytes-like], optional
+            The ``.npy`` representations of the chunks of the array, in C order,
+            for large arrays.
+        array_chunks_spec : dict, optional
+            The shape, dtype and chunk shape of the array, for large arrays.
+        summary : dict, optional
+            The summary statistics of the array.
         created_at : str
             The creation timestamp in ISO format.
         updated_at : str
@@ -43,19 +146,86 @@ class NumpyArrayItem(Item):
         super().__init__(created_at, updated_at)
 
         self.array_json = array_json
+        self.array_npy = array_npy
+        self.array_chunks = array_chunks
+        self.array_chunks_spec = array_chunks_spec
+        self.summary = summary
 
     @cached_property
     def array(self) -> numpy.ndarray:
         """
         The numpy array from the persistence.
 
-        Its content can differ from the original array because it has been serialized
-        using `json.dumps` function and not pickled, in order to be
-        environment-independent.
+        Arrays of Python objects are serialized using `json.dumps` function and not
+        pickled, in order to be environment-independent, so their content can differ
+        from the original array. All other arrays are restored exactly.
+        """
+        import numpy
+
+        if self.array_chunks is not None:
+            return numpy.asarray(self.chunked_array)
+        if self.array_npy is None:
+            return numpy.asarray(loads(self.array_json))
+
+        return self.array_view.copy()
+
+    @cached_property
+    def array_view(self) -> numpy.ndarray:
+        """
+        A read-only view over the buffer of the numpy array from the persistence.
+
+        Contrary to :attr:`array`, the data is not copied: the view shares the memory
+        of the buffer given by the storage. When the storage maps values into memory,
+        like read-only projects do, all the processes reading the array share the
+        same physical pages.
+
+        Any attempt to modify the view raises a ``ValueError``; use :attr:`array`
+        or ``numpy.array(view)`` to get a writable copy.
+
+        The view keeps its buffer, and therefore the memory mapping, alive for as long
+        as it is referenced, even if the project is closed or the item is deleted or
+        overwritten.
+
+        Arrays of Python objects have no buffer, and large arrays are stored in
+        chunks: their view is a read-only copy.
+        """
+        if self.array_npy is None:
+            array = self.array.view()
+            array.flags.writeable = False
+
+            return array
+
+        return array_from_npy(self.array_npy)
+
+    @cached_property
+    def chunked_array(self) -> ChunkedArray:
+        """
+        The numpy array from the persistence, loaded lazily by chunks.
+
+        Indexing it reads only the chunks which overlap the selection; see
+        :class:`skore.item.chunked_array.ChunkedArray`.
+
+        Raises
+        ------
+        ValueError
+            If the array is not stored in chunks.
         """
         import numpy
+        import numpy.lib.format
+
+        from skore.item.chunked_array import ChunkedArray
+
+        if self.array_chunks is None:
+            raise ValueError("The array is not stored in chunks.")
+
+        spec = self.array_chunks_spec
 
-        return numpy.asarray(loads(self.array_json))
+        return ChunkedArray(
+            shape=spec["shape"],
+            dtype=numpy.lib.format.descr_to_dtype(spec["dtype"]),
+            chunk_shape=spec["chunk_shape"],
+            chunks=self.array_chunks,
+        )
 
     @classmethod
     def factory(cls, array: numpy.ndarray) -> NumpyArrayItem:
@@ -71,10 +241,40 @@ class NumpyArrayItem(Item):
         -------
         NumpyArrayItem
             A new NumpyArrayItem instance.
+
+        Notes
+        -----
+        Arrays of at least ``CHUNKED_MIN_SIZE`` bytes are split in N-dimensional
+        chunks, which are read from ``array`` one at a time when the item is stored:
+        the array can be larger than memory, e.g. a ``numpy.memmap``.
         """
         import numpy
+        import numpy.lib.format
+
+        from skore.item.chunked_array import ArrayChunks, guess_chunk_shape
+        from skore.item.summary import summarize_array
 
         if not isinstance(array, numpy.ndarray):
             raise ItemTypeError(f"Type '{array.__class__}' is not supported.")
 
-        return cls(array_json=dumps(array.tolist()))
+        summary = summarize_array(array)
+
+        if array.dtype.hasobject:
+            return cls(array_json=dumps(array.tolist()), summary=summary)
+
+        if array.ndim and array.nbytes >= cls.CHUNKED_MIN_SIZE:
+            chunk_shape = guess_chunk_shape(
+                array.shape, array.dtype.itemsize, cls.CHUNK_SIZE
+            )
+
+            return cls(
+                array_chunks=ArrayChunks(array, chunk_shape),
+                array_chunks_spec={
+                    "shape": list(array.shape),
+                    "dtype": numpy.lib.format.dtype_to_descr(array.dtype),
+                    "chunk_shape": list(chunk_shape),
+                },
+                summary=summary,
+            )
+
+        return cls(array_npy=array_to_npy(array), summary=summary)
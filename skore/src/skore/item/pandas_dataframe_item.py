@@ -7,13 +7,21 @@ which represents a pandas DataFrame item.
 from __future__ import annotations
 
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 from skore.item.item import Item, ItemTypeError
+from skore.item.pandas_encoding import (
+    decode_columns,
+    decode_index,
+    encode,
+    is_json_label,
+)
 
 if TYPE_CHECKING:
     import pandas
 
+    Buffer = Union[bytes, bytearray, memoryview]
+
 
 class PandasDataFrameItem(Item):
     """
@@ -25,22 +33,37 @@ class PandasDataFrameItem(Item):
 
     ORIENT = "split"
 
+    __blobs__ = ("dataframe_buffer",)
+
     def __init__(
         self,
-        index_json: str,
-        dataframe_json: str,
+        index_json: str | None = None,
+        dataframe_json: str | None = None,
+        dataframe_spec: dict | None = None,
+        dataframe_buffer: Buffer | None = None,
+        summary: dict | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
         """
         Initialize a PandasDataFrameItem.
 
+        A dataframe is either represented in JSON, by ``index_json`` and
+        ``dataframe_json``, or by columns, by ``dataframe_spec`` and
+        ``dataframe_buffer``.
+
         Parameters
         ----------
-        index_json : str
+        index_json : str, optional
             The JSON representation of the dataframe's index.
-        dataframe_json : str
+        dataframe_json : str, optional
             The JSON representation of the dataframe, without its index.
+        dataframe_spec : dict, optional
+            The specification of the labels, index and columns of the dataframe.
+        dataframe_buffer : bytes-like, optional
+            The buffer holding the binary columns of the dataframe.
+        summary : dict, optional
+            The summary statistics of the dataframe.
         created_at : str
             The creation timestamp in ISO format.
         updated_at : str
@@ -50,16 +73,45 @@ class PandasDataFrameItem(Item):
 
         self.index_json = index_json
         self.dataframe_json = dataframe_json
+        self.dataframe_spec = dataframe_spec
+        self.dataframe_buffer = dataframe_buffer
+        self.summary = summary
 
     @cached_property
     def dataframe(self) -> pandas.DataFrame:
         """
         The pandas DataFrame from the persistence.
 
-        Its content can differ from the original dataframe because it has been
+        Columns of NumPy dtype, timezone-aware datetimes, categoricals and nullable
+        numbers and booleans are restored exactly, as is the index. The other columns
+        and labels can differ from the original dataframe because they have been
         serialized using pandas' `to_json` function and not pickled, in order to be
         environment-independent.
         """
+        if self.dataframe_spec is None:
+            return self.__dataframe_from_json()
+
+        return self.__dataframe_from_columns(copy=True)
+
+    @cached_property
+    def dataframe_view(self) -> pandas.DataFrame:
+        """
+        The pandas DataFrame from the persistence, over read-only column buffers.
+
+        Contrary to :attr:`dataframe`, the columns of NumPy dtype are not copied:
+        they are read-only views over the buffer given by the storage, see
+        :attr:`skore.item.NumpyArrayItem.array_view`. Modifying them in place
+        raises a ``ValueError``.
+
+        The other columns, as well as all the columns of dataframes represented in
+        JSON, are copies.
+        """
+        if self.dataframe_spec is None:
+            return self.__dataframe_from_json()
+
+        return self.__dataframe_from_columns(copy=False)
+
+    def __dataframe_from_json(self) -> pandas.DataFrame:
         import io
 
         import pandas
@@ -75,6 +127,23 @@ class PandasDataFrameItem(Item):
 
             return dataframe
 
+    def __dataframe_from_columns(self, copy: bool) -> pandas.DataFrame:
+        import pandas
+
+        spec = self.dataframe_spec
+        index = decode_index(spec["index"], self.dataframe_buffer, copy)
+        columns = decode_columns(spec["columns"], self.dataframe_buffer, copy)
+        dataframe = pandas.DataFrame(
+            dict(enumerate(columns)),
+            index=index,
+            copy=False,
+        )
+        dataframe.columns = pandas.Index(
+            spec["columns_labels"], name=spec["columns_name"], tupleize_cols=False
+        )
+
+        return dataframe
+
     @classmethod
     def factory(cls, dataframe: pandas.DataFrame) -> PandasDataFrameItem:
         """
@@ -92,13 +161,41 @@ class PandasDataFrameItem(Item):
 
         Notes
         -----
-        The dataframe must be JSON serializable.
+        The dataframe is stored by columns, unless one of its labels cannot be
+        represented in JSON, e.g. a tuple. It must then be JSON serializable.
         """
         import pandas
 
+        from skore.item.summary import summarize_dataframe
+
         if not isinstance(dataframe, pandas.DataFrame):
             raise ItemTypeError(f"Type '{dataframe.__class__}' is not supported.")
 
+        summary = summarize_dataframe(dataframe)
+        index = dataframe.index
+        labels = dataframe.columns.tolist()
+
+        if (
+            not isinstance(dataframe.columns, pandas.MultiIndex)
+            and all(map(is_json_label, labels))
+            and is_json_label(dataframe.columns.name)
+            and all(map(is_json_label, index.names))
+        ):
+            index_spec, specs, buffer = encode(
+                index, [dataframe.iloc[:, i] for i in range(dataframe.shape[1])]
+            )
+
+            return cls(
+                dataframe_spec={
+                    "index": index_spec,
+                    "columns": specs,
+                    "columns_labels": labels,
+                    "columns_name": dataframe.columns.name,
+                },
+                dataframe_buffer=buffer,
+                summary=summary,
+            )
+
         # Two native methods are available to serialize dataframe with multi-index,
         # while keeping the index names:
         #
@@ -127,4 +224,5 @@ class PandasDataFrameItem(Item):
         return cls(
             index_json=index.to_json(orient=PandasDataFrameItem.ORIENT),
             dataframe_json=dataframe.to_json(orient=PandasDataFrameItem.ORIENT),
+            summary=summary,
         )
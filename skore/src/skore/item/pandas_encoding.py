@@ -0,0 +1,269 @@
+"""Binary encoding of pandas indexes and columns.
+
+This module defines the encoding shared by PandasDataFrameItem and PandasSeriesItem:
+an index and columns are described by a JSON-serializable specification, and their
+values are written in a single binary buffer, in the ``.npy`` format, so that they
+can be decoded without parsing nor copying.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from json import loads
+from typing import TYPE_CHECKING, Any, Union
+
+from skore.item.numpy_array_item import array_from_npy, array_to_npy
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+    Buffer = Union[bytes, bytearray, memoryview]
+
+# Arrays are aligned in the buffer like the data of ``.npy`` files
+ALIGNMENT = 64
+
+# Labels which can be stored as is in JSON
+JSON_LABEL_TYPES = (str, int, float, bool, type(None))
+
+
+def is_json_label(label: Any) -> bool:
+    """Return True if ``label`` can be stored as is in JSON."""
+    return isinstance(label, JSON_LABEL_TYPES)
+
+
+def _masked_dtypes() -> tuple:
+    """Return the nullable dtypes of pandas, whose values are backed by a mask."""
+    import pandas
+
+    return (
+        pandas.Int8Dtype,
+        pandas.Int16Dtype,
+        pandas.Int32Dtype,
+        pandas.Int64Dtype,
+        pandas.UInt8Dtype,
+        pandas.UInt16Dtype,
+        pandas.UInt32Dtype,
+        pandas.UInt64Dtype,
+        pandas.Float32Dtype,
+        pandas.Float64Dtype,
+        pandas.BooleanDtype,
+    )
+
+
+class _Writer:
+    """Write arrays in a buffer, in the ``.npy`` format, and remember their offset."""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.offset = 0
+
+    def write(self, array: numpy.ndarray) -> int:
+        npy = array_to_npy(array)
+        padding = -len(npy) % ALIGNMENT
+        offset = self.offset
+
+        self.chunks += [npy, b"\0" * padding]
+        self.offset += len(npy) + padding
+
+        return offset
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+def _encode_column(column: pandas.Series, writer: _Writer) -> dict:
+    import numpy
+    import pandas
+
+    dtype = column.dtype
+    spec: dict[str, Any] = {"dtype": str(dtype)}
+
+    if isinstance(dtype, pandas.CategoricalDtype):
+        spec["npy"] = writer.write(column.cat.codes.to_numpy())
+        spec["categories"] = _encode_column(dtype.categories.to_series(), writer)
+        spec["ordered"] = bool(dtype.ordered)
+    elif isinstance(dtype, pandas.DatetimeTZDtype):
+        spec["tz"] = str(dtype.tz)
+        spec["npy"] = writer.write(
+            column.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+        )
+    elif isinstance(dtype, _masked_dtypes()):
+        numpy_dtype = dtype.numpy_dtype
+        spec["npy"] = writer.write(
+            column.to_numpy(dtype=numpy_dtype, na_value=numpy_dtype.type(0))
+        )
+        spec["mask"] = writer.write(column.isna().to_numpy())
+    elif isinstance(dtype, numpy.dtype) and dtype.kind in "biufcmM":
+        spec["npy"] = writer.write(column.to_numpy())
+    else:
+        spec["json"] = column.to_json(orient="values", date_format="iso")
+
+    return spec
+
+
+def _decode_column(spec: dict, buffer: Buffer, copy: bool):
+    import pandas
+
+    if "json" in spec:
+        values = pandas.Series(loads(spec["json"]))
+
+        if spec["dtype"] != "object":
+            with suppress(TypeError, ValueError):
+                values = values.astype(spec["dtype"])
+
+        return values.array
+
+    values = array_from_npy(buffer, spec["npy"])
+
+    if "categories" in spec:
+        categories = pandas.Index(_decode_column(spec["categories"], buffer, copy))
+        dtype = pandas.CategoricalDtype(categories, ordered=spec["ordered"])
+
+        return pandas.Categorical.from_codes(values, dtype=dtype)
+    if "tz" in spec:
+        return (
+            pandas.DatetimeIndex(values).tz_localize("UTC").tz_convert(spec["tz"]).array
+        )
+    if "mask" in spec:
+        mask = array_from_npy(buffer, spec["mask"])
+        array_type = pandas.api.types.pandas_dtype(spec["dtype"]).construct_array_type()
+
+        return array_type(values.copy(), mask.copy())
+
+    return values.copy() if copy else values
+
+
+def encode(
+    index: pandas.Index, columns: list[pandas.Series]
+) -> tuple[dict, list[dict], bytes]:
+    """Encode an index and columns in JSON-serializable specifications and a buffer.
+
+    The values of NumPy dtype (numbers, booleans, datetimes and timedeltas),
+    timezone-aware datetimes, categoricals and nullable numbers and booleans are
+    written in the buffer, in the ``.npy`` format, and restored exactly. The other
+    values, such as strings, are serialized using pandas' `to_json` function, in the
+    specification.
+
+    The labels of the index, i.e. its names, must be JSON-serializable; see
+    :func:`is_json_label`.
+
+    Parameters
+    ----------
+    index : pandas.Index
+        The index to encode, possibly a ``pandas.MultiIndex``.
+    columns : list[pandas.Series]
+        The columns to encode, whose index is ignored.
+
+    Returns
+    -------
+    tuple[dict, list[dict], bytes]
+        The specification of the index, the specification of each column, and the
+        buffer.
+    """
+    import pandas
+    from pandas.tseries.frequencies import to_offset
+
+    writer = _Writer()
+
+    if isinstance(index, pandas.RangeIndex):
+        index_spec = {
+            "range": [index.start, index.stop, index.step],
+            "name": index.name,
+        }
+    elif (
+        isinstance(index, (pandas.DatetimeIndex, pandas.TimedeltaIndex))
+        and index.freq is not None
+        and len(index)
+        and to_offset(index.freqstr) == index.freq
+    ):
+        # Regular indexes are generated again from their first value, which is
+        # faster than validating their frequency. Only frequencies restored exactly
+        # from their string are used, e.g. not business days with holidays
+        index_spec = {
+            "names": [index.name],
+            "levels": [_encode_column(index[:1].to_series(), writer)],
+            "freq": index.freqstr,
+            "periods": len(index),
+        }
+    else:
+        index_spec = {
+            "names": list(index.names),
+            "levels": [
+                _encode_column(index.get_level_values(i).to_series(), writer)
+                for i in range(index.nlevels)
+            ],
+        }
+
+    specs = [_encode_column(column, writer) for column in columns]
+
+    return index_spec, specs, writer.getvalue()
+
+
+def decode_index(spec: dict, buffer: Buffer, copy: bool = True) -> pandas.Index:
+    """Decode an index encoded with :func:`encode`.
+
+    Parameters
+    ----------
+    spec : dict
+        The specification of the index.
+    buffer : bytes-like
+        The buffer holding the binary values.
+    copy : bool, optional
+        Whether to copy the binary values, by default True. Otherwise they are
+        read-only views over ``buffer``.
+
+    Returns
+    -------
+    pandas.Index
+        The index.
+    """
+    import pandas
+
+    if "range" in spec:
+        return pandas.RangeIndex(*spec["range"], name=spec["name"])
+
+    levels = decode_columns(spec["levels"], buffer, copy)
+
+    if len(levels) > 1:
+        return pandas.MultiIndex.from_arrays(levels, names=spec["names"])
+
+    index = pandas.Index(levels[0], name=spec["names"][0], copy=False)
+
+    if "freq" in spec:
+        generate = (
+            pandas.date_range
+            if isinstance(index, pandas.DatetimeIndex)
+            else pandas.timedelta_range
+        )
+
+        return generate(
+            index[0],
+            periods=spec["periods"],
+            freq=spec["freq"],
+            unit=index.unit,
+            name=index.name,
+        )
+
+    return index
+
+
+def decode_columns(specs: list[dict], buffer: Buffer, copy: bool = True) -> list:
+    """Decode columns encoded with :func:`encode`.
+
+    Parameters
+    ----------
+    specs : list[dict]
+        The specification of each column.
+    buffer : bytes-like
+        The buffer holding the binary values.
+    copy : bool, optional
+        Whether to copy the binary values, by default True. Otherwise the values of
+        NumPy dtype are read-only views over ``buffer``.
+
+    Returns
+    -------
+    list[numpy.ndarray | pandas.api.extensions.ExtensionArray]
+        The values of each column.
+    """
+    return [_decode_column(spec, buffer, copy) for spec in specs]
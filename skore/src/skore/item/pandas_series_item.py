@@ -7,13 +7,21 @@ which represents a pandas Series item.
 from __future__ import annotations
 
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
 from skore.item.item import Item, ItemTypeError
+from skore.item.pandas_encoding import (
+    decode_columns,
+    decode_index,
+    encode,
+    is_json_label,
+)
 
 if TYPE_CHECKING:
     import pandas
 
+    Buffer = Union[bytes, bytearray, memoryview]
+
 
 class PandasSeriesItem(Item):
     """
@@ -25,22 +33,36 @@ class PandasSeriesItem(Item):
 
     ORIENT = "split"
 
+    __blobs__ = ("series_buffer",)
+
     def __init__(
         self,
-        index_json: str,
-        series_json: str,
+        index_json: str | None = None,
+        series_json: str | None = None,
+        series_spec: dict | None = None,
+        series_buffer: Buffer | None = None,
+        summary: dict | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
         """
         Initialize a PandasSeriesItem.
 
+        A series is either represented in JSON, by ``index_json`` and
+        ``series_json``, or in binary, by ``series_spec`` and ``series_buffer``.
+
         Parameters
         ----------
-        index_json : str
+        index_json : str, optional
             The JSON representation of the series's index.
-        series_json : str
+        series_json : str, optional
             The JSON representation of the series, without its index.
+        series_spec : dict, optional
+            The specification of the name, index and values of the series.
+        series_buffer : bytes-like, optional
+            The buffer holding the binary values and index of the series.
+        summary : dict, optional
+            The summary statistics of the series.
         created_at : str
             The creation timestamp in ISO format.
         updated_at : str
@@ -50,16 +72,51 @@ class PandasSeriesItem(Item):
 
         self.index_json = index_json
         self.series_json = series_json
+        self.series_spec = series_spec
+        self.series_buffer = series_buffer
+        self.summary = summary
 
     @cached_property
     def series(self) -> pandas.Series:
         """
         The pandas Series from the persistence.
 
-        Its content can differ from the original series because it has been serialized
-        using pandas' `to_json` function and not pickled, in order to be
+        Values and indexes of NumPy dtype, timezone-aware datetimes, categoricals and
+        nullable numbers and booleans are restored exactly. Other values, e.g.
+        strings, can differ from the original series because they have been
+        serialized using pandas' `to_json` function and not pickled, in order to be
         environment-independent.
         """
+        if self.series_spec is None:
+            return self.__series_from_json()
+
+        return self.__series_from_buffer(copy=True)
+
+    @cached_property
+    def series_view(self) -> pandas.Series:
+        """
+        The pandas Series from the persistence, over read-only buffers.
+
+        Contrary to :attr:`series`, values and indexes of NumPy dtype are not copied:
+        they are read-only views over the buffer given by the storage, see
+        :attr:`skore.item.NumpyArrayItem.array_view`. Modifying them in place raises
+        a ``ValueError``.
+        """
+        if self.series_spec is None:
+            return self.__series_from_json()
+
+        return self.__series_from_buffer(copy=False)
+
+    def __series_from_buffer(self, copy: bool) -> pandas.Series:
+        import pandas
+
+        spec = self.series_spec
+        index = decode_index(spec["index"], self.series_buffer, copy)
+        (values,) = decode_columns([spec["values"]], self.series_buffer, copy)
+
+        return pandas.Series(values, index=index, name=spec["name"], copy=False)
+
+    def __series_from_json(self) -> pandas.Series:
         import io
 
         import pandas
@@ -94,12 +151,35 @@ class PandasSeriesItem(Item):
         -------
         PandasSeriesItem
             A new PandasSeriesItem instance.
+
+        Notes
+        -----
+        The series is stored in binary, unless its name or one of its index names
+        cannot be represented in JSON, e.g. a tuple. It must then be JSON
+        serializable.
         """
         import pandas
 
+        from skore.item.summary import summarize_series
+
         if not isinstance(series, pandas.Series):
             raise ItemTypeError(f"Type '{series.__class__}' is not supported.")
 
+        summary = summarize_series(series)
+
+        if is_json_label(series.name) and all(map(is_json_label, series.index.names)):
+            index_spec, (values_spec,), buffer = encode(series.index, [series])
+
+            return cls(
+                series_spec={
+                    "index": index_spec,
+                    "values": values_spec,
+                    "name": series.name,
+                },
+                series_buffer=buffer,
+                summary=summary,
+            )
+
         # One native method is available to serialize series with multi-index,
         # while keeping the index names:
         #
@@ -119,4 +199,5 @@ class PandasSeriesItem(Item):
         return cls(
             index_json=index.to_json(orient=PandasSeriesItem.ORIENT),
             series_json=series.to_json(orient=PandasSeriesItem.ORIENT),
+            summary=summary,
         )
@@ -0,0 +1,211 @@
+"""Compact JSON encoding of Plotly figures.
+
+This module encodes the numeric arrays of the traces of Plotly figures in the typed
+array format of plotly.js, i.e. ``{"dtype": "f8", "bdata": <base64>}``, rather than
+writing every number as text, and decodes them back to NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy
+    from plotly.basedatatypes import BaseFigure
+
+# Arrays of fewer elements are kept as text, they would hardly be smaller
+BDATA_MIN_SIZE = 64
+
+# The dtypes of the typed arrays supported by plotly.js
+BDATA_DTYPES = ("i1", "u1", "i2", "u2", "i4", "u4", "f4", "f8")
+
+
+def json_engine() -> str:
+    """Return the fastest JSON engine available to ``plotly.io``."""
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        return "json"
+
+    return "orjson"
+
+
+def _typed_array(array: numpy.ndarray) -> dict | None:
+    """Return the typed array representation of ``array``, or None if unsupported."""
+    import numpy
+
+    if array.ndim not in (1, 2) or array.size < BDATA_MIN_SIZE:
+        return None
+
+    # plotly.js has no 64-bit integers: they are narrowed when they fit in 32 bits
+    if array.dtype.kind in "iu" and array.dtype.itemsize == 8:
+        narrow = numpy.int32 if array.dtype.kind == "i" else numpy.uint32
+        info = numpy.iinfo(narrow)
+
+        if array.min() < info.min or array.max() > info.max:
+            return None
+
+        array = array.astype(narrow)
+
+    dtype = array.dtype.newbyteorder("<")
+
+    if f"{dtype.kind}{dtype.itemsize}" not in BDATA_DTYPES:
+        return None
+
+    typed_array = {
+        "dtype": f"{dtype.kind}{dtype.itemsize}",
+        "bdata": base64.b64encode(
+            numpy.ascontiguousarray(array, dtype=dtype).tobytes()
+        ).decode("ascii"),
+    }
+
+    if array.ndim == 2:
+        typed_array["shape"] = f"{array.shape[0]},{array.shape[1]}"
+
+    return typed_array
+
+
+def _is_number(value: Any) -> bool:
+    import numpy
+
+    return isinstance(value, (int, float, numpy.number)) and not isinstance(
+        value, (bool, numpy.bool_)
+    )
+
+
+def _numeric_array(value: list | tuple) -> numpy.ndarray | None:
+    """Return the array of a list of numbers, or of lists of numbers, or None."""
+    import numpy
+
+    if not all(
+        _is_number(v)
+        or (isinstance(v, (list, tuple)) and all(_is_number(w) for w in v))
+        for v in value
+    ):
+        return None
+
+    try:
+        array = numpy.asarray(value)
+    except ValueError:
+        # e.g. ragged lists of lists
+        return None
+
+    return array if array.dtype.kind in "iuf" else None
+
+
+def _encode(
+    value: Any, bdata: bool, float_precision: int | None, in_array: bool = False
+) -> Any:
+    """Encode the data arrays of a trace; floats are only rounded in data arrays."""
+    import numpy
+
+    if isinstance(value, dict):
+        return {k: _encode(v, bdata, float_precision) for k, v in value.items()}
+    if isinstance(value, float) and float_precision is not None and in_array:
+        return round(value, float_precision)
+    if isinstance(value, (list, tuple)):
+        array = (
+            _numeric_array(value) if bdata and len(value) >= BDATA_MIN_SIZE else None
+        )
+
+        if array is None:
+            return [_encode(v, bdata, float_precision, in_array=True) for v in value]
+
+        value = array
+    if isinstance(value, numpy.ndarray) and value.dtype.kind in "iuf":
+        if value.dtype.kind == "f" and float_precision is not None:
+            value = value.round(float_precision)
+
+        return (bdata and _typed_array(value)) or value
+
+    return value
+
+
+def _decode(value: Any) -> Any:
+    import numpy
+
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+    if "bdata" in value and "dtype" in value:
+        array = numpy.frombuffer(
+            base64.b64decode(value["bdata"]), dtype=f"<{value['dtype']}"
+        )
+
+        if "shape" in value:
+            array = array.reshape([int(n) for n in str(value["shape"]).split(",")])
+
+        return array
+
+    return {k: _decode(v) for k, v in value.items()}
+
+
+def figure_to_json(
+    figure: BaseFigure, bdata: bool = True, float_precision: int | None = None
+) -> bytes:
+    """Encode a Plotly figure in JSON, with the fastest JSON engine available.
+
+    Parameters
+    ----------
+    figure : plotly.basedatatypes.BaseFigure
+        The figure to encode.
+    bdata : bool, optional
+        Whether to encode the numeric arrays of the traces of at least
+        ``BDATA_MIN_SIZE`` elements as base64 typed arrays, by default True.
+    float_precision : int, optional
+        The number of decimals to which the floats of the traces are rounded, by
+        default None, i.e. not rounded.
+
+    Returns
+    -------
+    bytes
+        The JSON representation of the figure, in UTF-8.
+    """
+    import plotly.io
+
+    if not bdata and float_precision is None:
+        return plotly.io.to_json(figure, engine=json_engine()).encode("utf-8")
+
+    figure_dict = figure.to_plotly_json()
+    figure_dict["data"] = [
+        _encode(trace, bdata, float_precision) for trace in figure_dict["data"]
+    ]
+
+    return plotly.io.to_json(figure_dict, validate=False, engine=json_engine()).encode(
+        "utf-8"
+    )
+
+
+def figure_from_json(figure_json: bytes | str) -> BaseFigure:
+    """Decode a Plotly figure encoded with :func:`figure_to_json`.
+
+    Typed arrays are decoded to NumPy arrays, so that versions of Plotly which do
+    not support them can load the figure.
+
+    Parameters
+    ----------
+    figure_json : bytes | str
+        The JSON representation of the figure.
+
+    Returns
+    -------
+    plotly.graph_objects.Figure
+        The figure.
+    """
+    import plotly.graph_objects
+
+    if json_engine() == "orjson":
+        import orjson
+
+        figure_dict = orjson.loads(figure_json)
+    else:
+        import json
+
+        figure_dict = json.loads(figure_json)
+
+    if "data" in figure_dict:
+        figure_dict["data"] = _decode(figure_dict["data"])
+
+    return plotly.graph_objects.Figure(figure_dict)
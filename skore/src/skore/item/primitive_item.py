@@ -5,9 +5,12 @@ PrimitiveItems represents a primitive item with creation and update timestamps.
 
 from __future__ import annotations
 
+from functools import cached_property
+from itertools import chain
 from typing import TYPE_CHECKING
 
 from skore.item.item import Item, ItemTypeError
+from skore.item.numpy_array_item import array_from_npy, array_to_npy
 
 if TYPE_CHECKING:
     from typing import Union
@@ -22,19 +25,120 @@ if TYPE_CHECKING:
         dict[str | int | float, "Primitive"],
     ]
 
+    Buffer = Union[bytes, bytearray, memoryview]
+
+SCALAR_TYPES = (bool, float, int, str)
+
+# The exact types of the scalars, whose containers are checked in bulk
+_SCALAR_TYPES_SET = frozenset(SCALAR_TYPES)
+
+# The dtypes of the homogeneous numeric lists which can be encoded compactly, by
+# exact type of their elements
+COMPACT_DTYPES = {bool: "bool", float: "float64", int: "int64"}
+
+# The maximal number of dimensions of arrays, supported by all NumPy versions
+NPY_MAX_DIMS = 32
+
 
 def is_primitive(obj: object) -> bool:
-    """Check if the object is a primitive."""
-    if isinstance(obj, (bool, float, int, str)):
-        return True
-    if isinstance(obj, (list, tuple)):
-        return all(is_primitive(item) for item in obj)
-    if isinstance(obj, dict):
-        return all(
-            isinstance(k, (bool, float, int, str)) and is_primitive(v)
-            for k, v in obj.items()
-        )
-    return False
+    """Check if the object is a primitive.
+
+    The object is walked iteratively, without recursion, and the check stops at the
+    first element which is not a primitive. The elements of each container are first
+    checked in bulk, by exact type, so that long lists of scalars are fast to check.
+
+    Containers which contain themselves, directly or not, are not primitives: they
+    cannot be serialized.
+    """
+    # Each container is pushed a second time, to be marked as checked once all its
+    # elements are, in a depth-first walk
+    stack = [(obj, False)]
+    ancestors = set()
+    checked = set()
+
+    while stack:
+        obj, exiting = stack.pop()
+
+        if exiting:
+            ancestors.discard(id(obj))
+            checked.add(id(obj))
+            continue
+        if isinstance(obj, SCALAR_TYPES):
+            continue
+        if isinstance(obj, (list, tuple)):
+            values = obj
+        elif isinstance(obj, dict):
+            if not all(isinstance(key, SCALAR_TYPES) for key in obj):
+                return False
+            values = obj.values()
+        else:
+            return False
+
+        # Containers referenced several times are checked once
+        if id(obj) in ancestors:
+            return False
+        if id(obj) in checked:
+            continue
+
+        ancestors.add(id(obj))
+        stack.append((obj, True))
+
+        if not _SCALAR_TYPES_SET.issuperset(map(type, values)):
+            stack.extend(
+                (value, False)
+                for value in values
+                if type(value) not in _SCALAR_TYPES_SET
+            )
+
+    return True
+
+
+def _encode_numeric_list(primitive: Primitive, min_size: int) -> bytes | None:
+    """Encode a homogeneous numeric list in the ``.npy`` format, if possible.
+
+    The list, possibly nested, must be rectangular, and its elements must all be
+    exactly of type bool, float or int, without overflowing int64. Its ``.npy``
+    representation then holds both its shape and its typed buffer.
+
+    Returns None if the list cannot be encoded, or has less than ``min_size``
+    elements.
+    """
+    import numpy
+
+    if type(primitive) is not list:
+        return None
+
+    shape = [len(primitive)]
+    values = primitive
+
+    # The number of dimensions is bounded, in case the list references itself
+    while (
+        values
+        and len(shape) < NPY_MAX_DIMS
+        and all(type(value) is list for value in values)
+    ):
+        lengths = set(map(len, values))
+
+        if len(lengths) != 1:
+            return None
+
+        shape.append(lengths.pop())
+        values = list(chain.from_iterable(values))
+
+    if len(values) < min_size:
+        return None
+
+    types = set(map(type, values))
+
+    if len(types) != 1 or (dtype := COMPACT_DTYPES.get(types.pop())) is None:
+        return None
+
+    try:
+        array = numpy.array(values, dtype=dtype)
+    except OverflowError:
+        return None
+
+    return array_to_npy(array.reshape(shape))
 
 
 class PrimitiveItem(Item):
@@ -45,9 +149,16 @@ class PrimitiveItem(Item):
     along with its creation and update timestamps.
     """
 
+    __blobs__ = ("primitive_npy",)
+
+    # Homogeneous numeric lists of at least ``COMPACT_MIN_SIZE`` elements are stored
+    # in a typed buffer
+    COMPACT_MIN_SIZE = 2**10
+
     def __init__(
         self,
-        primitive: Primitive,
+        primitive: Primitive | None = None,
+        primitive_npy: Buffer | None = None,
         created_at: str | None = None,
         updated_at: str | None = None,
     ):
@@ -56,8 +167,11 @@ class PrimitiveItem(Item):
 
         Parameters
         ----------
-        primitive : Primitive
-            The primitive value to store.
+        primitive : Primitive, optional
+            The primitive value to store, unless it is a homogeneous numeric list
+            represented by ``primitive_npy``.
+        primitive_npy : bytes-like, optional
+            The ``.npy`` representation of a homogeneous numeric list.
         created_at : str, optional
             The creation timestamp as ISO format.
         updated_at : str, optional
@@ -65,7 +179,37 @@ class PrimitiveItem(Item):
         """
         super().__init__(created_at, updated_at)
 
-        self.primitive = primitive
+        self.primitive_npy = primitive_npy
+
+        # The list represented by ``primitive_npy`` is only decoded on access
+        if primitive_npy is None:
+            self.primitive = primitive
+
+    @cached_property
+    def primitive(self) -> Primitive:
+        """
+        The primitive value from the persistence.
+
+        Homogeneous numeric lists are decoded back to lists of Python scalars.
+        """
+        return array_from_npy(self.primitive_npy).tolist()
+
+    @cached_property
+    def __parameters__(self) -> dict:
+        """
+        Get the parameters of the PrimitiveItem instance.
+
+        The list represented by ``primitive_npy`` is not a parameter.
+        """
+        if self.primitive_npy is None:
+            return super().__parameters__
+
+        return {
+            "primitive": None,
+            "primitive_npy": self.primitive_npy,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
     @classmethod
     def factory(cls, primitive: Primitive) -> PrimitiveItem:
@@ -81,8 +225,19 @@ class PrimitiveItem(Item):
         -------
         PrimitiveItem
             A new PrimitiveItem instance.
+
+        Notes
+        -----
+        Lists, possibly nested and rectangular, of at least ``COMPACT_MIN_SIZE``
+        elements which are all bools, all floats or all 64-bit integers are stored
+        in a typed buffer rather than as Python objects.
         """
         if not is_primitive(primitive):
             raise ItemTypeError(f"Type '{primitive.__class__}' is not supported.")
 
+        primitive_npy = _encode_numeric_list(primitive, cls.COMPACT_MIN_SIZE)
+
+        if primitive_npy is not None:
+            return cls(primitive_npy=primitive_npy)
+
         return cls(primitive=primitive)
@@ -0,0 +1,267 @@
+"""ItemRegistry.
+
+This module defines the ItemRegistry class, which maps the types of objects to the
+item classes converting them, and the registry used by skore.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Callable, Union
+from weakref import WeakKeyDictionary
+
+from skore.item.cross_validation_item import (
+    CrossValidationAggregationItem,
+    CrossValidationItem,
+)
+from skore.item.item import Item, ItemTypeError
+from skore.item.media_item import MediaItem
+from skore.item.numpy_array_item import NumpyArrayItem
+from skore.item.pandas_dataframe_item import PandasDataFrameItem
+from skore.item.pandas_series_item import PandasSeriesItem
+from skore.item.primitive_item import PrimitiveItem
+from skore.item.scipy_sparse_matrix_item import ScipySparseMatrixItem
+from skore.item.sklearn_base_estimator_item import SklearnBaseEstimatorItem
+
+if TYPE_CHECKING:
+    Factory = Callable[[Any], Item]
+    Decoder = Callable[[Item, bool], Any]
+
+logger = logging.getLogger(__name__)
+
+# The entry points group of the plugins registering item types; each entry point is
+# a function called with the registry
+PLUGINS_ENTRY_POINTS_GROUP = "skore.item_types"
+
+
+def qualified_name(cls: type) -> str:
+    """Return the fully qualified name of a class, e.g. ``"numpy.ndarray"``."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+class ItemRegistry:
+    """
+    A registry of item classes, and of the types of objects they convert.
+
+    Objects are converted by the factories registered for their class, or for one
+    of its base classes, from the most specific to the least. Classes are identified
+    by their fully qualified name, so that registering a type does not import its
+    module. The factories of a class are resolved once, then cached.
+
+    Attributes
+    ----------
+    item_classes : dict[str, type[Item]]
+        The registered item classes, by name, which is what the repository stores
+        to load an item.
+    decoders : dict[type[Item], Callable[[Item, bool], Any]]
+        The functions returning the value of an item, given whether to copy it,
+        for item classes not known to :class:`skore.Project`.
+    """
+
+    def __init__(self):
+        self.item_classes: dict[str, type[Item]] = {}
+        self.decoders: dict[type[Item], Decoder] = {}
+        self.__factories: dict[str, list[tuple[type[Item], Factory]]] = {}
+        self.__resolved: WeakKeyDictionary[type, tuple[Factory, ...]] = (
+            WeakKeyDictionary()
+        )
+        self.__lock = threading.Lock()
+        self.__plugins_loaded = False
+
+    def register(
+        self,
+        item_class: type[Item],
+        types: Union[str, type, Iterable[Union[str, type]]] = (),
+        factory: Factory | None = None,
+        decode: Decoder | None = None,
+    ):
+        """
+        Register an item class, and the types of objects it converts.
+
+        Parameters
+        ----------
+        item_class : type[Item]
+            The item class, which can then be stored and loaded by
+            :class:`~skore.item.ItemRepository`.
+        types : str | type | Iterable[str | type], optional
+            The classes of the objects converted to ``item_class``, or their fully
+            qualified names, e.g. ``"pandas.core.frame.DataFrame"``. Their
+            subclasses are converted too.
+        factory : Callable[[Any], Item], optional
+            The function converting an object to an item, by default
+            ``item_class.factory``. It raises ``ItemTypeError`` if it does not
+            support the object, in which case the next factory is tried.
+        decode : Callable[[Item, bool], Any], optional
+            The function returning the value of an item, given whether to copy it,
+            used by :meth:`skore.Project.get`. Built-in item classes do not need
+            one.
+
+        Raises
+        ------
+        ValueError
+            If another item class of the same name is already registered.
+        """
+        if isinstance(types, (str, type)):
+            types = (types,)
+
+        with self.__lock:
+            name = item_class.__name__
+            registered = self.item_classes.get(name)
+
+            if registered is not None and registered is not item_class:
+                raise ValueError(
+                    f"Item class '{qualified_name(registered)}' is already "
+                    f"registered under the name '{name}'."
+                )
+
+            self.item_classes[name] = item_class
+
+            if decode is not None:
+                self.decoders[item_class] = decode
+
+            for type_ in types:
+                name = type_ if isinstance(type_, str) else qualified_name(type_)
+                self.__factories.setdefault(name, []).append(
+                    (item_class, factory or item_class.factory)
+                )
+
+            self.__resolved.clear()
+
+    def unregister(self, item_class: type[Item]):
+        """
+        Unregister an item class, and the factories registered with it.
+
+        Parameters
+        ----------
+        item_class : type[Item]
+            The item class.
+        """
+        with self.__lock:
+            if self.item_classes.get(item_class.__name__) is item_class:
+                del self.item_classes[item_class.__name__]
+
+            self.decoders.pop(item_class, None)
+
+            for name, factories in list(self.__factories.items()):
+                factories = [f for f in factories if f[0] is not item_class]
+
+                if factories:
+                    self.__factories[name] = factories
+                else:
+                    del self.__factories[name]
+
+            self.__resolved.clear()
+
+    def __load_plugins(self):
+        from importlib.metadata import entry_points
+
+        self.__plugins_loaded = True
+
+        for entry_point in entry_points(group=PLUGINS_ENTRY_POINTS_GROUP):
+            try:
+                entry_point.load()(self)
+            except Exception:
+                logger.exception(f"Item types plugin '{entry_point.name}' failed.")
+
+    def resolve(self, cls: type) -> tuple[Factory, ...]:
+        """
+        Return the factories of the objects of class ``cls``.
+
+        Parameters
+        ----------
+        cls : type
+            The class of the objects.
+
+        Returns
+        -------
+        tuple[Callable[[Any], Item], ...]
+            The factories, from the most specific class to the least.
+        """
+        if not self.__plugins_loaded:
+            self.__load_plugins()
+
+        try:
+            return self.__resolved[cls]
+        except KeyError:
+            pass
+
+        with self.__lock:
+            factories = tuple(
+                factory
+                for base in cls.__mro__
+                for _, factory in self.__factories.get(qualified_name(base), ())
+            )
+
+            self.__resolved[cls] = factories
+
+        return factories
+
+    def object_to_item(self, object: Any) -> Item:
+        """
+        Convert an object to an item.
+
+        Parameters
+        ----------
+        object : Any
+            The object to convert.
+
+        Returns
+        -------
+        Item
+            The item.
+
+        Raises
+        ------
+        NotImplementedError
+            If no registered factory supports the object.
+        """
+        for factory in self.resolve(type(object)):
+            try:
+                return factory(object)
+            except ItemTypeError:
+                # The factories are responsible for checking that the object is
+                # supported, e.g. that a list only holds primitives
+                continue
+
+        raise NotImplementedError(f"Type '{object.__class__}' is not supported.")
+
+
+registry = ItemRegistry()
+
+registry.register(
+    PrimitiveItem, (bool, int, float, str, list, tuple, dict), PrimitiveItem.factory
+)
+# The classes of pandas are defined in ``pandas.core``, but their ``__module__`` is
+# ``pandas`` since pandas 3
+registry.register(
+    PandasDataFrameItem, ("pandas.DataFrame", "pandas.core.frame.DataFrame")
+)
+registry.register(PandasSeriesItem, ("pandas.Series", "pandas.core.series.Series"))
+registry.register(NumpyArrayItem, "numpy.ndarray")
+registry.register(
+    ScipySparseMatrixItem,
+    (
+        "scipy.sparse._base._spbase",
+        "scipy.sparse._base.spmatrix",
+        "scipy.sparse.base.spmatrix",
+    ),
+)
+registry.register(SklearnBaseEstimatorItem, "sklearn.base.BaseEstimator")
+registry.register(MediaItem, bytes, MediaItem.factory_bytes)
+registry.register(
+    MediaItem,
+    "altair.vegalite.v5.schema.core.TopLevelSpec",
+    MediaItem.factory_altair,
+)
+registry.register(MediaItem, "matplotlib.figure.Figure", MediaItem.factory_matplotlib)
+registry.register(MediaItem, "PIL.Image.Image", MediaItem.factory_pillow)
+registry.register(
+    MediaItem, "plotly.basedatatypes.BaseFigure", MediaItem.factory_plotly
+)
+registry.register(
+    MediaItem, ("pathlib.PurePath", "_io._IOBase"), MediaItem.factory_file
+)
+registry.register(CrossValidationItem)
+registry.register(CrossValidationAggregationItem)
@@ -0,0 +1,166 @@
+"""ScipySparseMatrixItem.
+
+This module defines the ScipySparseMatrixItem class, which represents a SciPy sparse
+matrix (or array) item, in compressed sparse row or column format.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Union
+
+from skore.item.item import Item, ItemTypeError
+from skore.item.numpy_array_item import array_from_npy, array_to_npy
+
+if TYPE_CHECKING:
+    import scipy.sparse
+
+    Buffer = Union[bytes, bytearray, memoryview]
+
+# The compressed formats, whose buffers can be stored as is
+SPARSE_CLASS_NAMES = ("csr_matrix", "csc_matrix", "csr_array", "csc_array")
+
+
+class ScipySparseMatrixItem(Item):
+    """
+    A class to represent a SciPy sparse matrix item.
+
+    This class encapsulates a CSR or CSC sparse matrix, or sparse array, along with
+    its creation and update timestamps. Only its stored elements are persisted.
+    """
+
+    __blobs__ = ("data_npy", "indices_npy", "indptr_npy")
+
+    def __init__(
+        self,
+        sparse_spec: dict,
+        data_npy: Buffer,
+        indices_npy: Buffer,
+        indptr_npy: Buffer,
+        summary: dict | None = None,
+        created_at: str | None = None,
+        updated_at: str | None = None,
+    ):
+        """
+        Initialize a ScipySparseMatrixItem.
+
+        Parameters
+        ----------
+        sparse_spec : dict
+            The class, e.g. ``"csr_matrix"``, and the shape of the matrix.
+        data_npy : bytes-like
+            The ``.npy`` representation of the stored elements of the matrix.
+        indices_npy : bytes-like
+            The ``.npy`` representation of the column (CSR) or row (CSC) indices of
+            the stored elements.
+        indptr_npy : bytes-like
+            The ``.npy`` representation of the positions, in ``data`` and
+            ``indices``, of the first element of each row (CSR) or column (CSC).
+        summary : dict, optional
+            The summary statistics of the matrix.
+        created_at : str
+            The creation timestamp in ISO format.
+        updated_at : str
+            The last update timestamp in ISO format.
+        """
+        super().__init__(created_at, updated_at)
+
+        self.sparse_spec = sparse_spec
+        self.data_npy = data_npy
+        self.indices_npy = indices_npy
+        self.indptr_npy = indptr_npy
+        self.summary = summary
+
+    @cached_property
+    def matrix(self) -> scipy.sparse.spmatrix | scipy.sparse.sparray:
+        """
+        The SciPy sparse matrix from the persistence.
+
+        Its class, shape, and the dtypes and content of its buffers are restored
+        exactly, including unsorted or duplicate indices.
+        """
+        return self.__matrix(copy=True)
+
+    @cached_property
+    def matrix_view(self) -> scipy.sparse.spmatrix | scipy.sparse.sparray:
+        """
+        The SciPy sparse matrix from the persistence, over read-only buffers.
+
+        Contrary to :attr:`matrix`, the buffers are not copied: they are read-only
+        views over the buffers given by the storage, see
+        :attr:`skore.item.NumpyArrayItem.array_view`.
+
+        Slicing the rows of a CSR matrix (or the columns of a CSC matrix) therefore
+        only reads the stored elements of the selected rows: when the storage maps
+        buffers into memory, like read-only projects do, the rest of the matrix is
+        not loaded. Modifying the view in place raises a ``ValueError``.
+        """
+        return self.__matrix(copy=False)
+
+    def __matrix(self, copy: bool) -> scipy.sparse.spmatrix | scipy.sparse.sparray:
+        import scipy.sparse
+
+        buffers = [
+            array_from_npy(buffer)
+            for buffer in (self.data_npy, self.indices_npy, self.indptr_npy)
+        ]
+
+        if copy:
+            buffers = [buffer.copy() for buffer in buffers]
+
+        data, indices, indptr = buffers
+
+        # The constructor may cast the indices to a smaller dtype, copying them:
+        # the buffers are assigned to an empty matrix instead
+        cls = getattr(scipy.sparse, self.sparse_spec["class"])
+        matrix = cls(tuple(self.sparse_spec["shape"]), dtype=data.dtype)
+        matrix.data, matrix.indices, matrix.indptr = data, indices, indptr
+
+        return matrix
+
+    @classmethod
+    def factory(
+        cls, matrix: scipy.sparse.spmatrix | scipy.sparse.sparray
+    ) -> ScipySparseMatrixItem:
+        """
+        Create a new ScipySparseMatrixItem instance from a SciPy sparse matrix.
+
+        Parameters
+        ----------
+        matrix : scipy.sparse.spmatrix | scipy.sparse.sparray
+            The sparse matrix to store, in CSR or CSC format.
+
+        Returns
+        -------
+        ScipySparseMatrixItem
+            A new ScipySparseMatrixItem instance.
+        """
+        import scipy.sparse
+
+        from skore.item.summary import summarize_sparse_matrix
+
+        if not scipy.sparse.issparse(matrix):
+            raise ItemTypeError(f"Type '{matrix.__class__}' is not supported.")
+
+        class_name = next(
+            (
+                name
+                for name in SPARSE_CLASS_NAMES
+                if isinstance(matrix, getattr(scipy.sparse, name, ()))
+            ),
+            None,
+        )
+
+        if class_name is None:
+            raise ItemTypeError(
+                f"Sparse format '{matrix.format}' is not supported; "
+                "convert the matrix to CSR or CSC first."
+            )
+
+        return cls(
+            sparse_spec={"class": class_name, "shape": list(matrix.shape)},
+            data_npy=array_to_npy(matrix.data),
+            indices_npy=array_to_npy(matrix.indices),
+            indptr_npy=array_to_npy(matrix.indptr),
+            summary=summarize_sparse_matrix(matrix),
+        )
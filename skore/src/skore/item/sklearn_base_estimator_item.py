@@ -6,14 +6,110 @@ which represents a scikit-learn BaseEstimator item.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from functools import cached_property
-from typing import TYPE_CHECKING
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Union
 
 from skore.item.item import Item, ItemTypeError
 
 if TYPE_CHECKING:
     import sklearn.base
 
+    Buffer = Union[bytes, bytearray, memoryview]
+
+
+class _HashWriter:
+    """A binary file which hashes what is written to it, instead of storing it."""
+
+    def __init__(self):
+        self.hash = sha256()
+
+    def write(self, data: Buffer) -> int:
+        self.hash.update(data)
+        return memoryview(data).nbytes
+
+
+def estimator_fingerprint(estimator: sklearn.base.BaseEstimator) -> str | None:
+    """Return a digest of the class, parameters and fitted attributes of an estimator.
+
+    The estimator is pickled into a hash rather than into memory, and its arrays are
+    hashed in place, as out-of-band buffers: fingerprinting is orders of magnitude
+    faster than serializing the estimator with skops.
+
+    Two estimators with the same fingerprint have the same state; the converse does
+    not always hold, e.g. for sets of strings in different processes, which only
+    results in a missed cache hit.
+
+    Parameters
+    ----------
+    estimator : sklearn.base.BaseEstimator
+        The estimator to fingerprint.
+
+    Returns
+    -------
+    str | None
+        The SHA-256 hexdigest, or None if the estimator cannot be pickled.
+    """
+    import pickle
+
+    writer = _HashWriter()
+
+    def hash_buffer(buffer: pickle.PickleBuffer) -> bool:
+        with buffer.raw() as view:
+            writer.write(view)
+
+        # Out-of-band: the buffer is not written in the pickle stream
+        return False
+
+    try:
+        pickle.Pickler(writer, protocol=5, buffer_callback=hash_buffer).dump(estimator)
+    except Exception:
+        return None
+
+    return writer.hash.hexdigest()
+
+
+class _FingerprintCache:
+    """The values computed for the last estimators, by fingerprint.
+
+    At most ``maxsize`` values are cached, of at most ``maxbytes`` bytes in total:
+    larger values are not cached at all.
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int | None = None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.lock = threading.Lock()
+        self.items: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+
+    def get(self, fingerprint: str) -> Any:
+        with self.lock:
+            if fingerprint not in self.items:
+                return None
+
+            self.items.move_to_end(fingerprint)
+            return self.items[fingerprint][0]
+
+    def set(self, fingerprint: str, value: Any, nbytes: int = 0):
+        if self.maxbytes is not None and nbytes > self.maxbytes:
+            return
+
+        with self.lock:
+            if fingerprint in self.items:
+                self.nbytes -= self.items[fingerprint][1]
+
+            self.items[fingerprint] = (value, nbytes)
+            self.items.move_to_end(fingerprint)
+            self.nbytes += nbytes
+
+            while len(self.items) > self.maxsize or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                self.nbytes -= self.items.popitem(last=False)[1][1]
+
 
 class SklearnBaseEstimatorItem(Item):
     """
@@ -21,24 +117,40 @@ class SklearnBaseEstimatorItem(Item):
 
     This class encapsulates a scikit-learn BaseEstimator along with its
     creation and update timestamps.
+
+    The serializations of the last ``CACHE_SIZE`` estimators, of at most
+    ``CACHE_BYTES`` bytes in total, are cached in memory by
+    :func:`estimator_fingerprint`: storing an unchanged estimator again reuses them,
+    skipping the costly skops serialization. As the skops representation is then
+    the same, its bytes are deduplicated by the blob storage of the project.
+
+    The HTML representation of the estimator is not computed when the item is
+    created, but on first access to :attr:`html_repr`, and cached by fingerprint.
     """
 
+    __blobs__ = ("estimator_skops",)
+
+    CACHE_SIZE = 8
+    CACHE_BYTES = 2**26
+
     def __init__(
         self,
-        estimator_html_repr: str,
-        estimator_skops: bytes,
+        estimator_html_repr: str | None,
+        estimator_skops: Buffer,
         estimator_skops_untrusted_types: list[str],
         created_at: str | None = None,
         updated_at: str | None = None,
+        estimator_fingerprint: str | None = None,
     ):
         """
         Initialize a SklearnBaseEstimatorItem.
 
         Parameters
         ----------
-        estimator_html_repr : str
-            The HTML representation of the scikit-learn estimator.
-        estimator_skops : bytes
+        estimator_html_repr : str | None
+            The HTML representation of the scikit-learn estimator, computed on
+            demand by :attr:`html_repr` if None.
+        estimator_skops : bytes-like
             The skops representation of the scikit-learn estimator.
         estimator_skops_untrusted_types : list[str]
             The list of untrusted types in the skops representation.
@@ -46,12 +158,16 @@ class SklearnBaseEstimatorItem(Item):
             The creation timestamp in ISO format.
         updated_at : str, optional
             The last update timestamp in ISO format.
+        estimator_fingerprint : str, optional
+            The fingerprint of the scikit-learn estimator, see
+            :func:`estimator_fingerprint`.
         """
         super().__init__(created_at, updated_at)
 
         self.estimator_html_repr = estimator_html_repr
         self.estimator_skops = estimator_skops
         self.estimator_skops_untrusted_types = estimator_skops_untrusted_types
+        self.estimator_fingerprint = estimator_fingerprint
 
     @cached_property
     def estimator(self) -> sklearn.base.BaseEstimator:
@@ -69,6 +185,30 @@ class SklearnBaseEstimatorItem(Item):
             self.estimator_skops, trusted=self.estimator_skops_untrusted_types
         )
 
+    @cached_property
+    def html_repr(self) -> str:
+        """
+        The HTML representation of the scikit-learn estimator.
+
+        Unless stored with the item, it is computed from :attr:`estimator` on first
+        access, which loads the estimator, and cached by fingerprint: the
+        representations of unchanged estimators are computed once.
+        """
+        import sklearn.utils
+
+        if self.estimator_html_repr is not None:
+            return self.estimator_html_repr
+        if self.estimator_fingerprint is None:
+            return sklearn.utils.estimator_html_repr(self.estimator)
+
+        html_repr = _html_repr_cache.get(self.estimator_fingerprint)
+
+        if html_repr is None:
+            html_repr = sklearn.utils.estimator_html_repr(self.estimator)
+            _html_repr_cache.set(self.estimator_fingerprint, html_repr, len(html_repr))
+
+        return html_repr
+
     @classmethod
     def factory(cls, estimator: sklearn.base.BaseEstimator) -> SklearnBaseEstimatorItem:
         """
@@ -85,25 +225,45 @@ class SklearnBaseEstimatorItem(Item):
             A new SklearnBaseEstimatorItem instance.
         """
         import sklearn.base
-        import sklearn.utils
         import skops.io
 
         if not isinstance(estimator, sklearn.base.BaseEstimator):
             raise ItemTypeError(f"Type '{estimator.__class__}' is not supported.")
 
-        estimator_html_repr = sklearn.utils.estimator_html_repr(estimator)
-        estimator_skops = skops.io.dumps(estimator)
-        estimator_skops_untrusted_types = skops.io.get_untrusted_types(
-            data=estimator_skops
+        fingerprint = estimator_fingerprint(estimator)
+        serialization = (
+            None if fingerprint is None else _serialization_cache.get(fingerprint)
         )
 
+        if serialization is None:
+            estimator_skops = skops.io.dumps(estimator)
+            serialization = {
+                "estimator_skops": estimator_skops,
+                "estimator_skops_untrusted_types": skops.io.get_untrusted_types(
+                    data=estimator_skops
+                ),
+            }
+
+            if fingerprint is not None:
+                _serialization_cache.set(
+                    fingerprint, serialization, len(estimator_skops)
+                )
+
         instance = cls(
-            estimator_html_repr=estimator_html_repr,
-            estimator_skops=estimator_skops,
-            estimator_skops_untrusted_types=estimator_skops_untrusted_types,
+            estimator_html_repr=None,
+            **serialization,
+            estimator_fingerprint=fingerprint,
         )
 
         # add estimator as cached property
         instance.estimator = estimator
 
         return instance
+
+
+_serialization_cache = _FingerprintCache(
+    SklearnBaseEstimatorItem.CACHE_SIZE, SklearnBaseEstimatorItem.CACHE_BYTES
+)
+_html_repr_cache = _FingerprintCache(
+    SklearnBaseEstimatorItem.CACHE_SIZE, SklearnBaseEstimatorItem.CACHE_BYTES
+)
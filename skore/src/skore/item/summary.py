@@ -0,0 +1,242 @@
+"""Summary statistics of arrays, sparse matrices, series and dataframes.
+
+Summaries are computed when an item is created, and stored with it, so that they can
+be read without decoding the item, see :meth:`skore.Project.get_summary`.
+
+All the values of a summary are JSON-serializable. Inputs of more than
+``EXACT_MAX_SIZE`` elements (or rows) are summarized from a uniform random sample of
+``SAMPLE_SIZE`` elements (or rows), which is reported in the summary.
+
+Standard deviations are computed with ``STD_DDOF`` delta degrees of freedom, i.e.
+they are population standard deviations, whether the input is a NumPy or a pandas
+object.
+"""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy
+    import pandas
+
+EXACT_MAX_SIZE = 2**24
+SAMPLE_SIZE = 2**20
+QUANTILES = (0.25, 0.5, 0.75)
+STD_DDOF = 0
+
+
+def _sample_positions(size: int):
+    """Return sorted random positions if ``size`` is too large, otherwise None."""
+    import numpy
+
+    if size <= EXACT_MAX_SIZE:
+        return None
+
+    # Seeded, so that the summary of an input is deterministic
+    rng = numpy.random.default_rng(0)
+    return numpy.sort(rng.integers(0, size, SAMPLE_SIZE))
+
+
+def _scalar(value: Any) -> Any:
+    """Convert a NumPy or pandas scalar to a JSON-serializable value."""
+    import pandas.api.types
+
+    if value is None or (pandas.api.types.is_scalar(value) and pandas.isna(value)):
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _summarize_values(values: numpy.ndarray) -> dict:
+    """Summarize the elements of a NumPy array, whatever its shape."""
+    import numpy
+
+    kind = values.dtype.kind
+    summary: dict[str, Any] = {}
+
+    if kind in "fc":
+        nulls = numpy.isnan(values)
+    elif kind in "mM":
+        nulls = numpy.isnat(values)
+    else:
+        nulls = None
+
+    summary["null_count"] = 0 if nulls is None else int(nulls.sum())
+    valid = values if not summary["null_count"] else values[~nulls]
+
+    if not valid.size:
+        return summary
+
+    if kind == "b":
+        summary["mean"] = float(valid.mean())
+    elif kind in "iuf":
+        summary["min"] = _scalar(valid.min())
+        summary["max"] = _scalar(valid.max())
+        summary["mean"] = float(valid.mean(dtype="float64"))
+        summary["std"] = float(valid.std(dtype="float64", ddof=STD_DDOF))
+        summary["quantiles"] = dict(
+            zip(map(str, QUANTILES), map(float, numpy.quantile(valid, QUANTILES)))
+        )
+    elif kind in "mM":
+        summary["min"] = str(valid.min())
+        summary["max"] = str(valid.max())
+
+    return summary
+
+
+def _summarize_column(series: pandas.Series) -> dict:
+    """Summarize the values of a pandas Series, without its index."""
+    import pandas.api.types as types
+
+    dtype = series.dtype
+    nulls = series.isna()
+    summary: dict[str, Any] = {
+        "dtype": str(dtype),
+        "null_count": int(nulls.sum()),
+    }
+    valid = series[~nulls] if summary["null_count"] else series
+
+    if not len(valid):
+        return summary
+
+    if types.is_bool_dtype(dtype):
+        summary["mean"] = float(valid.astype("float64").mean())
+    elif types.is_numeric_dtype(dtype) and not types.is_complex_dtype(dtype):
+        summary["min"] = _scalar(valid.min())
+        summary["max"] = _scalar(valid.max())
+        summary["mean"] = float(valid.mean())
+        summary["std"] = _scalar(valid.std(ddof=STD_DDOF))
+        summary["quantiles"] = {
+            str(q): float(value)
+            for q, value in valid.astype("float64").quantile(list(QUANTILES)).items()
+        }
+    elif types.is_datetime64_any_dtype(dtype) or types.is_timedelta64_dtype(dtype):
+        summary["min"] = _scalar(valid.min())
+        summary["max"] = _scalar(valid.max())
+    else:
+        # Unhashable objects, such as lists, cannot be counted
+        with suppress(TypeError):
+            summary["unique_count"] = int(valid.nunique())
+
+    return summary
+
+
+def _sampling(summary: dict, positions) -> dict:
+    if positions is not None:
+        summary["sample_size"] = len(positions)
+
+    return summary
+
+
+def summarize_array(array: numpy.ndarray) -> dict:
+    """Summarize a NumPy array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to summarize.
+
+    Returns
+    -------
+    dict
+        The shape and dtype of the array, and the statistics of its elements.
+    """
+    import numpy
+
+    summary = {"shape": list(array.shape), "dtype": str(array.dtype)}
+
+    if array.dtype.hasobject:
+        return summary
+
+    positions = _sample_positions(array.size)
+    values = (
+        array
+        if positions is None
+        # Read the sampled elements only, even if the array is a memory mapping
+        else array[numpy.unravel_index(positions, array.shape)]
+    )
+
+    return _sampling(summary | _summarize_values(values), positions)
+
+
+def summarize_sparse_matrix(matrix) -> dict:
+    """Summarize a SciPy sparse matrix, from its stored elements.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.spmatrix | scipy.sparse.sparray
+        The sparse matrix to summarize.
+
+    Returns
+    -------
+    dict
+        The shape, dtype, format and density of the matrix, and the statistics of its
+        stored elements.
+    """
+    from math import prod
+
+    size = prod(matrix.shape)
+    summary = {
+        "shape": list(matrix.shape),
+        "dtype": str(matrix.dtype),
+        "format": matrix.format,
+        "nnz": int(matrix.nnz),
+        "density": matrix.nnz / size if size else 0.0,
+    }
+    positions = _sample_positions(len(matrix.data))
+    values = matrix.data if positions is None else matrix.data[positions]
+
+    return _sampling(summary | _summarize_values(values), positions)
+
+
+def summarize_series(series: pandas.Series) -> dict:
+    """Summarize a pandas Series.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        The series to summarize.
+
+    Returns
+    -------
+    dict
+        The length and dtype of the series, and the statistics of its values.
+    """
+    positions = _sample_positions(len(series))
+    values = series if positions is None else series.iloc[positions]
+    summary = {"length": len(series)} | _summarize_column(values)
+
+    return _sampling(summary, positions)
+
+
+def summarize_dataframe(dataframe: pandas.DataFrame) -> dict:
+    """Summarize a pandas DataFrame.
+
+    Parameters
+    ----------
+    dataframe : pandas.DataFrame
+        The dataframe to summarize.
+
+    Returns
+    -------
+    dict
+        The shape of the dataframe, and the summary of each of its columns.
+    """
+    positions = _sample_positions(len(dataframe))
+    values = dataframe if positions is None else dataframe.iloc[positions]
+    summary = {
+        "shape": list(dataframe.shape),
+        "columns": [
+            {"name": _scalar(name)} | _summarize_column(values.iloc[:, i])
+            for i, name in enumerate(dataframe.columns)
+        ],
+    }
+
+    return _sampling(summary, positions)
@@ -5,8 +5,16 @@ from collections.abc import Iterator
 from typing import Any
 
 
+class StorageIsReadOnly(Exception):
+    """Storage was opened in read-only mode and cannot be modified."""
+
+
 class AbstractStorage(ABC):
-    """Persist data in a storage."""
+    """Persist data in a storage.
+
+    Storages which cannot be modified, e.g. opened in read-only mode, raise
+    ``StorageIsReadOnly`` on any attempt to set or delete an item.
+    """
 
     @abstractmethod
     def __getitem__(self, key: str) -> Any:
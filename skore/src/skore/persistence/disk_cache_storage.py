@@ -1,18 +1,189 @@
 """In-memory storage."""
 
+import mmap
+import os
+import pickle
+import sqlite3
+import threading
+import time
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
-from diskcache import Cache
+from diskcache import Cache, Disk
+from diskcache.core import DBNAME, MODE_BINARY, MODE_PICKLE, UNKNOWN
 
-from .abstract_storage import AbstractStorage
+from skore.instrumentation import measure, payload_size
+
+from .abstract_storage import AbstractStorage, StorageIsReadOnly
 
 
 class DirectoryDoesNotExist(Exception):
     """Directory does not exist."""
 
 
+class InstrumentedDisk(Disk):
+    """Disk which measures the encoding and decoding of each value.
+
+    The pickling and file writing of a value are measured as a ``"disk.store"``
+    phase, its file reading and unpickling as a ``"disk.fetch"`` phase; see
+    ``skore.instrumentation``.
+    """
+
+    def store(self, value, read, key=UNKNOWN):
+        """Convert ``value`` to fields of the Cache table, writing files if any."""
+        with measure("disk.store") as event:
+            size, mode, filename, db_value = super().store(value, read, key=key)
+
+            if event is not None:
+                event.key = key if isinstance(key, str) else None
+                event.nbytes = size if filename else payload_size(db_value)
+
+            return size, mode, filename, db_value
+
+    def fetch(self, mode, filename, value, read):
+        """Convert fields from the Cache table to a value, reading files if any."""
+        with measure("disk.fetch") as event:
+            if event is not None:
+                event.nbytes = (
+                    os.path.getsize(os.path.join(self._directory, filename))
+                    if filename
+                    else payload_size(value)
+                )
+
+            return self._fetch(mode, filename, value, read)
+
+    def _fetch(self, mode, filename, value, read):
+        return super().fetch(mode, filename, value, read)
+
+
+class MmapDisk(InstrumentedDisk):
+    """Disk which maps file-backed values into memory instead of reading them.
+
+    Large values are stored by diskcache in their own files. Mapping these files
+    rather than reading them into a private buffer lets every process that reads the
+    same value share the pages of the OS page cache.
+
+    Binary values are returned as read-only ``memoryview`` objects over the mapping;
+    pickled values are unpickled directly from the mapping.
+    """
+
+    def _fetch(self, mode, filename, value, read):
+        if read or filename is None or mode not in (MODE_BINARY, MODE_PICKLE):
+            return super()._fetch(mode, filename, value, read)
+
+        with open(os.path.join(self._directory, filename), "rb") as reader:
+            if os.fstat(reader.fileno()).st_size == 0:
+                # Empty files cannot be mapped
+                return b"" if mode == MODE_BINARY else pickle.load(reader)
+
+            buffer = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mode == MODE_BINARY:
+            # The mapping is closed once the last view over it is released
+            return memoryview(buffer)
+
+        with buffer:
+            return pickle.loads(buffer)
+
+
+class ReadOnlyCache:
+    """
+    Read-only access to a diskcache directory.
+
+    Contrary to ``diskcache.Cache``, opening a ``ReadOnlyCache`` does not create nor
+    alter any table, setting or pragma of the database: the database is opened with
+    SQLite's ``mode=ro`` and ``query_only`` flags, and values are read with a
+    ``MmapDisk``.
+
+    diskcache databases use SQLite's write-ahead log, in which readers never block
+    the writer. Each read is a single statement in autocommit mode, so readers never
+    hold a snapshot open and never prevent the writer from checkpointing.
+
+    Parameters
+    ----------
+    directory : Path
+        The directory of an existing diskcache.
+    mmap_size : int, optional
+        The maximum number of bytes of the database that SQLite maps into memory,
+        by default 256 MiB.
+    """
+
+    def __init__(self, directory: Path, mmap_size: int = 2**28):
+        self.directory = str(directory)
+        self.mmap_size = mmap_size
+        self.disk = MmapDisk(self.directory)
+        self._local = threading.local()
+
+        # Fail early if the database cannot be opened
+        self._con  # noqa: B018
+
+    @property
+    def _con(self) -> sqlite3.Connection:
+        # Connections cannot be shared between threads nor processes
+        pid = os.getpid()
+
+        if getattr(self._local, "pid", None) != pid:
+            self._local.pid = pid
+            self._local.con = None
+
+        if self._local.con is None:
+            path = quote(os.path.join(self.directory, DBNAME))
+            con = sqlite3.connect(
+                f"file:{path}?mode=ro",
+                uri=True,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            con.execute("PRAGMA query_only = ON")
+            con.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+
+            self._local.con = con
+
+        return self._local.con
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the value associated with ``key``, or raise KeyError."""
+        db_key, raw = self.disk.put(key)
+        rows = self._con.execute(
+            "SELECT mode, filename, value FROM Cache"
+            " WHERE key = ? AND raw = ?"
+            " AND (expire_time IS NULL OR expire_time > ?)",
+            (db_key, raw, time.time()),
+        ).fetchall()
+
+        if not rows:
+            raise KeyError(key)
+
+        ((mode, filename, value),) = rows
+
+        try:
+            return self.disk.fetch(mode, filename, value, False)
+        except OSError:
+            # The writer deleted the value between the query and the read
+            raise KeyError(key) from None
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if ``key`` is associated with a value."""
+        db_key, raw = self.disk.put(key)
+        rows = self._con.execute(
+            "SELECT rowid FROM Cache"
+            " WHERE key = ? AND raw = ?"
+            " AND (expire_time IS NULL OR expire_time > ?)",
+            (db_key, raw, time.time()),
+        ).fetchall()
+
+        return bool(rows)
+
+    def iterkeys(self) -> Iterator[str]:
+        """Yield the keys in database sort order."""
+        rows = self._con.execute("SELECT key, raw FROM Cache ORDER BY key, raw")
+
+        for key, raw in rows.fetchall():
+            yield self.disk.get(key, raw)
+
+
 class DiskCacheStorage(AbstractStorage):
     """
     Disk-based storage implementation using diskcache.
@@ -24,14 +195,16 @@ class DiskCacheStorage(AbstractStorage):
     ----------
     directory : Path
         The directory path where the cache will be stored.
+    readonly : bool, optional
+        Whether to open the storage in read-only mode, by default False.
 
     Attributes
     ----------
-    storage : Cache
-        The underlying diskcache Cache object.
+    storage : Cache | ReadOnlyCache
+        The underlying diskcache Cache object, or its read-only counterpart.
     """
 
-    def __init__(self, directory: Path):
+    def __init__(self, directory: Path, readonly: bool = False):
         """
         Initialize the DiskCacheStorage with the specified directory.
 
@@ -39,10 +212,20 @@ class DiskCacheStorage(AbstractStorage):
         ----------
         directory : Path
             The directory path where the cache will be stored.
+        readonly : bool, optional
+            Whether to open the storage in read-only mode, by default False.
+            In read-only mode, the cache is neither created nor set up, and any
+            attempt to modify the storage raises ``StorageIsReadOnly``.
         """
         if not directory.exists():
             raise DirectoryDoesNotExist(f"Directory {directory} does not exist.")
-        self.storage = Cache(directory)
+
+        self.readonly = readonly
+        self.storage = (
+            ReadOnlyCache(directory)
+            if readonly
+            else Cache(directory, disk=InstrumentedDisk)
+        )
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -65,6 +248,22 @@ class DiskCacheStorage(AbstractStorage):
         """
         return self.storage[key]
 
+    def __contains__(self, key: str) -> bool:
+        """
+        Return True if the storage has the specified key, else False.
+
+        Parameters
+        ----------
+        key : str
+            The key to check for existence in the storage.
+
+        Returns
+        -------
+        bool
+            True if the key is in the storage, else False.
+        """
+        return key in self.storage
+
     def __setitem__(self, key: str, value: Any):
         """
         Set an item in the storage.
@@ -75,7 +274,15 @@ class DiskCacheStorage(AbstractStorage):
             The key to associate with the value.
         value : Any
             The value to store.
+
+        Raises
+        ------
+        StorageIsReadOnly
+            If the storage was opened in read-only mode.
         """
+        if self.readonly:
+            raise StorageIsReadOnly(f"Cannot set '{key}' in a read-only storage.")
+
         self.storage[key] = value
 
     def __delitem__(self, key: str):
@@ -91,7 +298,12 @@ class DiskCacheStorage(AbstractStorage):
         ------
         KeyError
             If the key is not found in the storage.
+        StorageIsReadOnly
+            If the storage was opened in read-only mode.
         """
+        if self.readonly:
+            raise StorageIsReadOnly(f"Cannot delete '{key}' from a read-only storage.")
+
         del self.storage[key]
 
     def keys(self) -> Iterator[str]:
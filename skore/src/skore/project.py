@@ -1,22 +1,34 @@
 """Define a Project."""
 
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from copy import deepcopy
 from pathlib import Path
 from typing import Any, Optional, Union
 
+from skore.instrumentation import measure
 from skore.item import (
     CrossValidationItem,
     Item,
     ItemRepository,
     MediaItem,
+    MediaPolicy,
     NumpyArrayItem,
     PandasDataFrameItem,
     PandasSeriesItem,
     PrimitiveItem,
+    ScipySparseMatrixItem,
     SklearnBaseEstimatorItem,
+    media_policy,
     object_to_item,
+    registry,
+)
+from skore.persistence.abstract_storage import StorageIsReadOnly
+from skore.persistence.disk_cache_storage import (
+    DirectoryDoesNotExist,
+    DiskCacheStorage,
 )
-from skore.persistence.disk_cache_storage import DirectoryDoesNotExist, DiskCacheStorage
 from skore.view.view import View
 from skore.view.view_repository import ViewRepository
 
@@ -27,18 +39,67 @@ class ProjectPutError(Exception):
     """One more key-value pairs could not be saved in the Project."""
 
 
+def _gather(futures: list[Future]) -> Future:
+    """Return a future done when all ``futures`` are, failing if any of them fails."""
+    gathered: Future = Future()
+    remaining = len(futures)
+    lock = threading.Lock()
+
+    def on_done(_):
+        nonlocal remaining
+
+        with lock:
+            remaining -= 1
+            if remaining:
+                return
+
+        exception = next(
+            (f.exception() for f in futures if f.exception() is not None), None
+        )
+
+        if exception is None:
+            gathered.set_result(None)
+        else:
+            gathered.set_exception(exception)
+
+    if not futures:
+        gathered.set_result(None)
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+    return gathered
+
+
 class Project:
     """A project is a collection of items that are stored in a storage."""
 
+    # The number of threads converting and storing values put in the background
+    BACKGROUND_WORKERS = 4
+
     def __init__(
         self,
         item_repository: ItemRepository,
         view_repository: ViewRepository,
+        media_policy: Optional[MediaPolicy] = None,
     ):
         self.item_repository = item_repository
         self.view_repository = view_repository
 
-    def put(self, key: Union[str, dict[str, Any]], value: Optional[Any] = None):
+        # How figures and images are converted to media, unless specified per put
+        self.media_policy = media_policy or MediaPolicy()
+
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__pending: dict[str, Future] = {}
+        self.__pending_lock = threading.Lock()
+
+    def put(
+        self,
+        key: Union[str, dict[str, Any]],
+        value: Optional[Any] = None,
+        background: bool = False,
+        media_policy: Optional[MediaPolicy] = None,
+    ) -> Optional[Future]:
         """Add one or more key-value pairs to the Project.
 
         If ``key`` is a string, then `put` adds the single ``key``-``value`` pair
@@ -75,19 +136,44 @@ class Project:
         value : Any, optional
             The value to associate with ``key`` in the Project.
             If ``key`` is a dict, this argument is ignored.
+        background : bool, optional
+            Whether to convert and store the value(s) in the background, by default
+            False; see :meth:`~skore.Project.put_one`. With a dict, all the
+            key-value pairs are then attempted, even if one of them fails.
+        media_policy : MediaPolicy, optional
+            How to convert figures and images, by default the ``media_policy`` of
+            the Project; see :meth:`~skore.Project.put_one`.
+
+        Returns
+        -------
+        Future | None
+            If ``background`` is True, a future done once all the key-value pairs
+            are stored, which raises the error of the first one which could not be.
 
         Raises
         ------
         ProjectPutError
             If the key-value pair(s) cannot be saved properly.
         """
-        if isinstance(key, dict):
-            for key_, value in key.items():
-                self.put_one(key_, value)
-        else:
-            self.put_one(key, value)
+        if not isinstance(key, dict):
+            return self.put_one(
+                key, value, background=background, media_policy=media_policy
+            )
+
+        futures = [
+            self.put_one(key_, value_, background=background, media_policy=media_policy)
+            for key_, value_ in key.items()
+        ]
+
+        return _gather(futures) if background else None
 
-    def put_one(self, key: str, value: Any):
+    def put_one(
+        self,
+        key: str,
+        value: Any,
+        background: bool = False,
+        media_policy: Optional[MediaPolicy] = None,
+    ) -> Optional[Future]:
         """Add a key-value pair to the Project.
 
         Parameters
@@ -96,20 +182,153 @@ class Project:
             The key to associate with ``value`` in the Project. Must be a string.
         value : Any
             The value to associate with ``key`` in the Project.
+        background : bool, optional
+            Whether to convert and store the value in the background, by default
+            False.
+
+            The value is then copied with ``copy.deepcopy``, so that it can be
+            modified as soon as ``put_one`` returns, and handed to a pool of
+            ``BACKGROUND_WORKERS`` threads, which run the costly conversion to an
+            item, e.g. the serialization of an estimator or of a figure, and store
+            it. Values which cannot be copied are converted right away, and only
+            stored in the background.
+
+            The puts of a key are stored in the order they are made, including
+            the puts made in the foreground; puts of different keys are not
+            ordered. See :meth:`~skore.Project.flush` to wait for all of them.
+        media_policy : MediaPolicy, optional
+            How to convert figures and images, by default the ``media_policy`` of
+            the Project: e.g. whether to rasterize figures, at which resolution,
+            the size of their thumbnail, or how to encode Plotly figures.
+
+        Returns
+        -------
+        Future | None
+            If ``background`` is True, a future done once the value is stored,
+            whose ``result()`` raises ``ProjectPutError`` if it could not be.
 
         Raises
         ------
         ProjectPutError
-            If the key-value pair cannot be saved properly.
+            If the key-value pair cannot be saved properly, e.g. if the Project was
+            loaded in read-only mode.
         """
+        # Invalid keys are rejected right away, before the value is converted
+        if not isinstance(key, str):
+            raise ProjectPutError(
+                "Key-value pair could not be inserted in the Project"
+            ) from TypeError(
+                f"Key must be a string; key '{key}' is of type '{type(key)}'"
+            )
+
+        policy = media_policy or self.media_policy
+
+        if background:
+            return self.__put_in_background(key, value, policy)
+
+        # Keep the order of the puts of ``key`` made in the background
+        with self.__pending_lock:
+            previous = self.__pending.get(key)
+
+        if previous is not None:
+            wait([previous])
+
+        self.__put(key, value, policy)
+        return None
+
+    def __put_in_background(self, key: str, value: Any, policy: MediaPolicy) -> Future:
         try:
-            item = object_to_item(value)
-            self.put_item(key, item)
+            snapshot, item = deepcopy(value), None
+        except Exception:
+            snapshot, item = None, self.__to_item(key, value, policy)
+
+        def task(previous: Optional[Future]):
+            if previous is not None:
+                wait([previous])
+
+            self.__put(key, snapshot, policy, item)
+
+        with self.__pending_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.BACKGROUND_WORKERS,
+                    thread_name_prefix="skore-put",
+                )
+
+            # The executor runs tasks in submission order: ``previous`` has always
+            # started before ``future``, which therefore cannot wait forever
+            future = self.__executor.submit(task, self.__pending.get(key))
+            self.__pending[key] = future
+
+        def forget(future: Future):
+            with self.__pending_lock:
+                if self.__pending.get(key) is future:
+                    del self.__pending[key]
+
+        future.add_done_callback(forget)
+
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the values put in the background to be stored.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum number of seconds to wait, by default no limit.
+
+        Returns
+        -------
+        bool
+            True if all the values are stored, False if ``timeout`` expired before.
+        """
+        with self.__pending_lock:
+            pending = list(self.__pending.values())
+
+        # The last put of each key waits for the previous ones
+        _, not_done = wait(pending, timeout=timeout)
+
+        return not not_done
+
+    def __to_item(self, key: str, value: Any, policy: MediaPolicy) -> Item:
+        try:
+            with media_policy(policy), measure("object_to_item", key=key) as event:
+                item = object_to_item(value)
+
+                if event is not None:
+                    event.item_type = type(item).__name__
+
+                return item
         except (NotImplementedError, TypeError) as e:
             raise ProjectPutError(
                 "Key-value pair could not be inserted in the Project"
             ) from e
 
+    def __store(self, key: str, item: Item):
+        try:
+            self.put_item(key, item)
+        except (TypeError, ValueError, StorageIsReadOnly) as e:
+            raise ProjectPutError(
+                "Key-value pair could not be inserted in the Project"
+            ) from e
+
+    def __put(
+        self,
+        key: str,
+        value: Any,
+        policy: MediaPolicy,
+        item: Optional[Item] = None,
+    ):
+        """Store ``value``, unless already converted to ``item``."""
+        with measure("put", key=key) as event:
+            if item is None:
+                item = self.__to_item(key, value, policy)
+
+            if event is not None:
+                event.item_type = type(item).__name__
+
+            self.__store(key, item)
+
     def put_item(self, key: str, item: Item):
         """Add an Item to the Project."""
         if not isinstance(key, str):
@@ -119,35 +338,84 @@ class Project:
 
         self.item_repository.put_item(key, item)
 
-    def get(self, key: str) -> Any:
+    def get(self, key: str, copy: bool = True, lazy: bool = False) -> Any:
         """Get the value corresponding to ``key`` from the Project.
 
         Parameters
         ----------
         key : str
             The key corresponding to the item to get.
+        copy : bool, optional
+            Whether to return a copy of the value, by default True.
+            If False, NumPy arrays, SciPy sparse matrices, and the columns of pandas
+            DataFrames and Series of NumPy dtype, are returned as read-only views over
+            the buffers given by the storage, without copying their data. With a
+            read-only project, large buffers are memory mappings shared between all
+            the processes reading them.
+
+            Views cannot be written to: in-place modifications raise a
+            ``ValueError``. A view keeps its buffer alive for as long as it is
+            referenced, independently of the project: it remains valid even after
+            the item is deleted or overwritten. Values of other types are always
+            copies.
+        lazy : bool, optional
+            Whether to load large values, stored in chunks, lazily, by default False.
+            Large NumPy arrays are then returned as a
+            :class:`~skore.item.chunked_array.ChunkedArray`: indexing it, e.g.
+            ``project.get(key, lazy=True)[i:j, columns]``, only loads the chunks
+            overlapping the selection, while ``numpy.asarray`` loads the whole
+            array. Large files are returned as a read-only binary stream, which
+            loads one chunk at a time; see :meth:`~skore.item.MediaItem.media_stream`.
+            Otherwise, they are entirely loaded, as arrays and bytes.
+
+        Returns
+        -------
+        Any
+            The value.
 
         Raises
         ------
         KeyError
             If the key does not correspond to any item.
         """
-        item = self.get_item(key)
+        with measure("get", key=key) as event:
+            item = self.get_item(key)
+            item_type = type(item).__name__
 
+            if event is not None:
+                event.item_type = item_type
+
+            with measure("decode", key=key, item_type=item_type):
+                return self.__decode(item, copy, lazy)
+
+    @staticmethod
+    def __decode(item: Item, copy: bool, lazy: bool = False) -> Any:
         if isinstance(item, PrimitiveItem):
             return item.primitive
         elif isinstance(item, NumpyArrayItem):
-            return item.array
+            if item.array_chunks is not None and lazy:
+                return item.chunked_array
+            return item.array if copy else item.array_view
         elif isinstance(item, PandasDataFrameItem):
-            return item.dataframe
+            return item.dataframe if copy else item.dataframe_view
         elif isinstance(item, PandasSeriesItem):
-            return item.series
+            return item.series if copy else item.series_view
+        elif isinstance(item, ScipySparseMatrixItem):
+            return item.matrix if copy else item.matrix_view
         elif isinstance(item, SklearnBaseEstimatorItem):
             return item.estimator
         elif isinstance(item, CrossValidationItem):
+            if item.cv_indices is not None:
+                return {**item.cv_results_serialized, "indices": item.cv_indices}
             return item.cv_results_serialized
         elif isinstance(item, MediaItem):
+            if item.media_chunks is not None and lazy:
+                return item.media_stream()
+            if item.media_chunks is not None:
+                return b"".join(item.media_chunks)
             return item.media_bytes
+        elif type(item) in registry.decoders:
+            return registry.decoders[type(item)](item, copy)
         else:
             raise ValueError(f"Item {item} is not a known item type.")
 
@@ -171,6 +439,50 @@ class Project:
         """
         return self.item_repository.get_item(key)
 
+    def get_summary(self, key: str) -> Optional[dict]:
+        """Get the summary statistics of the value corresponding to ``key``.
+
+        Summaries are computed when NumPy arrays, SciPy sparse matrices, pandas
+        Series and DataFrames are put in the Project. They hold their shape, dtypes,
+        and per-column number of nulls, minimum, maximum, mean, standard deviation
+        and quartiles, or number of unique values; for sparse matrices, their format,
+        number of stored elements and density, and the statistics of the stored
+        elements. Inputs too large to be summarized exactly are summarized from
+        a uniform random sample, whose size is then given by ``"sample_size"``.
+
+        The value itself is neither loaded nor decoded.
+
+        Parameters
+        ----------
+        key : str
+            The key corresponding to the item to summarize.
+
+        Returns
+        -------
+        dict | None
+            The summary statistics, or None for values of other types.
+
+        Raises
+        ------
+        KeyError
+            If the key does not correspond to any item.
+
+        Examples
+        --------
+        >>> import numpy
+        >>> from skore.item import ItemRepository
+        >>> from skore.persistence.in_memory_storage import InMemoryStorage
+        >>> from skore.view.view_repository import ViewRepository
+        >>> project = Project(
+        ...     ItemRepository(InMemoryStorage()), ViewRepository(InMemoryStorage())
+        ... )
+        >>> project.put("array", numpy.array([1, 2, 3]))
+        >>> summary = project.get_summary("array")
+        >>> summary["shape"], summary["min"], summary["max"], summary["mean"]
+        ([3], 1, 3, 2.0)
+        """
+        return self.item_repository.get_item_summary(key)
+
     def get_item_versions(self, key: str) -> list[Item]:
         """
         Get all the versions of an item associated with ``key`` from the Project.
@@ -207,6 +519,9 @@ class Project:
     def delete_item(self, key: str):
         """Delete the item corresponding to ``key`` from the Project.
 
+        The large binary contents of the item, e.g. the bytes of its arrays, are kept
+        on disk until :meth:`vacuum` is called.
+
         Parameters
         ----------
         key : str
@@ -216,11 +531,54 @@ class Project:
         ------
         KeyError
             If the key does not correspond to any item.
+        StorageIsReadOnly
+            If the Project was loaded in read-only mode. Contrary to :meth:`put`,
+            which wraps it in a ``ProjectPutError``, the error is raised as is.
         """
         self.item_repository.delete_item(key)
 
+    def vacuum(self, derived: bool = False) -> int:
+        """Delete the large binary contents which no item refers to any more.
+
+        These contents are stored apart, shared by the items with the same content:
+        they are thus neither deleted with items nor with their previous versions.
+        This must not be called while another process puts items in the Project.
+
+        Parameters
+        ----------
+        derived : bool, optional
+            Whether to delete the cached contents too, by default False: the results
+            cached by :func:`skore.cross_validate`, the results of the folds of its
+            interrupted runs, and the representations of the items.
+
+        Returns
+        -------
+        int
+            The number of deleted contents.
+
+        Raises
+        ------
+        StorageIsReadOnly
+            If there are contents to delete and the Project was loaded in read-only
+            mode.
+        """
+        return self.item_repository.vacuum(derived)
+
     def put_view(self, key: str, view: View):
-        """Add a view to the Project."""
+        """Add a view to the Project.
+
+        Parameters
+        ----------
+        key : str
+            The key to associate with ``view`` in the Project.
+        view : View
+            The view to add.
+
+        Raises
+        ------
+        StorageIsReadOnly
+            If the Project was loaded in read-only mode.
+        """
         self.view_repository.put_view(key, view)
 
     def get_view(self, key: str) -> View:
@@ -255,6 +613,8 @@ class Project:
         ------
         KeyError
             If the key does not correspond to any view.
+        StorageIsReadOnly
+            If the Project was loaded in read-only mode.
         """
         return self.view_repository.delete_view(key)
 
@@ -273,8 +633,30 @@ class ProjectLoadError(Exception):
     """Failed to load project."""
 
 
-def load(project_name: Union[str, Path]) -> Project:
-    """Load an existing Project given a project name or path."""
+def load(project_name: Union[str, Path], readonly: bool = False) -> Project:
+    """Load an existing Project given a project name or path.
+
+    Parameters
+    ----------
+    project_name : Path-like
+        The name or path of the project to load.
+    readonly : bool, optional
+        Whether to load the project in read-only mode, by default False.
+        Read-only projects skip all the write-side setup of the storage and map large
+        values into memory, so that any number of reader processes can share a
+        project with a single writer without ever blocking it. Any attempt to modify
+        a read-only project raises an exception.
+
+    Returns
+    -------
+    Project
+        The loaded project.
+
+    Raises
+    ------
+    ProjectLoadError
+        If the project does not exist or is corrupted.
+    """
     # Transform a project name to a directory path:
     # - Resolve relative path to current working directory,
     # - Check that the file ends with the ".skore" extension,
@@ -291,9 +673,24 @@ def load(project_name: Union[str, Path]) -> Project:
 
     try:
         # FIXME should those hardcoded string be factorized somewhere ?
-        item_storage = DiskCacheStorage(directory=Path(path) / "items")
-        item_repository = ItemRepository(storage=item_storage)
-        view_storage = DiskCacheStorage(directory=Path(path) / "views")
+        item_storage = DiskCacheStorage(
+            directory=Path(path) / "items", readonly=readonly
+        )
+        # Projects created before the blob storage was introduced lack its directory
+        blob_directory = Path(path) / "blobs"
+        if not readonly:
+            blob_directory.mkdir(exist_ok=True)
+        blob_storage = (
+            DiskCacheStorage(directory=blob_directory, readonly=readonly)
+            if blob_directory.exists()
+            else None
+        )
+        item_repository = ItemRepository(
+            storage=item_storage, blob_storage=blob_storage
+        )
+        view_storage = DiskCacheStorage(
+            directory=Path(path) / "views", readonly=readonly
+        )
         view_repository = ViewRepository(storage=view_storage)
         project = Project(
             item_repository=item_repository,
@@ -6,13 +6,30 @@ function in order to enrich it with more information and enable more analysis.
 """
 
 import contextlib
-from typing import Literal, Optional
+import functools
+import hashlib
+import uuid
+from collections.abc import Hashable
+from typing import Any, Callable, Literal, Optional
+
+from skore.item.cross_validation_item import CrossValidationItem
+from skore.item.sklearn_base_estimator_item import estimator_fingerprint
+from skore.project import Project
 
-from skore.item.cross_validation_item import (
-    CrossValidationAggregationItem,
-    CrossValidationItem,
+# The prefix of the key of the results of the completed folds, followed by the id of
+# the run, while cross-validating incrementally
+INCREMENTAL_KEY = "cross_validation_in_progress"
+
+# The arguments of scikit-learn's cross_validate which do not change its results
+NON_RESULT_ARGUMENTS = (
+    "estimator",
+    "X",
+    "y",
+    "groups",
+    "n_jobs",
+    "verbose",
+    "pre_dispatch",
 )
-from skore.project import Project
 
 
 def _find_ml_task(
@@ -166,6 +183,264 @@ def _add_scorers(scorers, scorers_to_add):
     return new_scorers, added_scorers
 
 
+def _share_predictions(estimator, scorers):
+    """Make the default score of `scorers` share the predictions of the others.
+
+    scikit-learn computes the predictions of an estimator once per fold for all
+    its built-in scorers, e.g. "recall" and "precision" share ``predict``, and
+    "roc_auc" and "neg_brier_score" share ``predict_proba``. The default
+    ``estimator.score`` of classifiers and regressors predicts on its own: it is
+    replaced by the equivalent "accuracy" or "r2" scorer. User-defined callables
+    are left as is.
+
+    Parameters
+    ----------
+    estimator : sklearn.base.BaseEstimator
+        An estimator.
+    scorers : dict or callable
+        The scorers, as returned by `_add_scorers`.
+
+    Returns
+    -------
+    new_scorers : dict or callable
+        The scorers, of the same type.
+    """
+    from sklearn.base import ClassifierMixin, RegressorMixin
+
+    if callable(scorers):
+        return scorers
+
+    default_scoring = {
+        ClassifierMixin.score: "accuracy",
+        RegressorMixin.score: "r2",
+    }.get(getattr(type(estimator), "score", None))
+
+    return {name: default_scoring if s is None else s for name, s in scorers.items()}
+
+
+def _estimator_classes(estimator) -> list[tuple[str, Optional[str]]]:
+    """Identify the classes of an estimator and of its nested estimators.
+
+    Classes are pickled by name only: each is identified by its name, and by the
+    version of its package or, if it has none, e.g. in a script, by its source code.
+
+    Parameters
+    ----------
+    estimator : sklearn.base.BaseEstimator
+        The estimator.
+
+    Returns
+    -------
+    list[tuple[str, str | None]]
+        The name and version, or source code, of each class, None if unknown.
+    """
+    import inspect
+    import sys
+
+    estimators = [estimator] + [
+        value
+        for value in estimator.get_params(deep=True).values()
+        if hasattr(value, "get_params") and not isinstance(value, type)
+    ]
+    classes = []
+
+    for cls in dict.fromkeys(type(estimator) for estimator in estimators):
+        package = sys.modules.get(cls.__module__.partition(".")[0])
+        version = getattr(package, "__version__", None)
+
+        if version is None:
+            with contextlib.suppress(OSError, TypeError):
+                version = inspect.getsource(cls)
+
+        classes.append((f"{cls.__module__}.{cls.__qualname__}", version))
+
+    return classes
+
+
+def _cross_validation_fingerprint(
+    estimator,
+    data_info: tuple[dict, Optional[dict]],
+    splits: list,
+    scoring,
+    kwargs: dict,
+) -> Optional[str]:
+    """Return a digest of the inputs of a cross-validation.
+
+    Parameters
+    ----------
+    estimator : sklearn.base.BaseEstimator
+        An estimator, whose classes and parameters are digested, not its fitted
+        state; see :func:`_estimator_classes`.
+    data_info : tuple[dict, dict | None]
+        The description of the data and target, with their fingerprints; see
+        :meth:`CrossValidationItem.describe_data`.
+    splits : list
+        The train and test indices of each split.
+    scoring : any type that is accepted by scikit-learn's cross_validate
+        The scorers of the user.
+    kwargs : dict
+        The other arguments of scikit-learn's cross_validate.
+
+    Returns
+    -------
+    str | None
+        The SHA-256 hexdigest, or None if an input cannot be pickled, e.g. a
+        lambda scorer.
+    """
+    import sklearn
+    from sklearn.base import clone
+
+    # The splits are digested instead of the splitter
+    arguments = {
+        k: v for k, v in kwargs.items() if k not in NON_RESULT_ARGUMENTS and k != "cv"
+    }
+    inputs = estimator_fingerprint(
+        (
+            sklearn.__version__,
+            _estimator_classes(estimator),
+            clone(estimator),
+            splits,
+            scoring,
+            arguments,
+        )
+    )
+
+    if inputs is None:
+        return None
+
+    X_info, y_info = data_info
+    X_fingerprint = X_info["hash"]
+    y_fingerprint = None if y_info is None else y_info["hash"]
+
+    return hashlib.sha256(
+        f"{inputs}:{X_fingerprint}:{y_fingerprint}".encode()
+    ).hexdigest()
+
+
+def _concatenate_cv_results(fold_results: list[dict]) -> dict:
+    """Concatenate the results of scikit-learn's cross_validate on successive folds.
+
+    Parameters
+    ----------
+    fold_results : list[dict]
+        Dicts of the form returned by scikit-learn's cross_validate function, each
+        on one or several folds.
+
+    Returns
+    -------
+    dict
+        A dict of the same form, on all the folds.
+    """
+    import numpy
+
+    cv_results: dict[str, Any] = {}
+
+    for k, v in fold_results[0].items():
+        values = [results[k] for results in fold_results]
+
+        if k == "indices":
+            cv_results[k] = {
+                name: [array for indices in values for array in indices[name]]
+                for name in ("train", "test")
+            }
+        elif isinstance(v, numpy.ndarray):
+            cv_results[k] = numpy.concatenate(values)
+        else:
+            cv_results[k] = [value for fold_values in values for value in fold_values]
+
+    return cv_results
+
+
+def _cross_validate_incrementally(
+    project: Project,
+    compute_fold: Callable[[tuple], dict],
+    splits: list,
+    key: str,
+    folds_fingerprint: Optional[str],
+    estimator,
+    X,
+    y,
+    data_info: tuple[dict, Optional[dict]],
+) -> dict:
+    """Cross-validate one fold after the other, storing the results as they come.
+
+    After each fold, the results of the completed folds are put in ``project`` under
+    ``key``, which is deleted once all the folds are completed.
+
+    Unless ``folds_fingerprint`` is None, the results of each fold are also stored
+    as derived values, keyed by ``folds_fingerprint`` and the index of the fold: if
+    the cross-validation is interrupted, calling it again with the same inputs only
+    computes the remaining folds. Once all the folds are completed, their results
+    are deleted: the caller caches the results of all the folds, if need be.
+
+    Parameters
+    ----------
+    project : Project
+        The project to store the results into.
+    compute_fold : Callable[[tuple], dict]
+        The function cross-validating on one split, the train and test indices.
+    splits : list
+        The train and test indices of each split.
+    key : str
+        The key of the results of the completed folds in ``project``.
+    folds_fingerprint : str, optional
+        The fingerprint under which the results of the folds are stored, or None if
+        they are not stored, in which case folds are always computed.
+    estimator : sklearn.base.BaseEstimator
+        The estimator that is cross-validated.
+    X
+        The data, input of scikit-learn's cross_validation function.
+    y
+        The target, input of scikit-learn's cross_validation function.
+    data_info : tuple[dict, dict | None]
+        The description of ``X`` and ``y``, which are thus not fingerprinted again
+        after each fold.
+
+    Returns
+    -------
+    dict
+        A dict of the form returned by scikit-learn's cross_validate function.
+    """
+    fold_results = []
+
+    for fold, split in enumerate(splits):
+        if folds_fingerprint is None:
+            fold_results.append(compute_fold(split))
+        else:
+            fold_results.append(
+                project.item_repository.get_derived(
+                    "cross_validate_fold",
+                    f"{folds_fingerprint}:{fold}",
+                    functools.partial(compute_fold, split),
+                )
+            )
+
+        # Only the latest results are kept, whatever the number of folds
+        with contextlib.suppress(KeyError):
+            project.delete_item(key)
+
+        project.put_item(
+            key,
+            CrossValidationItem.factory(
+                _concatenate_cv_results(fold_results),
+                estimator,
+                X,
+                y,
+                data_info=data_info,
+            ),
+        )
+
+    project.delete_item(key)
+
+    if folds_fingerprint is not None:
+        for fold in range(len(splits)):
+            project.item_repository.delete_derived(
+                "cross_validate_fold", f"{folds_fingerprint}:{fold}"
+            )
+
+    return _concatenate_cv_results(fold_results)
+
+
 def _strip_cv_results_scores(cv_results: dict, added_scorers: list[str]) -> dict:
     """Remove information about `added_scorers` in `cv_results`.
 
@@ -189,7 +464,17 @@ def _strip_cv_results_scores(cv_results: dict, added_scorers: list[str]) -> dict
     }
 
 
-def cross_validate(*args, project: Optional[Project] = None, **kwargs) -> dict:
+def cross_validate(
+    *args,
+    project: Optional[Project] = None,
+    plot: bool = True,
+    cache: bool = False,
+    incremental: bool = False,
+    run_id: Optional[str] = None,
+    fingerprint_sample_size: Optional[int] = None,
+    fingerprint_version: Optional[Hashable] = None,
+    **kwargs,
+) -> dict:
     """Evaluate estimator by cross-validation and output UI-friendly object.
 
     This function wraps scikit-learn's :func:`~sklearn.model_selection.cross_validate`
@@ -209,6 +494,45 @@ def cross_validate(*args, project: Optional[Project] = None, **kwargs) -> dict:
         such as ``estimator`` and ``X``.
     project : Project, optional
         A project to save cross-validation data into. If None, no save is performed.
+    plot : bool, optional
+        Whether to display a plot of the results in IPython contexts, e.g. Jupyter
+        notebooks, by default True. The plot is only built when displayed, or when
+        requested from the saved item: in batch jobs, set ``plot=False`` so that it
+        is never built.
+    cache : bool, optional
+        Whether to reuse the results of a previous call with the same estimator
+        parameters, data, target, splits, scoring and other arguments, stored in
+        ``project``, by default False. Results are only stored if the project has a
+        blob storage, as projects loaded with :func:`skore.load`. They are not
+        reused if an input cannot be pickled, e.g. a lambda scorer. They are
+        deleted by ``project.vacuum(derived=True)``.
+
+        The splits are computed before looking the results up: with a splitter
+        whose ``random_state`` is None, results are thus only reused if it draws
+        the same splits. Likewise, set the ``random_state`` of the estimator for
+        its results to be deterministic.
+    incremental : bool, optional
+        Whether to cross-validate one fold after the other, by default False. The
+        results of the completed folds are then put in ``project`` after each fold,
+        under the key ``"cross_validation_in_progress/<run_id>"``, so that they can
+        be followed in the UI; the key is deleted once all the folds are completed.
+        As folds are not run in parallel, ``n_jobs`` should be left to its default.
+    run_id : str, optional
+        The id of the run, when cross-validating incrementally, by default a random
+        one. If it is given and the project has a blob storage, the results of each
+        fold are stored: after an interruption, calling this function again with
+        the same ``run_id`` and inputs only computes the remaining folds. They are
+        deleted once all the folds are completed.
+    fingerprint_sample_size : int, optional
+        The number of rows from which ``X`` and ``y`` are fingerprinted, if they
+        have more, by default None, i.e. all the rows; see
+        :func:`skore.item.fingerprint.fingerprint`. Large datasets are then
+        fingerprinted much faster, but cached results are reused even if only
+        rows which are not sampled changed.
+    fingerprint_version : Hashable, optional
+        The version of ``X`` and ``y``, e.g. a counter incremented whenever they
+        are modified in place, by default None. Their fingerprints are then
+        memoized, and only computed once for successive calls.
     **kwargs
         Additional keyword arguments accepted by scikit-learn's
         :func:`~sklearn.model_selection.cross_validate`.
@@ -236,6 +560,15 @@ def cross_validate(*args, project: Optional[Project] = None, **kwargs) -> dict:
     """
     import sklearn.model_selection
 
+    if cache and project is None:
+        raise ValueError("Results can only be cached in a project.")
+    if incremental and project is None:
+        raise ValueError("Results can only be stored incrementally in a project.")
+    if run_id is not None and not incremental:
+        raise ValueError(
+            "A run id can only be given when cross-validating incrementally."
+        )
+
     # Recover specific arguments
     estimator = args[0] if len(args) >= 1 else kwargs.get("estimator")
     X = args[1] if len(args) >= 2 else kwargs.get("X")
@@ -250,32 +583,85 @@ def cross_validate(*args, project: Optional[Project] = None, **kwargs) -> dict:
     scorers_to_add = _get_scorers_to_add(estimator, y)
     new_scorers, added_scorers = _add_scorers(scorers, scorers_to_add)
 
-    cv_results = sklearn.model_selection.cross_validate(
-        *args, **kwargs, scoring=new_scorers
+    shared_scorers = _share_predictions(estimator, new_scorers)
+
+    def compute_fold(split: tuple) -> dict:
+        return sklearn.model_selection.cross_validate(
+            *args, **(kwargs | {"cv": [split]}), scoring=shared_scorers
+        )
+
+    # The data and target are only fingerprinted once, however many items describe
+    # them
+    data_info = CrossValidationItem.describe_data(
+        X, y, fingerprint_sample_size, fingerprint_version
     )
 
-    cross_validation_item = CrossValidationItem.factory(cv_results, estimator, X, y)
+    def compute_cv_results() -> dict:
+        if incremental:
+            # Folds are stored to resume an explicit run, or to be reused
+            if cv_results_fingerprint is None or (run_id is None and not cache):
+                folds_fingerprint = None
+            elif cache:
+                folds_fingerprint = cv_results_fingerprint
+            else:
+                folds_fingerprint = f"{run_id}:{cv_results_fingerprint}"
+
+            return _cross_validate_incrementally(
+                project,
+                compute_fold,
+                splits,
+                f"{INCREMENTAL_KEY}/{run_id or uuid.uuid4().hex}",
+                folds_fingerprint,
+                estimator,
+                X,
+                y,
+                data_info,
+            )
+
+        return sklearn.model_selection.cross_validate(
+            *args, **kwargs, scoring=shared_scorers
+        )
+
+    cv_results_fingerprint = None
 
-    if project is not None:
-        try:
-            cv_results_history = project.get_item_versions("cross_validation")
-        except KeyError:
-            cv_results_history = []
+    if cache or incremental:
+        from sklearn.base import is_classifier
 
-        agg_cross_validation_item = CrossValidationAggregationItem.factory(
-            cv_results_history + [cross_validation_item]
+        # The splits are drawn once, and used both as input of the fingerprint and
+        # of the cross-validation, in case the splitter is not deterministic
+        splits = list(
+            sklearn.model_selection.check_cv(
+                kwargs.get("cv"), y, classifier=is_classifier(estimator)
+            ).split(X, y, kwargs.get("groups"))
+        )
+        kwargs["cv"] = splits
+        cv_results_fingerprint = _cross_validation_fingerprint(
+            estimator, data_info, splits, scorers, kwargs
         )
 
-        project.put_item("cross_validation_aggregated", agg_cross_validation_item)
+    if cv_results_fingerprint is None or not cache:
+        cv_results = compute_cv_results()
+    else:
+        cv_results = project.item_repository.get_derived(
+            "cross_validate", cv_results_fingerprint, compute_cv_results
+        )
+
+    cross_validation_item = CrossValidationItem.factory(
+        cv_results, estimator, X, y, data_info=data_info
+    )
+
+    if project is not None:
+        # The aggregation of the runs is built on read, from the versions of this key
         project.put_item("cross_validation", cross_validation_item)
 
     # If in a IPython context (e.g. Jupyter notebook), display the plot
-    with contextlib.suppress(ImportError):
-        from IPython.core.interactiveshell import InteractiveShell
-        from IPython.display import display
+    if plot:
+        with contextlib.suppress(ImportError):
+            from IPython.core.interactiveshell import InteractiveShell
+            from IPython.display import display
 
-        if InteractiveShell.initialized():
-            display(cross_validation_item.plot)
+            if InteractiveShell.initialized():
+                display(cross_validation_item.plot)
 
     # Remove information related to our scorers, so that our return value is
     # the same as sklearn's
@@ -8,7 +8,9 @@ from fastapi.staticfiles import StaticFiles
 from starlette.types import Lifespan
 
 from skore.project import Project, load
+from skore.ui import metrics
 from skore.ui.dependencies import get_static_path
+from skore.ui.project_routes import SerializedItemCache
 from skore.ui.project_routes import router as project_router
 
 
@@ -16,7 +18,11 @@ def create_app(
     project: Optional[Project] = None, lifespan: Optional[Lifespan] = None
 ) -> FastAPI:
     """FastAPI factory used to create the API to interact with `stores`."""
-    app = FastAPI(lifespan=lifespan)
+    # Monitor the server, exposing the metrics on `GET /metrics`
+    registry = metrics.Registry()
+    app = FastAPI(lifespan=metrics.lifespan(registry, lifespan))
+    app.state.metrics = registry
+    app.state.serialized_item_cache = SerializedItemCache(metrics=registry)
 
     # Give the app access to the project
     if not project:
@@ -33,6 +39,9 @@ def create_app(
         allow_headers=["*"],
     )
 
+    # Added last, to wrap all the other middlewares
+    app.add_middleware(metrics.MetricsMiddleware, registry=registry)
+
     # Include routers from bottom to top.
     # Include routers always after all routes have been defined/imported.
     router = APIRouter(prefix="/api")
@@ -40,6 +49,7 @@ def create_app(
 
     # Include all sub routers.
     app.include_router(router)
+    app.include_router(metrics.router)
 
     # Mount skore-ui from the static directory.
     # Should be after the API routes to avoid shadowing previous routes.
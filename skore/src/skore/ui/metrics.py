@@ -0,0 +1,344 @@
+"""Monitoring metrics of the skore-ui server, in the Prometheus text format.
+
+The metrics are collected in-process and exposed on ``GET /metrics``, following
+the Prometheus text exposition format (version 0.0.4), so that they can be scraped
+without any external dependency:
+
+- ``skore_ui_requests_total``: the number of requests, per route, method and status,
+- ``skore_ui_request_duration_seconds``: the latency of requests, per route and
+  method,
+- ``skore_ui_response_bytes_total``: the number of bytes sent, per route and method,
+- ``skore_ui_serialization_duration_seconds``: the time spent serializing the
+  project, per route,
+- ``skore_ui_serialized_item_cache_{hits,misses}_total``: the efficiency of the
+  cache of serialized items,
+- ``skore_ui_storage_read_duration_seconds``: the latency of storage reads,
+  measured with :mod:`skore.instrumentation`.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Request, Response
+from fastapi.routing import APIRoute
+
+from skore import instrumentation
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Lifespan, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default buckets of the official Prometheus clients, suited to HTTP latencies
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+# Storage reads are orders of magnitude faster than a request
+STORAGE_BUCKETS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """Base class of the metrics, identified by a name and a set of label names."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.lock = threading.Lock()
+
+    def _labels(self, labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.labelnames}, "
+                f"got {tuple(labels)}."
+            )
+
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+    def samples(self):
+        """Yield the ``(suffix, labels, value)`` of each sample of the metric."""
+        raise NotImplementedError
+
+    def expose(self) -> str:
+        """Return the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type}",
+        ]
+
+        for suffix, labels, value in self.samples():
+            lines.append(
+                f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        """Increment the counter of ``labels`` by ``amount``."""
+        if amount < 0:
+            raise ValueError("Counters can only be incremented.")
+
+        key = self._labels(labels)
+
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """Return the value of the counter of ``labels``."""
+        return self.values.get(self._labels(labels), 0)
+
+    def samples(self):
+        """Yield the ``(suffix, labels, value)`` of each sample of the metric."""
+        with self.lock:
+            values = sorted(self.values.items())
+
+        for labels, value in values:
+            yield "", labels, value
+
+
+class Histogram(Metric):
+    """A distribution of observations, counted in cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [count per bucket, including +Inf], sum
+        self.values: dict[tuple, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        """Record the observation ``value`` in the histogram of ``labels``."""
+        key = self._labels(labels)
+        index = bisect_left(self.buckets, value)
+
+        with self.lock:
+            if key not in self.values:
+                self.values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+
+            counts, total = self.values[key]
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels) -> int:
+        """Return the number of observations of ``labels``."""
+        counts, _ = self.values.get(self._labels(labels), ([0], None))
+        return sum(counts)
+
+    def samples(self):
+        """Yield the ``(suffix, labels, value)`` of each sample of the metric."""
+        with self.lock:
+            values = sorted(
+                (labels, (list(counts), total[0]))
+                for labels, (counts, total) in self.values.items()
+            )
+
+        for labels, (counts, total) in values:
+            cumulative = 0
+
+            for bound, count in zip((*self.buckets, math.inf), counts):
+                cumulative += count
+                yield "_bucket", (*labels, ("le", _format_value(bound))), cumulative
+
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class Registry:
+    """The metrics of one skore-ui server."""
+
+    def __init__(self):
+        self.requests = Counter(
+            "skore_ui_requests_total",
+            "Number of HTTP requests.",
+            ("route", "method", "status"),
+        )
+        self.request_duration = Histogram(
+            "skore_ui_request_duration_seconds",
+            "Latency of HTTP requests.",
+            ("route", "method"),
+        )
+        self.response_bytes = Counter(
+            "skore_ui_response_bytes_total",
+            "Number of bytes sent in HTTP response bodies.",
+            ("route", "method"),
+        )
+        self.serialization_duration = Histogram(
+            "skore_ui_serialization_duration_seconds",
+            "Time spent serializing the project.",
+            ("route",),
+        )
+        self.cache_hits = Counter(
+            "skore_ui_serialized_item_cache_hits_total",
+            "Number of items whose serialization was found in cache.",
+        )
+        self.cache_misses = Counter(
+            "skore_ui_serialized_item_cache_misses_total",
+            "Number of items serialized because absent from cache.",
+        )
+        self.storage_read_duration = Histogram(
+            "skore_ui_storage_read_duration_seconds",
+            "Latency of storage reads.",
+            ("phase",),
+            buckets=STORAGE_BUCKETS,
+        )
+
+    def __iter__(self):
+        """Iterate over the metrics."""
+        return (value for value in vars(self).values() if isinstance(value, Metric))
+
+    def expose(self) -> str:
+        """Return all the metrics in the Prometheus text format."""
+        return "".join(metric.expose() for metric in self)
+
+    def on_event(self, event: instrumentation.Event):
+        """Record the storage reads, as an instrumentation listener."""
+        if event.phase in ("storage.get", "disk.fetch"):
+            self.storage_read_duration.observe(event.duration, phase=event.phase)
+
+
+def route_label(scope: Scope) -> str:
+    """Return the template of the API route matched by the request of ``scope``.
+
+    Paths without parameters are their own template. Requests not matched by an API
+    route, e.g. static files, are gathered under ``"<other>"``.
+    """
+    # The router stores the matched route in the scope
+    route = scope.get("route")
+
+    if not isinstance(route, APIRoute):
+        return "<other>"
+    if route.param_convertors:
+        return route.path_format
+    return scope.get("root_path", "") + scope["path"]
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording the count, latency and size of HTTP requests.
+
+    Requests are labelled by their route template (e.g. ``/api/project/items``)
+    rather than their path, to keep the number of series bounded.
+    """
+
+    def __init__(self, app: ASGIApp, registry: Registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Forward the request to the app and record its metrics."""
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+        nbytes = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status, nbytes
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                nbytes += len(message.get("body", b""))
+
+            await send(message)
+
+        start = perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            labels = {"route": route_label(scope), "method": scope["method"]}
+
+            self.registry.request_duration.observe(perf_counter() - start, **labels)
+            self.registry.response_bytes.inc(nbytes, **labels)
+            self.registry.requests.inc(status=str(status), **labels)
+
+
+def lifespan(registry: Registry, wrapped: Lifespan | None = None) -> Lifespan:
+    """Listen to storage reads while the server runs, around ``wrapped``."""
+
+    @asynccontextmanager
+    async def _lifespan(app):
+        with instrumentation.listening(registry.on_event):
+            if wrapped is None:
+                yield
+            else:
+                async with wrapped(app) as state:
+                    yield state
+
+    return _lifespan
+
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    """Expose the metrics in the Prometheus text format."""
+    registry: Registry = request.app.state.metrics
+    return Response(content=registry.expose(), media_type=CONTENT_TYPE)
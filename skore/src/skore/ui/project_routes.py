@@ -1,27 +1,42 @@
 """The definition of API routes to list project items and get them."""
 
 import base64
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
-from typing import Any
+from time import perf_counter
+from typing import Any, Optional
+from urllib.parse import urlencode
 
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from skore.item.cross_validation_item import (
     CrossValidationAggregationItem,
     CrossValidationItem,
 )
+from skore.item.item_repository import ItemRepository, StoredItem
 from skore.item.media_item import MediaItem
 from skore.item.numpy_array_item import NumpyArrayItem
 from skore.item.pandas_dataframe_item import PandasDataFrameItem
 from skore.item.pandas_series_item import PandasSeriesItem
 from skore.item.primitive_item import PrimitiveItem
+from skore.item.scipy_sparse_matrix_item import ScipySparseMatrixItem
 from skore.item.sklearn_base_estimator_item import SklearnBaseEstimatorItem
 from skore.project import Project
+from skore.ui.metrics import Registry, route_label
 from skore.view.view import Layout, View
 
 router = APIRouter(prefix="/project")
 
+# Larger media without thumbnail are not sent with the project, only linked to
+MEDIA_INLINE_MAX_SIZE = 2**20
+
+# The key of the runs of `skore.cross_validate`, and the key under which their
+# aggregation is sent
+CROSS_VALIDATION_KEY = "cross_validation"
+CROSS_VALIDATION_AGGREGATION_KEY = "cross_validation_aggregated"
+
 
 @dataclass
 class SerializedItem:
@@ -41,46 +56,229 @@ class SerializedProject:
     views: dict[str, Layout]
 
 
-def __serialize_project(project: Project) -> SerializedProject:
-    items = defaultdict(list)
+def _value_size(value: Any) -> int:
+    """Return an estimate of the size of a serialized value, in bytes."""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_value_size(k) + _value_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_value_size(v) for v in value)
 
-    for key in project.list_item_keys():
-        for item in project.get_item_versions(key):
-            if isinstance(item, PrimitiveItem):
-                value = item.primitive
-                media_type = "text/markdown"
-            elif isinstance(item, NumpyArrayItem):
-                value = item.array.tolist()
-                media_type = "text/markdown"
-            elif isinstance(item, PandasDataFrameItem):
-                value = item.dataframe.to_dict(orient="tight")
-                media_type = "application/vnd.dataframe+json"
-            elif isinstance(item, PandasSeriesItem):
-                value = item.series.to_list()
-                media_type = "text/markdown"
-            elif isinstance(item, SklearnBaseEstimatorItem):
-                value = item.estimator_html_repr
-                media_type = "application/vnd.sklearn.estimator+html"
-            elif isinstance(item, MediaItem):
-                value = base64.b64encode(item.media_bytes).decode()
-                media_type = item.media_type
-            elif isinstance(
-                item, (CrossValidationItem, CrossValidationAggregationItem)
-            ):
-                value = base64.b64encode(item.plot_bytes).decode()
-                media_type = "application/vnd.plotly.v1+json"
+    # e.g. numbers, as in arrays converted to lists
+    return 8
+
+
+class SerializedItemCache:
+    """Least-recently-used cache of serialized items.
+
+    A version of an item never changes once put, so it is identified by its key,
+    its position in the list of versions and its update timestamp.
+
+    At most ``maxsize`` items are cached, whose values are of at most ``maxbytes``
+    bytes in total: larger items are not cached at all.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        metrics: Optional[Registry] = None,
+        maxbytes: int = 2**27,
+    ):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.metrics = metrics
+        self.items: OrderedDict[tuple, tuple[SerializedItem, int]] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, identifier: tuple) -> Optional[SerializedItem]:
+        """Return the serialized item of `identifier`, or None."""
+        with self.lock:
+            item, _ = self.items.get(identifier, (None, 0))
+
+            if item is not None:
+                self.items.move_to_end(identifier)
+
+        if self.metrics is not None:
+            if item is None:
+                self.metrics.cache_misses.inc()
             else:
-                raise ValueError(f"Item {item} is not a known item type.")
-
-            items[key].append(
-                SerializedItem(
-                    media_type=media_type,
-                    value=value,
-                    updated_at=item.updated_at,
-                    created_at=item.created_at,
+                self.metrics.cache_hits.inc()
+
+        return item
+
+    def set(self, identifier: tuple, item: SerializedItem):
+        """Store the serialized item of `identifier`."""
+        nbytes = _value_size(item.value)
+
+        if nbytes > self.maxbytes:
+            return
+
+        with self.lock:
+            if identifier in self.items:
+                self.nbytes -= self.items[identifier][1]
+
+            self.items[identifier] = (item, nbytes)
+            self.items.move_to_end(identifier)
+            self.nbytes += nbytes
+
+            while len(self.items) > self.maxsize or self.nbytes > self.maxbytes:
+                self.nbytes -= self.items.popitem(last=False)[1][1]
+
+
+def __serialize_item(item, item_repository: ItemRepository) -> SerializedItem:
+    if isinstance(item, PrimitiveItem):
+        value = item.primitive
+        media_type = "text/markdown"
+    elif isinstance(item, NumpyArrayItem):
+        value = item.array.tolist()
+        media_type = "text/markdown"
+    elif isinstance(item, PandasDataFrameItem):
+        value = item.dataframe.to_dict(orient="tight")
+        media_type = "application/vnd.dataframe+json"
+    elif isinstance(item, PandasSeriesItem):
+        value = item.series.to_list()
+        media_type = "text/markdown"
+    elif isinstance(item, ScipySparseMatrixItem):
+        # Densifying the matrix could exhaust memory, it is only described
+        value = repr(item.matrix_view)
+        media_type = "text/markdown"
+    elif isinstance(item, SklearnBaseEstimatorItem):
+        # The representation is only computed once per estimator, on first request,
+        # and stored as UTF-8 bytes as the blob storage is binary
+        value = (
+            item.html_repr
+            if item.estimator_fingerprint is None
+            else bytes(
+                item_repository.get_derived(
+                    "estimator_html_repr",
+                    item.estimator_fingerprint,
+                    lambda: item.html_repr.encode("utf-8"),
                 )
+            ).decode("utf-8")
+        )
+        media_type = "application/vnd.sklearn.estimator+html"
+    elif isinstance(item, MediaItem):
+        # Media with a thumbnail, and large media, are described by
+        # `__serialize_stored_item` without being constructed
+        value = base64.b64encode(item.media_bytes).decode()
+        media_type = item.media_type
+    elif isinstance(item, (CrossValidationItem, CrossValidationAggregationItem)):
+        value = base64.b64encode(item.plot_json).decode()
+        media_type = "application/vnd.plotly.v1+json"
+    else:
+        raise ValueError(f"Item {item} is not a known item type.")
+
+    return SerializedItem(
+        media_type=media_type,
+        value=value,
+        updated_at=item.updated_at,
+        created_at=item.created_at,
+    )
+
+
+def __serialize_stored_item(
+    stored: StoredItem, item_repository: ItemRepository, key: str, version: int
+) -> SerializedItem:
+    # Media are described from their stored parameters, so that the full media is
+    # not loaded when it is not sent
+    if issubclass(stored.item_class, MediaItem):
+        thumbnail_bytes = stored.get_parameter("thumbnail_bytes")
+        media_nbytes = stored.get_parameter_nbytes("media_bytes")
+
+        if thumbnail_bytes is not None:
+            # The full media is only sent when requested, on its own by `get_media`
+            return SerializedItem(
+                media_type="image/png",
+                value=base64.b64encode(thumbnail_bytes).decode(),
+                updated_at=stored.updated_at,
+                created_at=stored.created_at,
+            )
+
+        if media_nbytes is None or media_nbytes > MEDIA_INLINE_MAX_SIZE:
+            # Large files, possibly in chunks, are only described; they are sent on
+            # their own by `get_media`
+            url = f"/api/project/media?{urlencode({'key': key, 'version': version})}"
+
+            return SerializedItem(
+                media_type="text/markdown",
+                value=(
+                    f"[Media of type `{stored.get_parameter('media_type')}`]({url}), "
+                    "too large to be displayed."
+                ),
+                updated_at=stored.updated_at,
+                created_at=stored.created_at,
             )
 
+    return __serialize_item(stored.construct(), item_repository)
+
+
+def __serialize_cross_validation_aggregation(
+    item_repository: ItemRepository, cache: Optional[SerializedItemCache] = None
+) -> Optional[SerializedItem]:
+    versions = [
+        stored
+        for stored in item_repository.get_stored_item_versions(CROSS_VALIDATION_KEY)
+        if issubclass(stored.item_class, CrossValidationItem)
+    ]
+
+    if not versions:
+        return None
+
+    identifier = (
+        CROSS_VALIDATION_AGGREGATION_KEY,
+        len(versions),
+        CrossValidationAggregationItem.__name__,
+        versions[-1].updated_at,
+    )
+    serialized = None if cache is None else cache.get(identifier)
+
+    if serialized is None:
+        # The results of the runs are read without loading their indices
+        item = CrossValidationAggregationItem.factory_cv_results(
+            [stored.get_parameter("cv_results_serialized") for stored in versions]
+        )
+        serialized = SerializedItem(
+            media_type="application/vnd.plotly.v1+json",
+            value=base64.b64encode(item.plot_json).decode(),
+            updated_at=versions[-1].updated_at,
+            created_at=versions[0].created_at,
+        )
+
+        if cache is not None:
+            cache.set(identifier, serialized)
+
+    return serialized
+
+
+def __serialize_project(
+    project: Project, cache: Optional[SerializedItemCache] = None
+) -> SerializedProject:
+    items = defaultdict(list)
+    item_repository = project.item_repository
+
+    for key in project.list_item_keys():
+        for i, stored in enumerate(item_repository.get_stored_item_versions(key)):
+            identifier = (key, i, stored.item_class.__name__, stored.updated_at)
+            serialized = None if cache is None else cache.get(identifier)
+
+            if serialized is None:
+                serialized = __serialize_stored_item(stored, item_repository, key, i)
+
+                if cache is not None:
+                    cache.set(identifier, serialized)
+
+            items[key].append(serialized)
+
+    # The aggregation of all the runs is built on read, rather than stored with
+    # each run; it replaces the aggregations stored by older versions
+    if CROSS_VALIDATION_KEY in items:
+        aggregation = __serialize_cross_validation_aggregation(item_repository, cache)
+
+        if aggregation is not None:
+            items[CROSS_VALIDATION_AGGREGATION_KEY] = [aggregation]
+
     views = {key: project.get_view(key).layout for key in project.list_view_keys()}
 
     return SerializedProject(
@@ -89,11 +287,68 @@ def __serialize_project(project: Project) -> SerializedProject:
     )
 
 
+def __serialize_request_project(request: Request) -> SerializedProject:
+    """Serialize the project of the app, recording the time spent if monitored."""
+    state = request.app.state
+    project: Project = state.project
+    cache = getattr(state, "serialized_item_cache", None)
+    metrics: Optional[Registry] = getattr(state, "metrics", None)
+
+    start = perf_counter()
+    serialized = __serialize_project(project, cache)
+
+    if metrics is not None:
+        metrics.serialization_duration.observe(
+            perf_counter() - start, route=route_label(request.scope)
+        )
+
+    return serialized
+
+
 @router.get("/items")
 async def get_items(request: Request):
     """Serialize a project and send it."""
-    project = request.app.state.project
-    return __serialize_project(project)
+    return __serialize_request_project(request)
+
+
+@router.get("/media")
+async def get_media(
+    request: Request, key: str, version: int = -1, thumbnail: bool = False
+):
+    """Send the media of the item corresponding to `key`, or its thumbnail, as is.
+
+    Media are sent on their own, so that the full media is only sent when needed.
+    """
+    project: Project = request.app.state.project
+
+    # Only the requested version is loaded, and only its thumbnail if requested
+    try:
+        stored = project.item_repository.get_stored_item_versions(key)[version]
+    except (KeyError, IndexError):
+        stored = None
+
+    if (
+        stored is None
+        or not issubclass(stored.item_class, MediaItem)
+        or (thumbnail and stored.get_parameter("thumbnail_bytes") is None)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Media not found"
+        )
+
+    if thumbnail:
+        return Response(
+            content=bytes(stored.get_parameter("thumbnail_bytes")),
+            media_type="image/png",
+        )
+
+    item = stored.construct()
+
+    if item.media_chunks is not None:
+        # The chunks are loaded one at a time, as they are sent
+        return StreamingResponse(iter(item.media_chunks), media_type=item.media_type)
+
+    return Response(content=bytes(item.media_bytes), media_type=item.media_type)
 
 
 @router.put("/views", status_code=status.HTTP_201_CREATED)
@@ -107,7 +362,7 @@ async def put_view(request: Request, key: str, layout: Layout):
     view = View(layout=layout)
     project.put_view(key, view)
 
-    return __serialize_project(project)
+    return __serialize_request_project(request)
 
 
 @router.delete("/views", status_code=status.HTTP_202_ACCEPTED)
@@ -122,4 +377,4 @@ async def delete_view(request: Request, key: str):
             status_code=status.HTTP_404_NOT_FOUND, detail="View not found"
         ) from None
 
-    return __serialize_project(project)
+    return __serialize_request_project(request)
@@ -0,0 +1,391 @@
+"""Benchmark the serialization of each item type.
+
+For each item type and input size, the benchmark measures:
+
+- ``encode``: the creation of the item from the object, with its ``factory``,
+- ``decode``: the re-creation of the object from the stored parameters of the item,
+  with its accessor (e.g. ``NumpyArrayItem.array``).
+
+Each record of the JSON report holds the latency percentiles and the peak memory
+allocated (measured with ``tracemalloc``) of one phase, as well as the size of the
+parameters of the item once pickled, which is what the storage writes.
+
+Examples
+--------
+Run the quick preset and print the report::
+
+    python tests/benchmarks/bench_items.py
+
+Run the full preset for arrays and dataframes only::
+
+    python tests/benchmarks/bench_items.py --preset full \\
+        --cases numpy-array pandas-dataframe --output items.json
+"""
+
+import argparse
+import gc
+import pickle
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from bench_utils import summarize_timings, timed, write_report
+from skore.item import (
+    CrossValidationItem,
+    MediaItem,
+    NumpyArrayItem,
+    PandasDataFrameItem,
+    PandasSeriesItem,
+    PrimitiveItem,
+    SklearnBaseEstimatorItem,
+)
+
+
+@dataclass
+class Case:
+    """An item type, the inputs to benchmark it with and how to decode it."""
+
+    item_cls: type
+    make: Callable[[int], tuple]
+    decode: Callable[[Any], Any]
+    sizes: dict[str, list[int]]
+    size_unit: str
+
+
+def make_primitive_list(size):
+    """Return a list of ``size`` floats."""
+    import numpy
+
+    return (numpy.random.default_rng(0).random(size).tolist(),)
+
+
+def make_primitive_dict(size):
+    """Return a dict of ``size`` small nested dicts."""
+    return ({f"key-{i}": {"index": i, "name": str(i)} for i in range(size)},)
+
+
+def make_numpy_array(size):
+    """Return a float array of ``size`` rows and 10 columns."""
+    import numpy
+
+    return (numpy.random.default_rng(0).random((size, 10)),)
+
+
+def make_pandas_dataframe(size):
+    """Return a dataframe of ``size`` rows with columns of various dtypes."""
+    import numpy
+    import pandas
+
+    rng = numpy.random.default_rng(0)
+    dataframe = pandas.DataFrame(
+        {
+            "float": rng.random(size),
+            "int": rng.integers(0, 100, size),
+            "str": rng.choice(["a", "b", "c"], size),
+            "datetime": pandas.date_range("2024-01-01", periods=size, freq="s"),
+        }
+    )
+
+    return (dataframe,)
+
+
+def make_pandas_series(size):
+    """Return a float series of ``size`` rows, indexed by datetimes."""
+    import numpy
+    import pandas
+
+    series = pandas.Series(
+        numpy.random.default_rng(0).random(size),
+        index=pandas.date_range("2024-01-01", periods=size, freq="s"),
+        name="series",
+    )
+
+    return (series,)
+
+
+def make_sklearn_estimator(size):
+    """Return a random forest of ``size`` trees fitted on 1000 samples."""
+    from sklearn.datasets import make_classification
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = make_classification(n_samples=1_000, random_state=0)
+    estimator = RandomForestClassifier(n_estimators=size, random_state=0)
+
+    return (estimator.fit(X, y),)
+
+
+def make_matplotlib_figure(size):
+    """Return a matplotlib scatter plot of ``size`` points."""
+    import matplotlib
+    import numpy
+
+    matplotlib.use("Agg")
+
+    from matplotlib import pyplot as plt
+
+    rng = numpy.random.default_rng(0)
+    figure, ax = plt.subplots()
+    ax.scatter(rng.random(size), rng.random(size))
+    plt.close(figure)
+
+    return (figure,)
+
+
+def make_pillow_image(size):
+    """Return a random RGB image of ``size`` by ``size`` pixels."""
+    import numpy
+    from PIL import Image
+
+    pixels = numpy.random.default_rng(0).integers(0, 255, (size, size, 3), "uint8")
+
+    return (Image.fromarray(pixels),)
+
+
+def make_plotly_figure(size):
+    """Return a plotly scatter plot of ``size`` points."""
+    import numpy
+    import plotly.graph_objects as go
+
+    rng = numpy.random.default_rng(0)
+
+    return (go.Figure(go.Scatter(x=rng.random(size), y=rng.random(size))),)
+
+
+def make_altair_chart(size):
+    """Return an altair scatter plot of ``size`` points."""
+    import altair
+    import numpy
+    import pandas
+
+    # The chart is serialized when the item is created, after this function returns:
+    # lift altair's default limit of 5000 rows globally, not in a context manager.
+    altair.data_transformers.disable_max_rows()
+
+    rng = numpy.random.default_rng(0)
+    data = pandas.DataFrame({"x": rng.random(size), "y": rng.random(size)})
+
+    return (altair.Chart(data).mark_point().encode(x="x", y="y"),)
+
+
+def make_cross_validation(size):
+    """Return the arguments of a 5-fold cross-validation on ``size`` samples."""
+    import sklearn.model_selection
+    from sklearn.datasets import make_classification
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = make_classification(n_samples=size, random_state=0)
+    estimator = LogisticRegression()
+    cv_results = sklearn.model_selection.cross_validate(
+        estimator,
+        X,
+        y,
+        scoring=["accuracy", "roc_auc", "neg_brier_score", "recall", "precision"],
+        return_indices=True,
+    )
+
+    return cv_results, estimator, X, y
+
+
+CASES = {
+    "primitive-list": Case(
+        item_cls=PrimitiveItem,
+        make=make_primitive_list,
+        decode=lambda item: item.primitive,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 1_000_000]},
+        size_unit="elements",
+    ),
+    "primitive-dict": Case(
+        item_cls=PrimitiveItem,
+        make=make_primitive_dict,
+        decode=lambda item: item.primitive,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 1_000_000]},
+        size_unit="keys",
+    ),
+    "numpy-array": Case(
+        item_cls=NumpyArrayItem,
+        make=make_numpy_array,
+        decode=lambda item: item.array,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 1_000_000]},
+        size_unit="rows",
+    ),
+    "pandas-dataframe": Case(
+        item_cls=PandasDataFrameItem,
+        make=make_pandas_dataframe,
+        decode=lambda item: item.dataframe,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 1_000_000]},
+        size_unit="rows",
+    ),
+    "pandas-series": Case(
+        item_cls=PandasSeriesItem,
+        make=make_pandas_series,
+        decode=lambda item: item.series,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 10_000_000]},
+        size_unit="rows",
+    ),
+    "sklearn-estimator": Case(
+        item_cls=SklearnBaseEstimatorItem,
+        make=make_sklearn_estimator,
+        decode=lambda item: item.estimator,
+        sizes={"quick": [10], "full": [10, 100, 500]},
+        size_unit="trees",
+    ),
+    "media-matplotlib": Case(
+        item_cls=MediaItem,
+        make=make_matplotlib_figure,
+        decode=lambda item: item.media_bytes,
+        sizes={"quick": [1_000, 10_000], "full": [1_000, 10_000, 100_000]},
+        size_unit="points",
+    ),
+    "media-pillow": Case(
+        item_cls=MediaItem,
+        make=make_pillow_image,
+        decode=lambda item: item.media_bytes,
+        sizes={"quick": [256, 1_024], "full": [256, 1_024, 4_096]},
+        size_unit="pixels per side",
+    ),
+    "media-plotly": Case(
+        item_cls=MediaItem,
+        make=make_plotly_figure,
+        decode=lambda item: item.media_bytes,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 1_000_000]},
+        size_unit="points",
+    ),
+    "media-altair": Case(
+        item_cls=MediaItem,
+        make=make_altair_chart,
+        decode=lambda item: item.media_bytes,
+        sizes={"quick": [1_000, 10_000], "full": [1_000, 10_000, 100_000]},
+        size_unit="points",
+    ),
+    "cross-validation": Case(
+        item_cls=CrossValidationItem,
+        make=make_cross_validation,
+        decode=lambda item: item.plot,
+        sizes={"quick": [1_000, 100_000], "full": [1_000, 100_000, 1_000_000]},
+        size_unit="samples",
+    ),
+}
+
+
+def peak_memory(function, *args) -> int:
+    """Return the peak memory allocated while calling ``function``, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def bench_case(name: str, case: Case, size: int, repeat: int) -> list[dict]:
+    """Measure the encoding and decoding of ``case`` for an input of ``size``."""
+    record = {
+        "case": name,
+        "item_type": case.item_cls.__name__,
+        "size": size,
+        "size_unit": case.size_unit,
+    }
+
+    try:
+        args = case.make(size)
+    except ImportError as e:
+        return [{**record, "skipped": f"missing dependency: {e.name}"}]
+
+    def encode():
+        return case.item_cls.factory(*args)
+
+    def decode(parameters):
+        return case.decode(case.item_cls(**parameters))
+
+    # Time and memory are measured separately, as tracemalloc slows allocations
+    encode_timings = []
+    for _ in range(repeat):
+        duration, item = timed(encode)
+        encode_timings.append(duration)
+
+    parameters = dict(item.__parameters__)
+    encoded_size = len(pickle.dumps(parameters, protocol=pickle.HIGHEST_PROTOCOL))
+
+    decode_timings = [timed(decode, parameters)[0] for _ in range(repeat)]
+
+    return [
+        {
+            **record,
+            "phase": "encode",
+            **summarize_timings(encode_timings),
+            "peak_memory_bytes": peak_memory(encode),
+            "encoded_size_bytes": encoded_size,
+        },
+        {
+            **record,
+            "phase": "decode",
+            **summarize_timings(decode_timings),
+            "peak_memory_bytes": peak_memory(decode, parameters),
+            "encoded_size_bytes": encoded_size,
+        },
+    ]
+
+
+def main(argv=None):
+    """Run the item benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--preset",
+        choices=["quick", "full"],
+        default="quick",
+        help="the input sizes to benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=CASES,
+        default=list(CASES),
+        help="the cases to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        help="the input sizes, for all the cases (default: preset)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="the number of timed runs per phase (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="the JSON file to write the report to (default: standard output)",
+    )
+    args = parser.parse_args(argv)
+
+    results = [
+        record
+        for name in args.cases
+        for size in (args.sizes or CASES[name].sizes[args.preset])
+        for record in bench_case(name, CASES[name], size, args.repeat)
+    ]
+
+    write_report(
+        "items",
+        {
+            "preset": args.preset,
+            "cases": args.cases,
+            "sizes": args.sizes,
+            "repeat": args.repeat,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
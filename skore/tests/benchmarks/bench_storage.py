@@ -0,0 +1,310 @@
+"""Benchmark the storage backends through the ItemRepository.
+
+Three scenarios are measured for each backend:
+
+- ``keys``: put one small item under each of ``n_keys`` keys, then get some of them
+  and list all the keys,
+- ``versions``: put ``n_versions`` versions of a small item under the same key, then
+  get the latest version and all the versions,
+- ``payload``: put and get a few items whose payload is ``payload_size`` bytes long.
+
+Each record of the JSON report holds the throughput, the latency percentiles and the
+size on disk of the project, for one operation of one scenario.
+
+Examples
+--------
+Run the quick preset on all the backends and print the report::
+
+    python tests/benchmarks/bench_storage.py
+
+Run the full preset on the disk backend only::
+
+    python tests/benchmarks/bench_storage.py --preset full \\
+        --backends disk-cache --output storage.json
+"""
+
+import argparse
+import random
+import tempfile
+from pathlib import Path
+
+from bench_utils import directory_size, summarize_timings, timed, write_report
+from skore.item import ItemRepository, MediaItem
+from skore.persistence.disk_cache_storage import DiskCacheStorage
+from skore.persistence.in_memory_storage import InMemoryStorage
+
+
+def in_memory(directory):
+    """Return a writer and a reader repository over an in-memory storage."""
+    repository = ItemRepository(storage=InMemoryStorage())
+    return repository, repository
+
+
+def disk_cache(directory):
+    """Return a writer and a reader repository over a disk storage."""
+    repository = ItemRepository(storage=DiskCacheStorage(directory))
+    return repository, repository
+
+
+def disk_cache_readonly(directory):
+    """Return a writer repository and a read-only reader over a disk storage."""
+    writer = ItemRepository(storage=DiskCacheStorage(directory))
+    reader = ItemRepository(storage=DiskCacheStorage(directory, readonly=True))
+    return writer, reader
+
+
+# New backends are benchmarked by adding them here
+BACKENDS = {
+    "in-memory": in_memory,
+    "disk-cache": disk_cache,
+    "disk-cache-readonly": disk_cache_readonly,
+}
+
+PRESETS = {
+    "quick": {
+        "keys": [1_000],
+        "versions": [1, 10, 100],
+        "payload_sizes": [100, 10_000, 1_000_000],
+    },
+    "full": {
+        "keys": [1_000, 10_000, 100_000, 1_000_000],
+        "versions": [1, 10, 100, 1_000, 10_000],
+        "payload_sizes": [100, 10_000, 1_000_000, 100_000_000, 1_000_000_000],
+    },
+}
+
+
+def payload(rng: random.Random, size: int, index: int = 0) -> bytes:
+    """Return ``size`` random bytes, unique for each ``index``."""
+    suffix = index.to_bytes(8, "little")
+    return rng.randbytes(max(size - len(suffix), 0)) + suffix[: min(size, 8)]
+
+
+def bench_keys(writer, reader, n_keys, payload_size, rng, max_reads):
+    """Measure put, get and listing with ``n_keys`` keys."""
+    keys = [f"key-{i}" for i in range(n_keys)]
+    put_timings = []
+
+    for i, key in enumerate(keys):
+        item = MediaItem.factory_bytes(payload(rng, payload_size, i))
+        duration, _ = timed(writer.put_item, key, item)
+        put_timings.append(duration)
+
+    get_timings = [
+        timed(reader.get_item, key)[0]
+        for key in rng.sample(keys, min(max_reads, n_keys))
+    ]
+    list_timings = [timed(reader.keys)[0] for _ in range(5)]
+
+    return {
+        "put_item": summarize_timings(put_timings, payload_size),
+        "get_item": summarize_timings(get_timings, payload_size),
+        "keys": summarize_timings(list_timings),
+    }
+
+
+def bench_versions(writer, reader, n_versions, payload_size, rng, max_reads):
+    """Measure put and get with ``n_versions`` versions of a single key."""
+    put_timings = []
+
+    for i in range(n_versions):
+        item = MediaItem.factory_bytes(payload(rng, payload_size, i))
+        duration, _ = timed(writer.put_item, "key", item)
+        put_timings.append(duration)
+
+    get_timings = [timed(reader.get_item, "key")[0] for _ in range(min(max_reads, 20))]
+    versions_timings = [
+        timed(reader.get_item_versions, "key")[0] for _ in range(min(max_reads, 5))
+    ]
+
+    return {
+        "put_item": summarize_timings(put_timings, payload_size),
+        "get_item": summarize_timings(get_timings, payload_size),
+        "get_item_versions": summarize_timings(
+            versions_timings, payload_size * n_versions
+        ),
+    }
+
+
+def bench_payload(writer, reader, payload_size, n_items, rng):
+    """Measure put and get of ``n_items`` items of ``payload_size`` bytes."""
+    put_timings = []
+
+    for i in range(n_items):
+        item = MediaItem.factory_bytes(payload(rng, payload_size, i))
+        duration, _ = timed(writer.put_item, f"key-{i}", item)
+        put_timings.append(duration)
+
+        # Do not keep several huge payloads in memory at once
+        del item
+
+    get_timings = []
+    for i in range(n_items):
+        duration, item = timed(reader.get_item, f"key-{i}")
+        get_timings.append(duration)
+        del item
+
+    return {
+        "put_item": summarize_timings(put_timings, payload_size),
+        "get_item": summarize_timings(get_timings, payload_size),
+    }
+
+
+def run(backend_name, scenario, parameters, args):
+    """Run ``scenario`` on a fresh backend and return one record per operation."""
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        writer, reader = BACKENDS[backend_name](Path(directory))
+
+        if scenario == "keys":
+            operations = bench_keys(
+                writer,
+                reader,
+                parameters["n_keys"],
+                parameters["payload_size"],
+                rng,
+                args.max_reads,
+            )
+        elif scenario == "versions":
+            operations = bench_versions(
+                writer,
+                reader,
+                parameters["n_versions"],
+                parameters["payload_size"],
+                rng,
+                args.max_reads,
+            )
+        else:
+            operations = bench_payload(
+                writer,
+                reader,
+                parameters["payload_size"],
+                args.payload_repeat,
+                rng,
+            )
+
+        disk_size = directory_size(Path(directory))
+
+    return [
+        {
+            "backend": backend_name,
+            "scenario": scenario,
+            **parameters,
+            "operation": operation,
+            **statistics,
+            "disk_size_bytes": disk_size,
+        }
+        for operation, statistics in operations.items()
+    ]
+
+
+def main(argv=None):
+    """Run the storage benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--preset",
+        choices=PRESETS,
+        default="quick",
+        help="the default sizes to benchmark (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        default=list(BACKENDS),
+        help="the backends to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=["keys", "versions", "payload"],
+        default=["keys", "versions", "payload"],
+        help="the scenarios to run (default: all)",
+    )
+    parser.add_argument(
+        "--keys", nargs="+", type=int, help="the numbers of keys (default: preset)"
+    )
+    parser.add_argument(
+        "--versions",
+        nargs="+",
+        type=int,
+        help="the numbers of versions per key (default: preset)",
+    )
+    parser.add_argument(
+        "--payload-sizes",
+        nargs="+",
+        type=int,
+        help="the payload sizes in bytes (default: preset)",
+    )
+    parser.add_argument(
+        "--payload-repeat",
+        type=int,
+        default=3,
+        help="the number of items put in the payload scenario (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-reads",
+        type=int,
+        default=1_000,
+        help="the maximum number of timed reads per operation (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="the random seed (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--directory",
+        type=Path,
+        default=None,
+        help="the directory of the disk backends (default: a temporary directory)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="the JSON file to write the report to (default: standard output)",
+    )
+    args = parser.parse_args(argv)
+
+    preset = PRESETS[args.preset]
+    keys = args.keys or preset["keys"]
+    versions = args.versions or preset["versions"]
+    payload_sizes = args.payload_sizes or preset["payload_sizes"]
+    small_payload = min(payload_sizes)
+
+    runs = []
+    if "keys" in args.scenarios:
+        runs += [("keys", {"n_keys": n, "payload_size": small_payload}) for n in keys]
+    if "versions" in args.scenarios:
+        runs += [
+            ("versions", {"n_versions": n, "payload_size": small_payload})
+            for n in versions
+        ]
+    if "payload" in args.scenarios:
+        runs += [("payload", {"payload_size": size}) for size in payload_sizes]
+
+    results = [
+        record
+        for backend_name in args.backends
+        for scenario, parameters in runs
+        for record in run(backend_name, scenario, parameters, args)
+    ]
+
+    write_report(
+        "storage",
+        {
+            "backends": args.backends,
+            "keys": keys,
+            "versions": versions,
+            "payload_sizes": payload_sizes,
+            "payload_repeat": args.payload_repeat,
+            "max_reads": args.max_reads,
+            "seed": args.seed,
+        },
+        results,
+        args.output,
+    )
+
+
+if __name__ == "__main__":
+    main()
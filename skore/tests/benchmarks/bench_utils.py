@@ -0,0 +1,149 @@
+"""Helpers shared by the benchmark scripts.
+
+The benchmarks are standalone scripts, run with e.g.
+``python tests/benchmarks/bench_storage.py --output storage.json``.
+They are not collected by pytest.
+"""
+
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+PACKAGES = (
+    "skore",
+    "diskcache",
+    "numpy",
+    "pandas",
+    "scikit-learn",
+    "skops",
+    "matplotlib",
+    "pillow",
+    "plotly",
+    "altair",
+)
+
+
+def percentile(sorted_values: list[float], q: float):
+    """Return the ``q``-th percentile of ``sorted_values``, with interpolation."""
+    if not sorted_values:
+        return None
+
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (
+        position - lower
+    )
+
+
+def summarize_timings(timings: list[float], nbytes: int = 0) -> dict:
+    """Summarize the durations of several runs of the same operation.
+
+    Parameters
+    ----------
+    timings : list[float]
+        The duration of each run, in seconds.
+    nbytes : int, optional
+        The number of payload bytes processed by each run, by default 0.
+
+    Returns
+    -------
+    dict
+        The throughput and latency percentiles of the operation.
+    """
+    timings = sorted(timings)
+    total = sum(timings)
+
+    # JSON has no infinity nor NaN, undefined statistics are reported as null
+    return {
+        "n_ops": len(timings),
+        "total_s": total,
+        "throughput_ops_s": (len(timings) / total) if total else None,
+        "throughput_bytes_s": (nbytes * len(timings) / total) if total else None,
+        "mean_s": (total / len(timings)) if timings else None,
+        "p50_s": percentile(timings, 50),
+        "p99_s": percentile(timings, 99),
+        "max_s": timings[-1] if timings else None,
+    }
+
+
+def timed(function, *args, **kwargs) -> tuple[float, object]:
+    """Call ``function`` and return its duration in seconds and its result."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def directory_size(directory: Path) -> int:
+    """Return the total size in bytes of the files in ``directory``."""
+    return sum(
+        os.path.getsize(os.path.join(root, filename))
+        for root, _, filenames in os.walk(directory)
+        for filename in filenames
+    )
+
+
+def environment() -> dict:
+    """Describe the environment the benchmarks run in."""
+    packages = {}
+    for package in PACKAGES:
+        try:
+            packages[package] = version(package)
+        except PackageNotFoundError:
+            packages[package] = None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "packages": packages,
+    }
+
+
+def write_report(benchmark: str, parameters: dict, results: list[dict], output):
+    """Write the results of a benchmark as JSON.
+
+    Parameters
+    ----------
+    benchmark : str
+        The name of the benchmark.
+    parameters : dict
+        The parameters the benchmark was run with.
+    results : list[dict]
+        One record per measured operation.
+    output : Path | None
+        The file to write the report to; the standard output if None.
+    """
+    report = {
+        "benchmark": benchmark,
+        "environment": environment(),
+        "parameters": parameters,
+        "results": results,
+    }
+
+    if output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(output, "w") as stream:
+            json.dump(report, stream, indent=2)
@@ -1,6 +1,8 @@
 import numpy
 import pandas
+import plotly.graph_objects
 import pytest
+import sklearn
 import sklearn.model_selection
 from numpy import array
 from sklearn import datasets, linear_model
@@ -164,9 +166,328 @@ def test_plot_cross_validation():
 
 
 def test_aggregated_cross_validation(rf, in_memory_project):
+    for _ in range(3):
+        cross_validate(*rf, project=in_memory_project)
+
+    # Only the runs are stored, their aggregation is built on read
+    assert in_memory_project.list_item_keys() == ["cross_validation"]
+
+    cv_results_items_versions = in_memory_project.get_item_versions("cross_validation")
+    item = CrossValidationAggregationItem.factory(cv_results_items_versions)
+
+    assert item.plot_bytes is None
+    assert item.cv_results_summaries == [
+        {k: v for k, v in item.cv_results_serialized.items() if k != "indices"}
+        for item in cv_results_items_versions
+    ]
+    assert isinstance(item.plot, plotly.graph_objects.Figure)
+
+
+@pytest.mark.parametrize("plot", [True, False])
+def test_cross_validate_plot(rf, in_memory_project, monkeypatch, plot):
+    # IPython is not a test dependency
+    pytest.importorskip("IPython")
+
+    calls = []
+
+    def plot_cross_validation(cv_results):
+        calls.append(cv_results)
+
+    monkeypatch.setattr(
+        "skore.item.cross_validation_item.plot_cross_validation",
+        plot_cross_validation,
+    )
+    monkeypatch.setattr(
+        "IPython.core.interactiveshell.InteractiveShell.initialized", lambda: True
+    )
+    monkeypatch.setattr("IPython.display.display", lambda _: None)
+
+    cross_validate(*rf, project=in_memory_project, plot=plot)
+
+    assert len(calls) == plot
+    assert in_memory_project.get_item("cross_validation").plot_bytes is None
+
+
+def test_cross_validate_indices(rf, in_memory_project):
     args = rf
-    cross_validate(*args, project=in_memory_project)
-    assert isinstance(
-        in_memory_project.item_repository.get_item("cross_validation_aggregated"),
-        CrossValidationAggregationItem,
+    cv_results = cross_validate(*args, return_indices=True, project=in_memory_project)
+    indices = in_memory_project.get("cross_validation")["indices"]
+
+    for name in ("train", "test"):
+        for expected, split in zip(cv_results["indices"][name], indices[name]):
+            numpy.testing.assert_array_equal(split, expected)
+
+
+@pytest.mark.parametrize("scoring", [None, "accuracy"])
+def test_cross_validate_shared_predictions(rf, scoring):
+    _, X, y = rf
+    calls = []
+
+    class CountingClassifier(linear_model.LogisticRegression):
+        def predict(self, X):
+            calls.append("predict")
+            return super().predict(X)
+
+        def predict_proba(self, X):
+            calls.append("predict_proba")
+            return super().predict_proba(X)
+
+    cv_results = cross_validate(CountingClassifier(), X, y, cv=3, scoring=scoring)
+    cv_results_sklearn = sklearn.model_selection.cross_validate(
+        linear_model.LogisticRegression(), X, y, cv=3, scoring=scoring
+    )
+
+    # "roc_auc", "neg_brier_score", "recall" and "precision" are added, but each
+    # prediction method is called once per fold
+    assert sorted(calls) == ["predict"] * 3 + ["predict_proba"] * 3
+    numpy.testing.assert_allclose(
+        cv_results["test_score"], cv_results_sklearn["test_score"]
+    )
+
+
+@pytest.mark.parametrize("as_dict", [False, True])
+def test_cross_validate_user_scorer_estimator(rf, as_dict):
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    _, X, y = rf
+
+    def is_logistic_regression(estimator, X, y):
+        return float(isinstance(estimator[-1], linear_model.LogisticRegression))
+
+    def is_pipeline(estimator, X, y):
+        return float(isinstance(estimator, sklearn.pipeline.Pipeline))
+
+    scoring = (
+        {"last_step": is_logistic_regression, "pipeline": is_pipeline}
+        if as_dict
+        else is_logistic_regression
+    )
+    cv_results = cross_validate(
+        make_pipeline(StandardScaler(), linear_model.LogisticRegression()),
+        X,
+        y,
+        cv=3,
+        scoring=scoring,
+        error_score="raise",
+    )
+
+    if as_dict:
+        assert list(cv_results["test_last_step"]) == [1.0] * 3
+        assert list(cv_results["test_pipeline"]) == [1.0] * 3
+    else:
+        assert list(cv_results["test_score"]) == [1.0] * 3
+
+
+class FitCountingClassifier(linear_model.LogisticRegression):
+    # Defined at the module level, for its instances to be pickled
+    fits = []
+
+    def fit(self, X, y):
+        self.fits.append(len(X))
+        return super().fit(X, y)
+
+
+def test_cross_validate_cache(in_memory_project):
+    X, y = datasets.make_classification(random_state=0)
+    fits = FitCountingClassifier.fits
+
+    in_memory_project.item_repository.blob_storage = {}
+
+    def run(estimator=None, X=X, y=y, **kwargs):
+        fits.clear()
+        cv_results = cross_validate(
+            estimator or FitCountingClassifier(),
+            X,
+            y,
+            cv=3,
+            project=in_memory_project,
+            plot=False,
+            cache=True,
+            **kwargs,
+        )
+
+        return cv_results, len(fits)
+
+    cv_results, n_fits = run()
+    assert n_fits == 3
+
+    cached_cv_results, n_fits = run()
+    assert n_fits == 0
+    numpy.testing.assert_array_equal(
+        cached_cv_results["test_score"], cv_results["test_score"]
+    )
+    assert len(in_memory_project.get_item_versions("cross_validation")) == 2
+
+    # Any change of the inputs invalidates the results
+    assert run(FitCountingClassifier(C=0.5))[1] == 3
+    assert run(X=X[::-1])[1] == 3
+    assert run(y=1 - y)[1] == 3
+    assert run(scoring="accuracy")[1] == 3
+    assert run(return_train_score=True)[1] == 3
+
+    # Lambdas cannot be pickled, nor their results cached
+    assert run(scoring=lambda clf, X, y: 1.0)[1] == 3
+    assert run(scoring=lambda clf, X, y: 1.0)[1] == 3
+
+    # The cached results are deleted on request
+    assert in_memory_project.vacuum() == 0
+    assert in_memory_project.vacuum(derived=True) == 6
+    assert run()[1] == 3
+
+
+def test_cross_validate_cache_incremental(in_memory_project):
+    X, y = datasets.make_classification(random_state=0)
+    in_memory_project.item_repository.blob_storage = {}
+
+    cross_validate(
+        linear_model.LogisticRegression(),
+        X,
+        y,
+        cv=3,
+        project=in_memory_project,
+        plot=False,
+        cache=True,
+        incremental=True,
+    )
+
+    # Only the results of all the folds are kept
+    [key] = in_memory_project.item_repository.blob_storage
+
+    assert key.startswith("cross_validate:")
+
+
+def test_cross_validate_fingerprint_sample_size(rf, in_memory_project):
+    from skore.item.fingerprint import fingerprint
+
+    _, X, y = rf
+    cross_validate(
+        *rf, project=in_memory_project, plot=False, fingerprint_sample_size=10
     )
+    item = in_memory_project.get_item("cross_validation")
+
+    assert item.X_info["hash"] == fingerprint(X, sample_size=10)
+    assert item.y_info["hash"] == fingerprint(y, sample_size=10)
+    assert item.X_info["hash"] != fingerprint(X)
+
+
+def test_estimator_classes():
+    import inspect
+
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    from skore.sklearn.cross_validate import _estimator_classes
+
+    pipeline = make_pipeline(StandardScaler(), FitCountingClassifier())
+
+    # Classes of packages are identified by their version, the others by their source
+    assert _estimator_classes(pipeline) == [
+        ("sklearn.pipeline.Pipeline", sklearn.__version__),
+        ("sklearn.preprocessing._data.StandardScaler", sklearn.__version__),
+        (
+            f"{FitCountingClassifier.__module__}.FitCountingClassifier",
+            inspect.getsource(FitCountingClassifier),
+        ),
+    ]
+
+
+def test_cross_validate_cache_without_project(rf):
+    with pytest.raises(ValueError):
+        cross_validate(*rf, cache=True)
+
+
+class InterruptedClassifier(linear_model.LogisticRegression):
+    # Defined at the module level, for its instances to be pickled
+    fits = []
+    interrupt = False
+
+    def fit(self, X, y):
+        if self.interrupt and len(self.fits) == 2:
+            raise KeyboardInterrupt
+
+        self.fits.append(len(X))
+        return super().fit(X, y)
+
+
+def test_cross_validate_incremental(in_memory_project, monkeypatch):
+    X, y = datasets.make_classification(random_state=0)
+    fits = InterruptedClassifier.fits
+    in_memory_project.item_repository.blob_storage = {}
+    kwargs = dict(
+        cv=4, project=in_memory_project, plot=False, incremental=True, run_id="run"
+    )
+
+    monkeypatch.setattr(InterruptedClassifier, "interrupt", True)
+
+    with pytest.raises(KeyboardInterrupt):
+        cross_validate(InterruptedClassifier(), X, y, **kwargs)
+
+    # The results of the completed folds are in the project
+    item = in_memory_project.get_item("cross_validation_in_progress/run")
+
+    assert len(fits) == 2
+    assert len(item.cv_results_serialized["test_score"]) == 2
+
+    monkeypatch.setattr(InterruptedClassifier, "interrupt", False)
+    fits.clear()
+
+    # Only the remaining folds are computed
+    cv_results = cross_validate(InterruptedClassifier(), X, y, **kwargs)
+
+    assert len(fits) == 2
+
+    cv_results_sklearn = sklearn.model_selection.cross_validate(
+        InterruptedClassifier(), X, y, cv=4
+    )
+
+    assert "cross_validation_in_progress/run" not in in_memory_project.list_item_keys()
+
+    # The results of the folds are deleted once the run is completed
+    assert in_memory_project.item_repository.blob_storage == {}
+    assert (
+        len(
+            in_memory_project.get_item("cross_validation").cv_results_serialized[
+                "test_score"
+            ]
+        )
+        == 4
+    )
+    numpy.testing.assert_allclose(
+        cv_results["test_score"], cv_results_sklearn["test_score"]
+    )
+
+
+def test_cross_validate_incremental_without_run_id(in_memory_project, monkeypatch):
+    X, y = datasets.make_classification(random_state=0)
+    in_memory_project.item_repository.blob_storage = {}
+    keys = []
+    put_item = in_memory_project.item_repository.put_item
+
+    def put_item_spy(key, item):
+        keys.append(key)
+        put_item(key, item)
+
+    monkeypatch.setattr(in_memory_project.item_repository, "put_item", put_item_spy)
+
+    for _ in range(2):
+        cross_validate(
+            linear_model.LogisticRegression(),
+            X,
+            y,
+            cv=2,
+            project=in_memory_project,
+            plot=False,
+            incremental=True,
+        )
+
+    # Each run has its own key, and the results of its folds are not stored
+    in_progress_keys = [key for key in keys if key.startswith("cross_validation_in")]
+
+    assert len(in_progress_keys) == 4
+    assert len(set(in_progress_keys)) == 2
+    assert in_memory_project.item_repository.blob_storage == {}
+
+
+def test_cross_validate_run_id_without_incremental(rf, in_memory_project):
+    with pytest.raises(ValueError):
+        cross_validate(*rf, project=in_memory_project, run_id="run")
@@ -1,3 +1,7 @@
+import base64
+import json
+
+import numpy
 import pytest
 from fastapi.testclient import TestClient
 from skore.ui.app import create_app
@@ -49,6 +53,77 @@ def test_get_items(client, in_memory_project):
     }
 
 
+def test_get_items_estimator(client, in_memory_project, monkeypatch):
+    from sklearn.svm import SVC
+
+    calls = []
+
+    def estimator_html_repr(estimator):
+        calls.append(estimator)
+        return "<estimator_html_repr>"
+
+    monkeypatch.setattr("sklearn.utils.estimator_html_repr", estimator_html_repr)
+    in_memory_project.item_repository.blob_storage = {}
+    in_memory_project.put("estimator", SVC(C=0.5))
+
+    assert not calls
+
+    for _ in range(2):
+        response = client.get("/api/project/items")
+
+        assert response.status_code == 200
+        assert response.json()["items"]["estimator"][0]["value"] == (
+            "<estimator_html_repr>"
+        )
+
+    fingerprint = in_memory_project.get_item("estimator").estimator_fingerprint
+
+    assert len(calls) == 1
+    assert in_memory_project.item_repository.blob_storage == {
+        f"estimator_html_repr:{fingerprint}": b"<estimator_html_repr>"
+    }
+
+
+def test_get_items_cross_validation_aggregation(client, in_memory_project):
+    from skore.item.cross_validation_item import (
+        CrossValidationAggregationItem,
+        CrossValidationItem,
+    )
+
+    cross_validation_item = CrossValidationItem(
+        cv_results_serialized={"test_score": [1, 2], "indices": {}},
+        estimator_info={},
+        X_info={},
+        y_info={},
+    )
+
+    # Aggregations stored by older versions are replaced by the one built on read
+    in_memory_project.put_item(
+        "cross_validation_aggregated",
+        CrossValidationAggregationItem.factory([cross_validation_item]),
+    )
+    in_memory_project.put_item("cross_validation", cross_validation_item)
+    in_memory_project.put_item("cross_validation", cross_validation_item)
+
+    response = client.get("/api/project/items")
+
+    assert response.status_code == 200
+
+    [aggregation] = response.json()["items"]["cross_validation_aggregated"]
+    plot = json.loads(base64.b64decode(aggregation["value"]))
+
+    assert aggregation["media_type"] == "application/vnd.plotly.v1+json"
+    assert {run for trace in plot["data"] for run in trace["x"]} == {0, 1}
+
+
+def test_get_items_cross_validation_aggregation_without_runs(client, in_memory_project):
+    in_memory_project.put("cross_validation", "<not a run>")
+
+    response = client.get("/api/project/items")
+
+    assert "cross_validation_aggregated" not in response.json()["items"]
+
+
 def test_put_view_layout(client):
     response = client.put("/api/project/views?key=hello", json=["test"])
     assert response.status_code == 201
@@ -63,3 +138,150 @@ def test_delete_view(client, in_memory_project):
 def test_delete_view_missing(client):
     response = client.delete("/api/project/views?key=hello")
     assert response.status_code == 404
+
+
+def test_metrics(in_memory_project):
+    in_memory_project.put("test", "version_1")
+
+    # The context manager runs the lifespan, which listens to storage reads
+    with TestClient(app=create_app(project=in_memory_project)) as client:
+        client.get("/api/project/items")
+        client.get("/api/project/items")
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    lines = response.text.splitlines()
+    route = 'route="/api/project/items"'
+
+    assert "# TYPE skore_ui_requests_total counter" in lines
+    assert f'skore_ui_requests_total{{{route},method="GET",status="200"}} 2' in lines
+    assert f'skore_ui_request_duration_seconds_count{{{route},method="GET"}} 2' in lines
+    assert f"skore_ui_serialization_duration_seconds_count{{{route}}} 2" in lines
+    assert "skore_ui_serialized_item_cache_hits_total 1" in lines
+    assert "skore_ui_serialized_item_cache_misses_total 1" in lines
+    assert any(
+        line.startswith("skore_ui_storage_read_duration_seconds_count")
+        for line in lines
+    )
+
+    registry = client.app.state.metrics
+    assert registry.response_bytes.get(method="GET", route="/api/project/items") > 0
+
+
+def test_serialized_item_cache_maxbytes():
+    from skore.ui.project_routes import SerializedItem, SerializedItemCache
+
+    def item(value):
+        return SerializedItem("text/markdown", value, "<updated>", "<created>")
+
+    cache = SerializedItemCache(maxbytes=12)
+    cache.set("a", item("<a>"))
+    cache.set("b", item([1]))
+    cache.set("c", item("<c>"))
+
+    # The oldest items are evicted, and items larger than the cache skipped
+    cache.set("d", item("<ddddddddddd>"))
+
+    assert [cache.get(key) for key in "abcd"] == [
+        None,
+        item([1]),
+        item("<c>"),
+        None,
+    ]
+    assert cache.nbytes == 11
+
+
+def test_metrics_histogram():
+    from skore.ui.metrics import Histogram
+
+    histogram = Histogram("latency", "Latency.", ("route",), buckets=(0.1, 1))
+    histogram.observe(0.05, route="/")
+    histogram.observe(0.5, route="/")
+    histogram.observe(5, route="/")
+
+    assert histogram.expose().splitlines() == [
+        "# HELP latency Latency.",
+        "# TYPE latency histogram",
+        'latency_bucket{route="/",le="0.1"} 1',
+        'latency_bucket{route="/",le="1"} 2',
+        'latency_bucket{route="/",le="+Inf"} 3',
+        'latency_sum{route="/"} 5.55',
+        'latency_count{route="/"} 3',
+    ]
+
+
+def test_get_media(client, in_memory_project):
+    from PIL import Image
+
+    in_memory_project.put("image", Image.new("RGB", (512, 512), color="red"))
+    in_memory_project.put("text", "<content>")
+    item = in_memory_project.get_item("image")
+
+    response = client.get("/api/project/media?key=image")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content == item.media_bytes
+
+    response = client.get("/api/project/media?key=image&thumbnail=true")
+    assert response.status_code == 200
+    assert response.content == item.thumbnail_bytes
+
+    # Only the thumbnail is sent with the project
+    response = client.get("/api/project/items")
+    serialized = response.json()["items"]["image"][0]
+    assert serialized["media_type"] == "image/png"
+    assert serialized["value"] == base64.b64encode(item.thumbnail_bytes).decode()
+
+    for query in ("key=text", "key=missing", "key=image&version=1"):
+        response = client.get(f"/api/project/media?{query}")
+        assert response.status_code == 404
+
+
+def test_get_items_media_not_loaded(client, in_memory_project):
+    from hashlib import sha256
+
+    from PIL import Image
+
+    class BlobStorage(dict):
+        def __getitem__(self, key):
+            loaded.append(key)
+            return super().__getitem__(key)
+
+    loaded = []
+    in_memory_project.item_repository.blob_storage = BlobStorage()
+    pixels = numpy.random.default_rng(0).integers(256, size=(512, 512, 3))
+    in_memory_project.put("image", Image.fromarray(pixels.astype(numpy.uint8)))
+    in_memory_project.put("bytes", b"0" * (2**20 + 1))
+    image = in_memory_project.get_item("image")
+    loaded.clear()
+
+    response = client.get("/api/project/items")
+    items = response.json()["items"]
+
+    assert items["image"][0]["media_type"] == "image/png"
+    assert items["bytes"][0]["media_type"] == "text/markdown"
+    assert "too large to be displayed" in items["bytes"][0]["value"]
+
+    # Only the thumbnail is loaded, not the full media
+    assert len(in_memory_project.item_repository.blob_storage) == 3
+    assert loaded == [sha256(image.thumbnail_bytes).hexdigest()]
+
+
+def test_get_media_chunks(client, in_memory_project, monkeypatch, tmp_path):
+    monkeypatch.setattr("skore.item.MediaItem.CHUNK_SIZE", 4)
+    in_memory_project.item_repository.blob_storage = {}
+    path = tmp_path / "media.txt"
+    path.write_bytes(b"<content>")
+    in_memory_project.put("file", path)
+
+    response = client.get("/api/project/items")
+    serialized = response.json()["items"]["file"][0]
+    assert serialized["media_type"] == "text/markdown"
+    assert "(/api/project/media?key=file&version=0)" in serialized["value"]
+
+    response = client.get("/api/project/media?key=file")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.content == b"<content>"
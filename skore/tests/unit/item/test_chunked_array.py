@@ -0,0 +1,85 @@
+import numpy
+import pytest
+from skore.item.chunked_array import ArrayChunks, ChunkedArray, guess_chunk_shape
+
+
+class CountingList(list):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.loaded = set()
+
+    def __getitem__(self, index):
+        self.loaded.add(index)
+        return super().__getitem__(index)
+
+
+@pytest.fixture
+def array():
+    return numpy.arange(7 * 9 * 4, dtype="float32").reshape(7, 9, 4)
+
+
+@pytest.fixture
+def chunked(array):
+    chunks = ArrayChunks(array, (3, 4, 4))
+    return ChunkedArray(array.shape, array.dtype, (3, 4, 4), CountingList(chunks))
+
+
+def test_guess_chunk_shape():
+    assert guess_chunk_shape((100, 100), 8, 8 * 100 * 100) == (100, 100)
+    assert guess_chunk_shape((100, 100), 8, 8 * 50 * 50) == (50, 50)
+    assert guess_chunk_shape((1000, 10), 8, 8 * 100) == (63, 1)
+
+
+def test_array_chunks(array):
+    chunks = ArrayChunks(array, (3, 4, 4))
+
+    assert len(chunks) == 3 * 3 * 1
+    assert len(list(chunks)) == 9
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        ...,
+        0,
+        -1,
+        (slice(1, 5), 2),
+        (slice(None, None, 2), slice(7, 1, -3)),
+        (slice(None, None, -1), ..., 1),
+        (slice(4, 2),),
+        ([6, 0, 3, 3],),
+        (slice(2, 6), [1, -1]),
+        (..., numpy.array([True, False, True, False])),
+        numpy.array([0, 2]),
+        numpy.array([True, False, True, False, False, True, True]),
+        (slice(1, 3), numpy.array([8, 0]), ...),
+        (numpy.array([5, 1]), 2),
+        (0, numpy.array([3, 1])),
+        (0, slice(None), numpy.array([3, 1])),
+        (0, slice(2, 5), [True, False, False, True]),
+        (numpy.array([4]), slice(None), -1),
+    ],
+)
+def test_getitem(array, chunked, key):
+    numpy.testing.assert_array_equal(chunked[key], array[key])
+
+
+def test_getitem_loads_overlapping_chunks(array, chunked):
+    numpy.testing.assert_array_equal(chunked[3:5, 5:8], array[3:5, 5:8])
+
+    assert chunked.chunks.loaded == {4}
+
+
+def test_getitem_errors(chunked):
+    with pytest.raises(IndexError):
+        chunked[7]
+    with pytest.raises(IndexError):
+        chunked[0, 0, 0, 0]
+    with pytest.raises(IndexError):
+        chunked[[0], [0]]
+
+
+def test_array(array, chunked):
+    assert len(chunked) == 7
+    assert chunked.nbytes == array.nbytes
+    numpy.testing.assert_array_equal(numpy.asarray(chunked), array)
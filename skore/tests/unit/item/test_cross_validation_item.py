@@ -1,6 +1,51 @@
 import numpy
+import plotly.graph_objects
 import pytest
+from sklearn.model_selection import KFold, ShuffleSplit, TimeSeriesSplit
 from skore.item import CrossValidationItem, ItemTypeError
+from skore.item.cross_validation_item import decode_indices, encode_indices
+
+
+@pytest.mark.parametrize(
+    "cv,spec",
+    [
+        (KFold(5), {"folds": 5}),
+        (KFold(3, shuffle=True, random_state=0), {"folds": 3}),
+        (
+            TimeSeriesSplit(2),
+            {
+                "train": [{"range": [0, 34]}, {"range": [0, 67]}],
+                "test": [{"range": [34, 67]}, {"range": [67, 100]}],
+            },
+        ),
+        (
+            ShuffleSplit(2, test_size=10, random_state=0),
+            {
+                "train": [{"length": 90}, {"length": 90}],
+                "test": [{"length": 10}, {"length": 10}],
+            },
+        ),
+    ],
+)
+def test_encode_indices(cv, spec):
+    splits = list(cv.split(numpy.zeros((100, 1))))
+    indices = {
+        "train": [train for train, _ in splits],
+        "test": [test for _, test in splits],
+    }
+
+    encoded_spec, npy = encode_indices(indices)
+    decoded = decode_indices(encoded_spec, npy)
+
+    assert encoded_spec == spec
+    assert npy is None or len(npy) < 1024
+
+    for name in ("train", "test"):
+        assert len(decoded[name]) == len(indices[name])
+
+        for expected, array in zip(indices[name], decoded[name]):
+            numpy.testing.assert_array_equal(array, expected)
+            assert array.dtype == numpy.intp
 
 
 class TestCrossValidationItem:
@@ -19,7 +64,7 @@ class TestCrossValidationItem:
 
     def test_factory(self, monkeypatch, mock_nowstr):
         monkeypatch.setattr(
-            "skore.item.cross_validation_item._hash_numpy", lambda x: ""
+            "skore.item.cross_validation_item.fingerprint", lambda *args: ""
         )
 
         class MyEstimator:
@@ -41,6 +86,58 @@ class TestCrossValidationItem:
         assert item.estimator_info == {"name": "MyEstimator", "params": "{}"}
         assert item.X_info == {"nb_cols": 1, "nb_rows": 1, "hash": ""}
         assert item.y_info == {"hash": ""}
-        assert isinstance(item.plot_bytes, bytes)
+        assert item.plot_bytes is None
+        assert isinstance(item.plot, plotly.graph_objects.Figure)
+        assert isinstance(item.plot_json, bytes)
         assert item.created_at == mock_nowstr
         assert item.updated_at == mock_nowstr
+
+    def test_plot_bytes(self):
+        figure = plotly.graph_objects.Figure(plotly.graph_objects.Bar(y=[1, 2]))
+        item = CrossValidationItem(
+            cv_results_serialized={"test_score": [1, 2]},
+            estimator_info={},
+            X_info={},
+            y_info={},
+            plot_bytes=figure.to_json().encode("utf-8"),
+        )
+
+        assert item.plot == figure
+        assert item.plot_json == item.plot_bytes
+
+    def test_factory_indices(self):
+        class MyEstimator:
+            def get_params(self):
+                return {}
+
+        item = CrossValidationItem.factory(
+            cv_results={
+                "test_score": numpy.array([1, 2]),
+                "indices": {
+                    "train": (numpy.array([2, 3]), numpy.array([0, 1])),
+                    "test": (numpy.array([0, 1]), numpy.array([2, 3])),
+                },
+            },
+            estimator=MyEstimator(),
+            X=[[1.0]] * 4,
+            y=None,
+        )
+
+        assert item.cv_results_serialized == {"test_score": [1, 2]}
+        assert item.cv_indices_spec == {"folds": 2}
+        numpy.testing.assert_array_equal(item.cv_indices["train"][0], [2, 3])
+        numpy.testing.assert_array_equal(item.cv_indices["test"][1], [2, 3])
+
+    def test_cv_indices_legacy(self):
+        item = CrossValidationItem(
+            cv_results_serialized={
+                "test_score": [1, 2],
+                "indices": {"train": [[1], [0]], "test": [[0], [1]]},
+            },
+            estimator_info={},
+            X_info={},
+            y_info={},
+        )
+
+        numpy.testing.assert_array_equal(item.cv_indices["train"][0], [1])
+        numpy.testing.assert_array_equal(item.cv_indices["test"][1], [1])
@@ -0,0 +1,132 @@
+import numpy
+import pandas
+import pytest
+import scipy.sparse
+from skore.item import fingerprint as fingerprint_module
+from skore.item.fingerprint import fingerprint
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr("skore.item.fingerprint.CHUNK_SIZE", 16)
+
+
+def test_fingerprint_array(small_chunks):
+    array = numpy.arange(100, dtype="float64").reshape(20, 5)
+
+    assert fingerprint(array) == fingerprint(array.copy())
+    assert fingerprint(array) == fingerprint(array.tolist())
+    assert fingerprint(array) == fingerprint(numpy.asfortranarray(array))
+    assert fingerprint(array[:, ::2]) == fingerprint(array[:, ::2].copy())
+    assert fingerprint(array) != fingerprint(array.reshape(10, 10))
+    assert fingerprint(array) != fingerprint(array.astype("float32"))
+
+    modified = array.copy()
+    modified[-1, -1] = 0
+
+    assert fingerprint(array) != fingerprint(modified)
+
+
+def test_fingerprint_object_array():
+    array = numpy.array(["a", 1, None], dtype=object)
+    matrix = numpy.array([["a", 1], [None, 2.0]], dtype=object)
+
+    assert fingerprint(matrix) == fingerprint(numpy.asfortranarray(matrix))
+
+    assert fingerprint(array) == fingerprint(array.copy())
+    assert fingerprint(array) != fingerprint(array[::-1])
+    assert fingerprint(numpy.array([[1], [2, 3]], dtype=object))
+
+    # Objects of different types with the same string do not collide
+    assert fingerprint(numpy.array([1], dtype=object)) != fingerprint(
+        numpy.array(["1"], dtype=object)
+    )
+    assert fingerprint(pandas.Series([1], dtype=object)) != fingerprint(
+        pandas.Series(["1"], dtype=object)
+    )
+
+
+def test_fingerprint_dataframe(small_chunks):
+    dataframe = pandas.DataFrame(
+        {
+            "a": numpy.arange(10),
+            "b": list("abcdefghij"),
+            "c": pandas.Categorical(list("xy") * 5),
+            "d": pandas.array(range(10), dtype="Int64"),
+        }
+    )
+
+    assert fingerprint(dataframe) == fingerprint(dataframe.copy())
+    assert fingerprint(dataframe) != fingerprint(dataframe.rename(columns={"a": "z"}))
+    assert fingerprint(dataframe["b"]) == fingerprint(dataframe["b"].copy())
+
+    modified = dataframe.copy()
+    modified.loc[9, "b"] = "z"
+
+    assert fingerprint(dataframe) != fingerprint(modified)
+
+
+@pytest.mark.parametrize("format", ["csr", "csc", "coo", "lil"])
+def test_fingerprint_sparse_matrix(format):
+    matrix = scipy.sparse.random(50, 10, density=0.1, format=format, random_state=0)
+
+    assert fingerprint(matrix) == fingerprint(matrix.copy())
+
+    modified = matrix.tocsr(copy=True)
+    modified.data[0] += 1
+
+    assert fingerprint(matrix.tocsr()) != fingerprint(modified)
+
+
+def test_fingerprint_sample_size():
+    array = numpy.arange(1000)
+    modified = array.copy()
+    modified[numpy.setdiff1d(array, fingerprint_module._sample_positions(1000, 10))] = 0
+
+    assert fingerprint(array, sample_size=10) != fingerprint(array)
+    assert fingerprint(array, sample_size=10) == fingerprint(modified, sample_size=10)
+    assert fingerprint(array, sample_size=1000) == fingerprint(array)
+
+
+def test_fingerprint_memoized(monkeypatch):
+    calls = []
+    compute = fingerprint_module._fingerprint
+
+    def counting_fingerprint(data, sample_size):
+        calls.append(data)
+        return compute(data, sample_size)
+
+    monkeypatch.setattr("skore.item.fingerprint._fingerprint", counting_fingerprint)
+
+    array = numpy.arange(10)
+    fingerprint(array)
+    fingerprint(array)
+
+    assert len(calls) == 2
+
+    fingerprint(array, version=1)
+    fingerprint(array, version=1)
+
+    assert len(calls) == 3
+
+    array[0] = 1
+
+    assert fingerprint(array, version=2) != fingerprint(array[::-1], version=2)
+    assert len(calls) == 5
+
+    # Arrays owning their data can be made writeable again
+    array.flags.writeable = False
+    before = fingerprint(array)
+    array.flags.writeable = True
+    array[0] = 2
+    array.flags.writeable = False
+
+    assert fingerprint(array) != before
+    assert len(calls) == 7
+
+    # Arrays over read-only buffers cannot
+    array = numpy.frombuffer(numpy.arange(10).tobytes(), dtype=int)
+    fingerprint(array)
+    fingerprint(array)
+
+    assert len(calls) == 8
@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
+from hashlib import sha256
 
+import numpy
 import pytest
-from skore.item import ItemRepository, MediaItem
+from skore.item import ItemRepository, MediaItem, NumpyArrayItem
 
 
 class TestItemRepository:
@@ -58,6 +60,8 @@ class TestItemRepository:
                         "media_bytes": b"media",
                         "media_encoding": "utf-8",
                         "media_type": "application/octet-stream",
+                        "thumbnail_bytes": None,
+                        "media_chunks": None,
                         "created_at": now,
                         "updated_at": now,
                     },
@@ -84,6 +88,8 @@ class TestItemRepository:
                         "media_bytes": b"media",
                         "media_encoding": "utf-8",
                         "media_type": "application/octet-stream",
+                        "thumbnail_bytes": None,
+                        "media_chunks": None,
                         "created_at": now,
                         "updated_at": now,
                     },
@@ -94,6 +100,8 @@ class TestItemRepository:
                         "media_bytes": b"media2",
                         "media_encoding": "utf-8",
                         "media_type": "application/octet-stream",
+                        "thumbnail_bytes": None,
+                        "media_chunks": None,
                         "created_at": now,
                         "updated_at": now2,
                     },
@@ -139,3 +147,90 @@ class TestItemRepository:
         assert items[1].media_type == "application/octet-stream"
         assert items[1].created_at == now
         assert items[1].updated_at == now2
+
+    def test_get_derived(self):
+        blob_storage = {}
+        repository = ItemRepository({}, blob_storage)
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return "<value>"
+
+        assert repository.get_derived("name", "fingerprint", compute) == "<value>"
+        assert repository.get_derived("name", "fingerprint", compute) == "<value>"
+        assert calls == [None]
+        assert blob_storage == {"name:fingerprint": "<value>"}
+
+        assert ItemRepository({}).get_derived("name", "fingerprint", compute) == (
+            "<value>"
+        )
+        assert len(calls) == 2
+
+    def test_put_item_blob(self):
+        array = numpy.arange(ItemRepository.BLOB_MIN_SIZE)
+        item = NumpyArrayItem.factory(array)
+
+        storage = {}
+        blob_storage = {}
+        repository = ItemRepository(storage, blob_storage)
+        repository.put_item("key", item)
+        repository.put_item("key2", item)
+
+        digest = sha256(item.array_npy).hexdigest()
+
+        assert blob_storage == {digest: item.array_npy}
+        assert storage["key"][0]["blobs"] == {"array_npy": digest}
+        assert "array_npy" not in storage["key"][0]["item"]
+
+        numpy.testing.assert_array_equal(repository.get_item("key").array, array)
+
+    def test_get_stored_item_versions(self):
+        media_bytes = b"0" * ItemRepository.BLOB_MIN_SIZE
+        item = MediaItem.factory(media_bytes)
+
+        blob_storage = {}
+        repository = ItemRepository({}, blob_storage)
+        repository.put_item("key", item)
+        blob_storage.clear()
+
+        # Neither the item is constructed nor its blob loaded
+        [stored] = repository.get_stored_item_versions("key")
+
+        assert stored.item_class is MediaItem
+        assert stored.updated_at == item.updated_at
+        assert stored.get_parameter("media_type") == item.media_type
+        assert stored.get_parameter("thumbnail_bytes") is None
+        assert stored.get_parameter_nbytes("media_bytes") == len(media_bytes)
+
+        with pytest.raises(KeyError):
+            stored.get_parameter("media_bytes")
+
+    def test_vacuum(self):
+        items = [
+            NumpyArrayItem.factory(numpy.arange(ItemRepository.BLOB_MIN_SIZE) + i)
+            for i in range(3)
+        ]
+
+        blob_storage = {"name:fingerprint": "<value>"}
+        repository = ItemRepository({}, blob_storage)
+        repository.put_item("key", items[0])
+        repository.put_item("key", items[1])
+        repository.put_item("key2", items[1])
+        repository.put_item("key3", items[2])
+
+        assert repository.vacuum() == 0
+
+        repository.delete_item("key")
+        repository.delete_item("key3")
+
+        assert repository.vacuum() == 2
+        assert blob_storage == {
+            "name:fingerprint": "<value>",
+            sha256(items[1].array_npy).hexdigest(): items[1].array_npy,
+        }
+        assert repository.vacuum(derived=True) == 1
+        assert blob_storage == {
+            sha256(items[1].array_npy).hexdigest(): items[1].array_npy,
+        }
+        assert ItemRepository({}).vacuum() == 0
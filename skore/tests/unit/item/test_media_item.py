@@ -1,11 +1,12 @@
 import io
+import json
 
 import altair
 import matplotlib.pyplot
 import PIL as pillow
 import plotly.graph_objects as go
 import pytest
-from skore.item import ItemTypeError, MediaItem
+from skore.item import ItemTypeError, MediaItem, MediaPolicy, media_policy
 
 
 class TestMediaItem:
@@ -88,3 +89,150 @@ class TestMediaItem:
         assert item.media_type == "application/vnd.plotly.v1+json"
         assert item.created_at == mock_nowstr
         assert item.updated_at == mock_nowstr
+
+    def test_factory_matplotlib_thumbnail(self):
+        figure, ax = matplotlib.pyplot.subplots(figsize=(8, 4), dpi=100)
+
+        # SVG figures are only rasterized on demand
+        assert MediaItem.factory(figure).thumbnail_bytes is None
+
+        item = MediaItem.factory_matplotlib(figure, MediaPolicy(svg_thumbnail=True))
+        thumbnail = pillow.Image.open(io.BytesIO(item.thumbnail_bytes))
+
+        assert item.media_type == "image/svg+xml"
+        assert thumbnail.format == "PNG"
+        assert thumbnail.size == (256, 128)
+
+    @pytest.mark.parametrize(
+        "policy, size, thumbnail_size",
+        [
+            (MediaPolicy(figure_format="png"), (800, 400), (256, 128)),
+            (MediaPolicy(figure_format="png", dpi=20), (160, 80), None),
+            (
+                MediaPolicy(figure_format="png", max_size=(400, 400)),
+                (400, 200),
+                (256, 128),
+            ),
+            (
+                MediaPolicy(
+                    figure_format="png", max_size=(400, 400), thumbnail_size=(64, 64)
+                ),
+                (400, 200),
+                (64, 32),
+            ),
+            (MediaPolicy(figure_format="png", thumbnail_size=None), (800, 400), None),
+        ],
+    )
+    def test_factory_matplotlib_policy(self, policy, size, thumbnail_size):
+        figure, ax = matplotlib.pyplot.subplots(figsize=(8, 4), dpi=100)
+
+        with media_policy(policy):
+            item = MediaItem.factory(figure)
+
+        image = pillow.Image.open(io.BytesIO(item.media_bytes))
+
+        assert item.media_type == "image/png"
+        assert image.size == size
+
+        if thumbnail_size is None:
+            assert item.thumbnail_bytes is None
+        else:
+            thumbnail = pillow.Image.open(io.BytesIO(item.thumbnail_bytes))
+            assert thumbnail.size == thumbnail_size
+
+    def test_factory_pillow_policy(self):
+        image = pillow.Image.new("RGB", (1000, 500), color="red")
+
+        item = MediaItem.factory_pillow(image, MediaPolicy(max_size=(400, 400)))
+        stored = pillow.Image.open(io.BytesIO(item.media_bytes))
+        thumbnail = pillow.Image.open(io.BytesIO(item.thumbnail_bytes))
+
+        assert stored.size == (400, 200)
+        assert thumbnail.size == (256, 128)
+        assert image.size == (1000, 500)
+
+    def test_factory_plotly_policy(self):
+        figure = go.Figure(data=[go.Scatter(y=[0.123456] * 1000)])
+
+        item = MediaItem.factory(figure)
+        trace = json.loads(item.media_bytes)["data"][0]
+
+        assert trace["y"]["dtype"] == "f8"
+
+        with media_policy(MediaPolicy(plotly_bdata=False, plotly_float_precision=2)):
+            item = MediaItem.factory(figure)
+
+        trace = json.loads(item.media_bytes)["data"][0]
+
+        assert trace["y"] == [0.12] * 1000
+
+    def test_media_policy_exception(self):
+        with pytest.raises(ValueError):
+            MediaPolicy(figure_format="jpeg")
+
+    def test_factory_file(self, tmp_path):
+        path = tmp_path / "media.png"
+        path.write_bytes(b"<content>")
+
+        item = MediaItem.factory(path)
+
+        assert item.media_bytes == b"<content>"
+        assert item.media_chunks is None
+        assert item.media_type == "image/png"
+
+        with open(path, "rb") as file:
+            file.seek(1)
+            item = MediaItem.factory(file, media_type="text/plain")
+
+        assert item.media_bytes == b"content>"
+        assert item.media_type == "text/plain"
+
+    def test_factory_file_chunks(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("skore.item.media_item.MediaItem.CHUNK_SIZE", 4)
+        path = tmp_path / "media"
+        path.write_bytes(b"<content>")
+
+        item = MediaItem.factory(path)
+
+        assert item.media_bytes is None
+        assert item.media_type == "application/octet-stream"
+        assert list(item.media_chunks) == [b"<con", b"tent", b">"]
+        assert item.media_stream().read() == b"<content>"
+
+        with open(path, "rb") as file:
+            item = MediaItem.factory(file)
+            assert list(item.media_chunks) == [b"<con", b"tent", b">"]
+
+    def test_factory_file_not_seekable(self, tmp_path):
+        path = tmp_path / "media"
+        path.write_bytes(b"<content>")
+
+        with open(path, "rb") as file:
+            file.seekable = lambda: False
+            item = MediaItem.factory(file)
+            chunks = list(item.media_chunks)
+
+        assert item.media_bytes is None
+        assert chunks == [b"<content>"]
+
+    def test_factory_file_exception(self, tmp_path):
+        path = tmp_path / "media"
+        path.write_text("<content>")
+
+        with open(path) as file, pytest.raises(ItemTypeError):
+            MediaItem.factory(file)
+
+    def test_media_stream(self):
+        item = MediaItem(
+            media_bytes=None,
+            media_encoding="utf-8",
+            media_type="application/octet-stream",
+            media_chunks=[b"<con", bytearray(b"tent"), memoryview(b">")],
+        )
+
+        with item.media_stream() as stream:
+            assert stream.read(2) == b"<c"
+            assert stream.read(5) == b"onten"
+            assert stream.read() == b"t>"
+
+        assert MediaItem.factory(b"<content>").media_stream().read() == b"<content>"
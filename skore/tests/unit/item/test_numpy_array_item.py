@@ -3,6 +3,7 @@ import json
 import numpy
 import pytest
 from skore.item import ItemTypeError, NumpyArrayItem
+from skore.item.numpy_array_item import array_to_npy
 
 
 class TestNumpyArrayItem:
@@ -17,11 +18,11 @@ class TestNumpyArrayItem:
     @pytest.mark.order(0)
     def test_factory(self, mock_nowstr):
         array = numpy.array([1, 2, 3])
-        array_json = json.dumps(array.tolist())
 
         item = NumpyArrayItem.factory(array)
 
-        assert item.array_json == array_json
+        assert item.array_json is None
+        assert item.array_npy == array_to_npy(array)
         assert item.created_at == mock_nowstr
         assert item.updated_at == mock_nowstr
 
@@ -46,3 +47,57 @@ class TestNumpyArrayItem:
 
         with pytest.raises(TypeError, match="type is not JSON serializable"):
             NumpyArrayItem.factory(array)
+
+    @pytest.mark.order(1)
+    @pytest.mark.parametrize(
+        "array",
+        [
+            numpy.arange(12, dtype="float32").reshape(3, 4),
+            numpy.asfortranarray(numpy.arange(12).reshape(3, 4)),
+            numpy.array([True, False]),
+            numpy.array(["2024-01-01", "NaT"], dtype="datetime64[ns]"),
+            numpy.array(5),
+            numpy.empty((0, 3)),
+        ],
+    )
+    def test_array_view(self, mock_nowstr, array):
+        item = NumpyArrayItem.factory(array)
+        view = item.array_view
+
+        numpy.testing.assert_array_equal(view, array)
+        assert view.dtype == array.dtype
+        assert not view.flags.writeable
+        assert item.array.flags.writeable
+
+        with pytest.raises(ValueError, match="read-only"):
+            view[...] = 0
+
+    @pytest.mark.order(1)
+    def test_array_view_shares_buffer(self, mock_nowstr):
+        buffer = bytearray(array_to_npy(numpy.arange(3)))
+        item = NumpyArrayItem(array_npy=memoryview(buffer))
+
+        assert numpy.shares_memory(item.array_view, numpy.frombuffer(buffer, "u1"))
+        assert not numpy.shares_memory(item.array, numpy.frombuffer(buffer, "u1"))
+
+    @pytest.mark.order(1)
+    def test_chunked_array(self, mock_nowstr, monkeypatch):
+        monkeypatch.setattr(NumpyArrayItem, "CHUNKED_MIN_SIZE", 2**10)
+        monkeypatch.setattr(NumpyArrayItem, "CHUNK_SIZE", 2**8)
+
+        array = numpy.arange(40 * 30, dtype="int64").reshape(40, 30)
+        item = NumpyArrayItem.factory(array)
+
+        assert item.array_npy is None
+        assert item.array_chunks_spec == {
+            "shape": [40, 30],
+            "dtype": "<i8",
+            "chunk_shape": [5, 4],
+        }
+        assert len(item.array_chunks) == 8 * 8
+
+        numpy.testing.assert_array_equal(
+            item.chunked_array[3:17, [2, 29]], array[3:17, [2, 29]]
+        )
+        numpy.testing.assert_array_equal(item.array, array)
+        numpy.testing.assert_array_equal(item.array_view, array)
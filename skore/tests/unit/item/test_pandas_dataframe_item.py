@@ -1,8 +1,9 @@
 import numpy as np
 import pytest
-from pandas import DataFrame, Index, MultiIndex
+from pandas import DataFrame, Index, MultiIndex, date_range
 from pandas.testing import assert_frame_equal
 from skore.item import ItemTypeError, PandasDataFrameItem
+from skore.item.numpy_array_item import array_to_npy
 
 
 class TestPandasDataFrameItem:
@@ -18,6 +19,22 @@ class TestPandasDataFrameItem:
     def test_factory(self, mock_nowstr):
         dataframe = DataFrame([{"key": "value"}], Index([0], name="myIndex"))
 
+        item = PandasDataFrameItem.factory(dataframe)
+
+        assert item.index_json is None
+        assert item.dataframe_json is None
+        assert item.dataframe_spec["columns_labels"] == ["key"]
+        assert item.dataframe_spec["index"]["names"] == ["myIndex"]
+        assert item.dataframe_buffer.startswith(array_to_npy(np.array([0])))
+        assert item.created_at == mock_nowstr
+        assert item.updated_at == mock_nowstr
+
+    @pytest.mark.order(0)
+    def test_factory_json(self, mock_nowstr):
+        dataframe = DataFrame(
+            [[1, 2]], columns=MultiIndex.from_tuples([(0, 1), (0, 2)])
+        )
+
         orient = PandasDataFrameItem.ORIENT
         index_json = dataframe.index.to_frame(index=False).to_json(orient=orient)
         dataframe_json = dataframe.reset_index(drop=True).to_json(orient=orient)
@@ -26,8 +43,8 @@ class TestPandasDataFrameItem:
 
         assert item.index_json == index_json
         assert item.dataframe_json == dataframe_json
-        assert item.created_at == mock_nowstr
-        assert item.updated_at == mock_nowstr
+        assert item.dataframe_spec is None
+        assert item.dataframe_buffer is None
 
     @pytest.mark.order(1)
     def test_dataframe(self, mock_nowstr):
@@ -79,3 +96,36 @@ class TestPandasDataFrameItem:
 
         assert_frame_equal(item1.dataframe, dataframe)
         assert_frame_equal(item2.dataframe, dataframe)
+
+    @pytest.mark.order(1)
+    def test_dataframe_columns(self, mock_nowstr):
+        dataframe = DataFrame(
+            {
+                "int": np.arange(3),
+                "float": [0.5, np.nan, 1.5],
+                "bool": [True, False, True],
+                "datetime": date_range("2024-01-01", periods=3),
+                "datetime_tz": date_range("2024-01-01", periods=3, tz="Europe/Paris"),
+                "str": ["a", None, "c"],
+                0: [1, None, 3],
+            },
+            index=Index([3.0, 2.0, 1.0], name="myIndex"),
+        ).astype({0: "Int64"})
+        dataframe.columns.name = "columns"
+
+        item = PandasDataFrameItem.factory(dataframe)
+
+        assert_frame_equal(item.dataframe, dataframe)
+        assert_frame_equal(item.dataframe_view, dataframe)
+
+    @pytest.mark.order(1)
+    def test_dataframe_view(self, mock_nowstr):
+        dataframe = DataFrame({"a": [1.0, 2.0], "b": [3, 4]})
+        item = PandasDataFrameItem.factory(dataframe)
+        buffer = np.frombuffer(item.dataframe_buffer, "u1")
+
+        assert np.shares_memory(item.dataframe_view["a"].to_numpy(), buffer)
+        assert not np.shares_memory(item.dataframe["a"].to_numpy(), buffer)
+
+        with pytest.raises(ValueError, match="read-only"):
+            item.dataframe_view.iloc[0, 0] = 0
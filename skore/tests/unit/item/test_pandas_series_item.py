@@ -1,7 +1,17 @@
+from datetime import date
+
 import numpy as np
 import pytest
-from pandas import Index, MultiIndex, Series
+from pandas import (
+    Categorical,
+    Index,
+    MultiIndex,
+    Series,
+    date_range,
+    timedelta_range,
+)
 from pandas.testing import assert_series_equal
+from pandas.tseries.offsets import CustomBusinessDay
 from skore.item import ItemTypeError, PandasSeriesItem
 
 
@@ -18,14 +28,19 @@ class TestPandasSeriesItem:
     def test_factory(self, mock_nowstr):
         series = Series([0, 1, 2], Index([0, 1, 2], name="myIndex"))
 
-        orient = PandasSeriesItem.ORIENT
-        index_json = series.index.to_frame(index=False).to_json(orient=orient)
-        series_json = series.reset_index(drop=True).to_json(orient=orient)
-
         item = PandasSeriesItem.factory(series)
 
-        assert item.index_json == index_json
-        assert item.series_json == series_json
+        assert item.index_json is None
+        assert item.series_json is None
+        assert item.series_spec == {
+            "index": {
+                "names": ["myIndex"],
+                "levels": [{"dtype": "int64", "npy": 0}],
+            },
+            "values": {"dtype": "int64", "npy": 192},
+            "name": None,
+        }
+        assert item.series_buffer.startswith(np.lib.format.magic(1, 0) + b"\x76\x00")
         assert item.created_at == mock_nowstr
         assert item.updated_at == mock_nowstr
 
@@ -79,3 +94,66 @@ class TestPandasSeriesItem:
 
         assert_series_equal(item1.series, series)
         assert_series_equal(item2.series, series)
+
+    @pytest.mark.order(1)
+    @pytest.mark.parametrize(
+        "series",
+        (
+            Series(np.arange(3.0), date_range("2024-01-01", periods=3), name="x"),
+            Series(
+                date_range("2024-01-01", periods=3, tz="Europe/Paris", unit="us"),
+                timedelta_range("1D", periods=3),
+            ),
+            Series(Categorical(["b", "a", "b"], categories=["b", "a", "c"])),
+            Series(Categorical([2, None, 1], ordered=True), name=0),
+            Series([1, None, 3], dtype="Int64"),
+            Series([True, None, False], dtype="boolean"),
+            Series(["a", None, "c"], Index(["x", "y", "z"], name="letters")),
+            Series(
+                np.arange(4, dtype="int8"),
+                MultiIndex.from_arrays(
+                    [
+                        Categorical(["a", "a", "b", "b"]),
+                        date_range("2024-01-01", periods=4, tz="UTC"),
+                    ],
+                    names=(0, "date"),
+                ),
+            ),
+        ),
+    )
+    def test_series_dtypes(self, mock_nowstr, series):
+        item = PandasSeriesItem.factory(series)
+
+        assert item.series_spec is not None
+        assert_series_equal(item.series, series)
+        assert_series_equal(item.series_view, series)
+
+    @pytest.mark.order(1)
+    def test_series_custom_frequency(self, mock_nowstr):
+        freq = CustomBusinessDay(holidays=["2024-01-02"])
+        series = Series(np.arange(3.0), date_range("2024-01-01", periods=3, freq=freq))
+        item = PandasSeriesItem.factory(series)
+
+        # The frequency is lost, not the holidays
+        assert_series_equal(item.series, series, check_freq=False)
+
+    @pytest.mark.order(1)
+    def test_series_view(self, mock_nowstr):
+        series = Series([1.0, 2.0], Index([3, 4]))
+        item = PandasSeriesItem.factory(series)
+        buffer = np.frombuffer(item.series_buffer, "u1")
+
+        assert np.shares_memory(item.series_view.to_numpy(), buffer)
+        assert np.shares_memory(item.series_view.index.to_numpy(), buffer)
+        assert not np.shares_memory(item.series.to_numpy(), buffer)
+
+        with pytest.raises(ValueError, match="read-only"):
+            item.series_view.iloc[0] = 0
+
+    @pytest.mark.order(1)
+    def test_series_with_non_json_index_name(self, mock_nowstr):
+        series = Series([1, 2], Index([0, 1], name=date(2024, 1, 1)))
+        item = PandasSeriesItem.factory(series)
+
+        assert item.series_spec is None
+        assert item.series.tolist() == [1, 2]
@@ -0,0 +1,103 @@
+import json
+
+import numpy
+import plotly.graph_objects as go
+import pytest
+from skore.item.plotly_encoding import (
+    BDATA_MIN_SIZE,
+    figure_from_json,
+    figure_to_json,
+)
+
+
+@pytest.fixture
+def figure():
+    return go.Figure(
+        data=[
+            go.Scatter(
+                x=numpy.arange(1000),
+                y=numpy.linspace(0, 1, 1000),
+                marker={"color": [i % 3 for i in range(1000)]},
+                text=["a"] * 1000,
+            ),
+            go.Heatmap(z=numpy.arange(200, dtype="float32").reshape(100, 2)),
+            go.Bar(x=[1, 2, 3], y=[0.123456, 2, 3]),
+        ]
+    )
+
+
+def test_figure_to_json(figure):
+    figure_json = figure_to_json(figure)
+    scatter, heatmap, bar = json.loads(figure_json)["data"]
+
+    assert scatter["x"]["dtype"] == "i4"
+    assert scatter["y"]["dtype"] == "f8"
+    assert scatter["marker"]["color"]["dtype"] == "i4"
+    assert scatter["text"] == ["a"] * 1000
+    assert heatmap["z"]["dtype"] == "f4"
+    assert heatmap["z"]["shape"] == "100,2"
+    assert bar["x"] == [1, 2, 3]
+    assert len(figure_json) < len(figure.to_json())
+
+
+def test_figure_from_json(figure):
+    decoded = figure_from_json(figure_to_json(figure))
+    scatter, heatmap, bar = decoded.data
+
+    numpy.testing.assert_array_equal(scatter.x, numpy.arange(1000))
+    numpy.testing.assert_array_equal(scatter.y, numpy.linspace(0, 1, 1000))
+    numpy.testing.assert_array_equal(scatter.marker.color, figure.data[0].marker.color)
+    numpy.testing.assert_array_equal(heatmap.z, figure.data[1].z)
+    assert bar.y == (0.123456, 2, 3)
+    assert decoded.layout == figure.layout
+
+
+def test_figure_to_json_float_precision(figure):
+    for bdata in (True, False):
+        decoded = figure_from_json(
+            figure_to_json(figure, bdata=bdata, float_precision=2)
+        )
+
+        numpy.testing.assert_array_equal(
+            decoded.data[0].y, numpy.linspace(0, 1, 1000).round(2)
+        )
+        assert decoded.data[2].y == (0.12, 2, 3)
+
+
+def test_figure_to_json_int64_overflow():
+    figure = go.Figure(go.Scatter(y=numpy.full(BDATA_MIN_SIZE, 2**40)))
+    figure_json = figure_to_json(figure)
+
+    assert json.loads(figure_json)["data"][0]["y"] == [2**40] * BDATA_MIN_SIZE
+
+
+def test_figure_from_json_text(figure):
+    decoded = figure_from_json(figure.to_json())
+
+    assert decoded == figure
+
+
+def test_figure_to_json_ragged():
+    customdata = [[1], [1, 2]] * BDATA_MIN_SIZE
+    figure = go.Figure(go.Scatter(y=[1, 2], customdata=customdata))
+    scatter = json.loads(figure_to_json(figure))["data"][0]
+
+    assert scatter["customdata"] == customdata
+
+
+def test_figure_to_json_mixed_types():
+    values = [True, 1] * BDATA_MIN_SIZE
+    figure = go.Figure(go.Scatter(y=[1, 2], customdata=values))
+
+    assert json.loads(figure_to_json(figure))["data"][0]["customdata"] == values
+
+
+def test_figure_to_json_float_precision_styling():
+    figure = go.Figure(
+        go.Scatter(y=[0.55, 1.25], marker={"opacity": 0.55}, line={"width": 1.5})
+    )
+    scatter = json.loads(figure_to_json(figure, float_precision=0))["data"][0]
+
+    assert scatter["y"] == [1.0, 1.0]
+    assert scatter["marker"]["opacity"] == 0.55
+    assert scatter["line"]["width"] == 1.5
@@ -1,5 +1,7 @@
+import numpy
 import pytest
 from skore.item import ItemTypeError, PrimitiveItem
+from skore.item.primitive_item import is_primitive
 
 
 class TestPrimitiveItem:
@@ -27,3 +29,57 @@ class TestPrimitiveItem:
     def test_factory_exception(self):
         with pytest.raises(ItemTypeError):
             PrimitiveItem.factory(None)
+
+    @pytest.mark.parametrize(
+        "primitive",
+        [
+            [0.5] * 2048,
+            [1, -(2**63)] * 1024,
+            [True, False] * 1024,
+            [[0.5, 1.5, float("nan")]] * 1024,
+        ],
+    )
+    def test_factory_compact(self, primitive):
+        item = PrimitiveItem.factory(primitive)
+
+        assert item.primitive_npy is not None
+        assert item.__parameters__["primitive"] is None
+
+        item = PrimitiveItem(**item.__parameters__)
+        restored = item.primitive
+
+        assert repr(restored) == repr(primitive)
+        assert {type(value) for value in restored} == {
+            type(value) for value in primitive
+        }
+
+    @pytest.mark.parametrize(
+        "primitive",
+        [
+            [0.5] * 10,
+            [0.5, 1] * 1024,
+            [2**64] * 2048,
+            [[0.5], [0.5, 1.5]] * 1024,
+            (0.5,) * 2048,
+            [numpy.float64(0.5)] * 2048,
+        ],
+    )
+    def test_factory_not_compact(self, primitive):
+        item = PrimitiveItem.factory(primitive)
+
+        assert item.primitive_npy is None
+        assert item.primitive is primitive
+
+    def test_is_primitive(self):
+        cyclic = []
+        cyclic.append(cyclic)
+        shared = [0]
+
+        assert is_primitive([0.5, (1, "a"), {"b": [True, {2: 3.5}]}])
+        assert is_primitive([shared, shared])
+        assert not is_primitive(cyclic)
+        assert not is_primitive({"a": [0, {"b": cyclic}]})
+        assert is_primitive([[shared], {"a": shared}, (shared,)])
+        assert not is_primitive([0.5, (1, "a"), {"b": [True, {2: None}]}])
+        assert not is_primitive({(0,): 1})
+        assert not is_primitive([0.5] * 1000 + [None])
@@ -0,0 +1,160 @@
+import numpy
+import pytest
+from skore.item import (
+    Item,
+    ItemRegistry,
+    ItemTypeError,
+    NumpyArrayItem,
+    PrimitiveItem,
+    object_to_item,
+    register_item_type,
+    registry,
+)
+from skore.item.registry import qualified_name
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class PointItem(Item):
+    def __init__(self, x, y, created_at=None, updated_at=None):
+        super().__init__(created_at, updated_at)
+
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def factory(cls, point):
+        if not isinstance(point, Point):
+            raise ItemTypeError(f"Type '{point.__class__}' is not supported.")
+
+        return cls(x=point.x, y=point.y)
+
+
+@pytest.fixture
+def point_item_type():
+    register_item_type(
+        PointItem,
+        Point,
+        decode=lambda item, copy: Point(item.x, item.y),
+    )
+
+    yield
+
+    registry.unregister(PointItem)
+
+
+def test_qualified_name():
+    assert qualified_name(numpy.ndarray) == "numpy.ndarray"
+    assert qualified_name(Point) == f"{__name__}.Point"
+
+
+def test_object_to_item(point_item_type):
+    assert isinstance(object_to_item(1), PrimitiveItem)
+    assert isinstance(object_to_item(numpy.array([1])), NumpyArrayItem)
+    assert isinstance(object_to_item(Point(1, 2)), PointItem)
+
+    with pytest.raises(NotImplementedError):
+        object_to_item(object())
+
+    with pytest.raises(NotImplementedError):
+        object_to_item([object()])
+
+
+def test_resolve():
+    registry = ItemRegistry()
+
+    class Subclass(int): ...
+
+    assert registry.resolve(Subclass) == ()
+
+    registry.register(PrimitiveItem, int)
+
+    assert registry.resolve(Subclass) == (PrimitiveItem.factory,)
+    assert registry.resolve(Subclass) is registry.resolve(Subclass)
+
+
+def test_fall_through():
+    registry = ItemRegistry()
+
+    def unsupported(object):
+        raise ItemTypeError
+
+    registry.register(PointItem, Point, unsupported)
+    registry.register(PointItem, object)
+
+    assert isinstance(registry.object_to_item(Point(1, 2)), PointItem)
+
+    with pytest.raises(NotImplementedError):
+        registry.object_to_item(1)
+
+
+def test_register_by_name():
+    registry = ItemRegistry()
+    registry.register(PointItem, qualified_name(Point))
+
+    assert registry.item_classes == {"PointItem": PointItem}
+    assert isinstance(registry.object_to_item(Point(1, 2)), PointItem)
+
+
+def test_project(in_memory_project, point_item_type):
+    in_memory_project.put("point", Point(1, 2))
+
+    assert isinstance(in_memory_project.get_item("point"), PointItem)
+
+    point = in_memory_project.get("point")
+
+    assert (point.x, point.y) == (1, 2)
+
+
+def test_unregister():
+    registry = ItemRegistry()
+    registry.register(PointItem, Point, decode=lambda item, copy: None)
+    registry.register(PrimitiveItem, int)
+
+    assert isinstance(registry.object_to_item(Point(1, 2)), PointItem)
+
+    registry.unregister(PointItem)
+
+    assert registry.item_classes == {"PrimitiveItem": PrimitiveItem}
+    assert registry.decoders == {}
+    assert isinstance(registry.object_to_item(1), PrimitiveItem)
+
+    with pytest.raises(NotImplementedError):
+        registry.object_to_item(Point(1, 2))
+
+
+def test_register_conflicting_name():
+    registry = ItemRegistry()
+    registry.register(PrimitiveItem, int)
+
+    class PrimitiveItem_(Item):
+        pass
+
+    PrimitiveItem_.__name__ = "PrimitiveItem"
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(PrimitiveItem_, Point)
+
+    registry.unregister(PrimitiveItem_)
+
+    assert registry.item_classes == {"PrimitiveItem": PrimitiveItem}
+    assert isinstance(registry.object_to_item(1), PrimitiveItem)
+
+    with pytest.raises(NotImplementedError):
+        registry.object_to_item(Point(1, 2))
+
+    # Registering a class again is not a conflict
+    registry.register(PrimitiveItem, float)
+
+    assert isinstance(registry.object_to_item(1.0), PrimitiveItem)
+
+
+def test_pandas():
+    import pandas
+
+    assert registry.resolve(pandas.DataFrame)
+    assert registry.resolve(pandas.Series)
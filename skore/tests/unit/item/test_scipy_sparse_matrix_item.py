@@ -0,0 +1,85 @@
+import numpy
+import pytest
+import scipy.sparse
+from skore.item import ItemTypeError, ScipySparseMatrixItem
+from skore.item.numpy_array_item import array_to_npy
+
+
+def assert_sparse_equal(actual, expected):
+    assert type(actual) is type(expected)
+    assert actual.shape == expected.shape
+
+    for name in ("data", "indices", "indptr"):
+        assert getattr(actual, name).dtype == getattr(expected, name).dtype
+        numpy.testing.assert_array_equal(getattr(actual, name), getattr(expected, name))
+
+
+class TestScipySparseMatrixItem:
+    @pytest.fixture(autouse=True)
+    def monkeypatch_datetime(self, monkeypatch, MockDatetime):
+        monkeypatch.setattr("skore.item.item.datetime", MockDatetime)
+
+    @pytest.mark.parametrize(
+        "matrix",
+        (
+            None,
+            numpy.eye(2),
+            scipy.sparse.coo_matrix(numpy.eye(2)),
+        ),
+    )
+    def test_factory_exception(self, matrix):
+        with pytest.raises(ItemTypeError):
+            ScipySparseMatrixItem.factory(matrix)
+
+    @pytest.mark.order(0)
+    def test_factory(self, mock_nowstr):
+        matrix = scipy.sparse.csr_matrix(numpy.array([[0, 1.0], [2.0, 0]]))
+
+        item = ScipySparseMatrixItem.factory(matrix)
+
+        assert item.sparse_spec == {"class": "csr_matrix", "shape": [2, 2]}
+        assert item.data_npy == array_to_npy(matrix.data)
+        assert item.indices_npy == array_to_npy(matrix.indices)
+        assert item.indptr_npy == array_to_npy(matrix.indptr)
+        assert item.summary["nnz"] == 2
+        assert item.summary["density"] == 0.5
+        assert item.created_at == mock_nowstr
+        assert item.updated_at == mock_nowstr
+
+    @pytest.mark.order(1)
+    @pytest.mark.parametrize(
+        "cls", ("csr_matrix", "csc_matrix", "csr_array", "csc_array")
+    )
+    @pytest.mark.parametrize("dtype", ("float32", "int8", "bool", "complex128"))
+    def test_matrix(self, mock_nowstr, cls, dtype):
+        dense = numpy.random.default_rng(0).random((20, 10))
+        matrix = getattr(scipy.sparse, cls)((dense > 0.8).astype(dtype))
+        item = ScipySparseMatrixItem.factory(matrix)
+
+        assert_sparse_equal(item.matrix, matrix)
+        assert_sparse_equal(item.matrix_view, matrix)
+
+    @pytest.mark.order(1)
+    def test_matrix_index_dtype(self, mock_nowstr):
+        matrix = scipy.sparse.random(5, 5, density=0.5, format="csr", random_state=0)
+        matrix.indices = matrix.indices.astype("int64")
+        matrix.indptr = matrix.indptr.astype("int64")
+        matrix.has_sorted_indices = False
+        matrix.indices[:2] = matrix.indices[1::-1]
+
+        item = ScipySparseMatrixItem.factory(matrix)
+
+        assert_sparse_equal(item.matrix, matrix)
+
+    @pytest.mark.order(1)
+    def test_matrix_view(self, mock_nowstr):
+        matrix = scipy.sparse.random(100, 5, density=0.5, format="csr", random_state=0)
+        item = ScipySparseMatrixItem.factory(matrix)
+        buffer = numpy.frombuffer(item.data_npy, "u1")
+
+        assert numpy.shares_memory(item.matrix_view.data, buffer)
+        assert not numpy.shares_memory(item.matrix.data, buffer)
+        assert_sparse_equal(item.matrix_view[10:20], matrix[10:20])
+
+        with pytest.raises(ValueError, match="read-only"):
+            item.matrix_view.data[0] = 0
@@ -1,7 +1,12 @@
+import numpy
 import pytest
 import sklearn.svm
 import skops.io
-from skore.item import ItemTypeError, SklearnBaseEstimatorItem
+from skore.item import ItemRepository, ItemTypeError, SklearnBaseEstimatorItem
+from skore.item.sklearn_base_estimator_item import (
+    _FingerprintCache,
+    estimator_fingerprint,
+)
 
 
 class Estimator(sklearn.svm.SVC):
@@ -13,6 +18,14 @@ class TestSklearnBaseEstimatorItem:
     def monkeypatch_datetime(self, monkeypatch, MockDatetime):
         monkeypatch.setattr("skore.item.item.datetime", MockDatetime)
 
+    @pytest.fixture(autouse=True)
+    def monkeypatch_caches(self, monkeypatch):
+        for name in ("_serialization_cache", "_html_repr_cache"):
+            monkeypatch.setattr(
+                f"skore.item.sklearn_base_estimator_item.{name}",
+                _FingerprintCache(SklearnBaseEstimatorItem.CACHE_SIZE),
+            )
+
     def test_factory_exception(self):
         with pytest.raises(ItemTypeError):
             SklearnBaseEstimatorItem.factory(None)
@@ -36,7 +49,8 @@ class TestSklearnBaseEstimatorItem:
 
         item = SklearnBaseEstimatorItem.factory(estimator)
 
-        assert item.estimator_html_repr == estimator_html_repr
+        assert item.estimator_html_repr is None
+        assert item.html_repr == estimator_html_repr
         assert item.estimator_skops == estimator_skops
         assert item.estimator_skops_untrusted_types == estimator_skops_untrusted_types
         assert item.created_at == mock_nowstr
@@ -90,3 +104,105 @@ class TestSklearnBaseEstimatorItem:
 
         assert isinstance(item1.estimator, Estimator)
         assert isinstance(item2.estimator, Estimator)
+
+    def test_estimator_fingerprint(self):
+        X, y = numpy.array([[0.0], [1.0], [2.0], [3.0]]), numpy.array([0, 0, 1, 1])
+
+        fingerprint = estimator_fingerprint(sklearn.svm.SVC())
+
+        assert fingerprint == estimator_fingerprint(sklearn.svm.SVC())
+        assert fingerprint != estimator_fingerprint(sklearn.svm.SVC(C=2))
+        assert fingerprint != estimator_fingerprint(sklearn.svm.SVC().fit(X, y))
+        assert estimator_fingerprint(sklearn.svm.SVC().fit(X, y)) != (
+            estimator_fingerprint(sklearn.svm.SVC().fit(X, 1 - y))
+        )
+
+    @pytest.mark.order(1)
+    def test_factory_unchanged_estimator(self, monkeypatch, mock_nowstr):
+        dumps = skops.io.dumps
+        calls = []
+
+        def counting_dumps(*args, **kwargs):
+            calls.append(args)
+            return dumps(*args, **kwargs)
+
+        monkeypatch.setattr("skops.io.dumps", counting_dumps)
+
+        estimator = sklearn.svm.SVC()
+        item1 = SklearnBaseEstimatorItem.factory(estimator)
+        item2 = SklearnBaseEstimatorItem.factory(estimator)
+
+        assert len(calls) == 1
+        assert item2.estimator_fingerprint == item1.estimator_fingerprint
+        assert item2.estimator_skops is item1.estimator_skops
+
+        estimator.set_params(C=2)
+        item3 = SklearnBaseEstimatorItem.factory(estimator)
+
+        assert len(calls) == 2
+        assert item3.estimator_fingerprint != item1.estimator_fingerprint
+        assert item3.estimator.C == 2
+
+    @pytest.mark.order(1)
+    def test_factory_unchanged_estimator_blob(self, monkeypatch, mock_nowstr):
+        monkeypatch.setattr(ItemRepository, "BLOB_MIN_SIZE", 0)
+
+        blob_storage = {}
+        repository = ItemRepository({}, blob_storage)
+        estimator = sklearn.svm.SVC()
+
+        repository.put_item("key", SklearnBaseEstimatorItem.factory(estimator))
+        repository.put_item("key", SklearnBaseEstimatorItem.factory(estimator))
+
+        assert len(blob_storage) == 1
+        assert isinstance(repository.get_item("key").estimator, sklearn.svm.SVC)
+
+    @pytest.mark.order(1)
+    def test_html_repr(self, monkeypatch, mock_nowstr):
+        calls = []
+
+        def estimator_html_repr(estimator):
+            calls.append(estimator)
+            return "<estimator_html_repr>"
+
+        monkeypatch.setattr("sklearn.utils.estimator_html_repr", estimator_html_repr)
+
+        estimator = sklearn.svm.SVC()
+        item1 = SklearnBaseEstimatorItem.factory(estimator)
+        item2 = SklearnBaseEstimatorItem(
+            estimator_html_repr=None,
+            estimator_skops=item1.estimator_skops,
+            estimator_skops_untrusted_types=item1.estimator_skops_untrusted_types,
+            estimator_fingerprint=item1.estimator_fingerprint,
+        )
+
+        assert not calls
+        assert item1.html_repr == "<estimator_html_repr>"
+        assert item2.html_repr == "<estimator_html_repr>"
+        assert calls == [estimator]
+
+    @pytest.mark.order(1)
+    def test_html_repr_stored(self, mock_nowstr):
+        # The positional parameters are those of items stored with their HTML
+        item = SklearnBaseEstimatorItem(
+            "<estimator_html_repr>",
+            skops.io.dumps(sklearn.svm.SVC()),
+            [],
+            mock_nowstr,
+            mock_nowstr,
+        )
+
+        assert item.html_repr == "<estimator_html_repr>"
+        assert item.created_at == mock_nowstr
+
+    def test_fingerprint_cache_maxbytes(self):
+        cache = _FingerprintCache(maxsize=8, maxbytes=10)
+        cache.set("a", "<a>", 4)
+        cache.set("b", "<b>", 4)
+        cache.set("c", "<c>", 4)
+
+        # The oldest values are evicted, and values larger than the cache skipped
+        cache.set("d", "<d>", 11)
+
+        assert [cache.get(key) for key in "abcd"] == [None, "<b>", "<c>", None]
+        assert cache.nbytes == 8
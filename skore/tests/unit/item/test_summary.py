@@ -0,0 +1,93 @@
+import numpy
+import pandas
+from skore.item import summary
+
+
+def test_summarize_array():
+    array = numpy.array([[1.0, numpy.nan], [3.0, 4.0]])
+
+    assert summary.summarize_array(array) == {
+        "shape": [2, 2],
+        "dtype": "float64",
+        "null_count": 1,
+        "min": 1.0,
+        "max": 4.0,
+        "mean": 8 / 3,
+        "std": numpy.std([1.0, 3.0, 4.0]),
+        "quantiles": {"0.25": 2.0, "0.5": 3.0, "0.75": 3.5},
+    }
+
+
+def test_summarize_array_object():
+    array = numpy.array([object()])
+
+    assert summary.summarize_array(array) == {"shape": [1], "dtype": "object"}
+
+
+def test_summarize_array_sampled(monkeypatch):
+    monkeypatch.setattr(summary, "EXACT_MAX_SIZE", 100)
+    monkeypatch.setattr(summary, "SAMPLE_SIZE", 10)
+
+    array = numpy.arange(1000).reshape(10, 100)
+    result = summary.summarize_array(array)
+
+    assert result["shape"] == [10, 100]
+    assert result["sample_size"] == 10
+    assert 0 <= result["min"] <= result["max"] < 1000
+
+
+def test_summarize_std():
+    values = [1.0, 2.0, 4.0, 8.0]
+
+    # NumPy and pandas objects have the same standard deviation
+    assert summary.summarize_array(numpy.array(values))["std"] == numpy.std(values)
+    assert summary.summarize_series(pandas.Series(values))["std"] == numpy.std(values)
+    assert summary.summarize_dataframe(pandas.DataFrame({"a": values}))["columns"][0][
+        "std"
+    ] == numpy.std(values)
+    assert summary.summarize_series(pandas.Series([1.0]))["std"] == 0.0
+
+
+def test_summarize_series():
+    series = pandas.Series(["a", "b", None, "a"])
+
+    assert summary.summarize_series(series) == {
+        "length": 4,
+        "dtype": str(series.dtype),
+        "null_count": 1,
+        "unique_count": 2,
+    }
+
+
+def test_summarize_dataframe():
+    dataframe = pandas.DataFrame(
+        {
+            "int": pandas.array([1, None, 3], dtype="Int64"),
+            "bool": [True, False, False],
+            "datetime": pandas.date_range("2024-01-01", periods=3, tz="UTC"),
+            0: [[1], [2], [3]],
+        }
+    )
+
+    result = summary.summarize_dataframe(dataframe)
+
+    assert result["shape"] == [3, 4]
+    assert [column["name"] for column in result["columns"]] == [
+        "int",
+        "bool",
+        "datetime",
+        0,
+    ]
+    assert result["columns"][0] == {
+        "name": "int",
+        "dtype": "Int64",
+        "null_count": 1,
+        "min": 1,
+        "max": 3,
+        "mean": 2.0,
+        "std": numpy.std([1, 3]),
+        "quantiles": {"0.25": 1.5, "0.5": 2.0, "0.75": 2.5},
+    }
+    assert result["columns"][1]["mean"] == 1 / 3
+    assert result["columns"][2]["max"] == "2024-01-03T00:00:00+00:00"
+    assert "unique_count" not in result["columns"][3]
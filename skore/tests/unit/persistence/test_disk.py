@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from skore.persistence.disk_cache_storage import DiskCacheStorage
+import pytest
+from skore.persistence.disk_cache_storage import DiskCacheStorage, StorageIsReadOnly
 
 
 def test_disk_storage(tmp_path: Path):
@@ -22,3 +23,52 @@ def test_disk_storage(tmp_path: Path):
     assert list(storage.items()) == []
 
     assert repr(storage) == f"DiskCacheStorage(directory='{tmp_path}')"
+
+
+def test_disk_storage_readonly(tmp_path: Path):
+    writer = DiskCacheStorage(tmp_path)
+    writer["key"] = "value"
+    writer["large"] = b"0" * 2**16
+    writer["pickled"] = ["0" * 2**16]
+
+    storage = DiskCacheStorage(tmp_path, readonly=True)
+
+    assert storage["key"] == "value"
+    assert bytes(storage["large"]) == b"0" * 2**16
+    assert storage["pickled"] == ["0" * 2**16]
+    assert "key" in storage
+    assert "missing" not in storage
+    assert list(storage.keys()) == ["key", "large", "pickled"]
+
+    with pytest.raises(KeyError):
+        storage["missing"]
+
+    with pytest.raises(StorageIsReadOnly):
+        storage["key"] = "other value"
+
+    with pytest.raises(StorageIsReadOnly):
+        del storage["key"]
+
+    # Readers see the changes of the writer, and never block it
+    writer["key"] = "new value"
+    del writer["pickled"]
+
+    assert storage["key"] == "new value"
+    assert "pickled" not in storage
+
+
+def test_disk_storage_instrumentation(tmp_path: Path):
+    from skore import instrumentation
+
+    storage = DiskCacheStorage(tmp_path)
+    events = []
+
+    with instrumentation.listening(events.append):
+        storage["key"] = b"0" * 2**16
+        storage["key"]
+
+    assert [(event.phase, event.nbytes) for event in events] == [
+        ("disk.store", 2**16),
+        ("disk.fetch", 2**16),
+    ]
+    assert events[0].key == "key"
@@ -0,0 +1,72 @@
+from contextlib import ExitStack
+
+import pytest
+from skore import instrumentation
+from skore.instrumentation import Event, measure, payload_size
+
+
+def test_measure_without_listener():
+    with measure("phase") as event:
+        assert event is None
+
+
+def test_measure():
+    events = []
+
+    with instrumentation.listening(events.append), measure("phase", key="key") as event:
+        event.item_type = "Item"
+        event.nbytes = 3
+
+    assert len(events) == 1
+    assert isinstance(events[0], Event)
+    assert events[0].phase == "phase"
+    assert events[0].key == "key"
+    assert events[0].item_type == "Item"
+    assert events[0].nbytes == 3
+    assert events[0].duration >= 0
+    assert events[0].error is None
+
+    # The listener is unregistered once out of the `with` block
+    with measure("phase") as event:
+        assert event is None
+
+
+def test_measure_error():
+    events = []
+
+    # Parenthesized context managers require Python 3.10
+    with ExitStack() as stack:
+        stack.enter_context(instrumentation.listening(events.append))
+        stack.enter_context(pytest.raises(KeyError))
+        stack.enter_context(measure("phase"))
+
+        raise KeyError
+
+    assert events[0].error == "KeyError"
+
+
+def test_failing_listener():
+    def listener(event):
+        raise ValueError
+
+    events = []
+
+    with ExitStack() as stack:
+        stack.enter_context(instrumentation.listening(listener))
+        stack.enter_context(instrumentation.listening(events.append))
+        stack.enter_context(measure("phase"))
+
+    assert len(events) == 1
+
+
+def test_remove_listener_missing():
+    with pytest.raises(ValueError):
+        instrumentation.remove_listener(print)
+
+
+def test_payload_size():
+    assert payload_size(1) == 0
+    assert payload_size("abc") == 3
+    assert payload_size(b"abc") == 3
+    assert payload_size(memoryview(b"abc")) == 3
+    assert payload_size({"a": [b"abc", ("de", 1)]}) == 5
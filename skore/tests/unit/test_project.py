@@ -7,9 +7,13 @@ import numpy.testing
 import pandas
 import pandas.testing
 import pytest
+import scipy.sparse
 from matplotlib import pyplot as plt
 from PIL import Image
 from sklearn.ensemble import RandomForestClassifier
+from skore.item import MediaPolicy, NumpyArrayItem
+from skore.item.chunked_array import ChunkedArray
+from skore.persistence.abstract_storage import StorageIsReadOnly
 from skore.project import Project, ProjectLoadError, ProjectPutError, load
 from skore.view.view import View
 
@@ -39,6 +43,13 @@ def test_put_list_item(in_memory_project):
     assert in_memory_project.get("list_item") == [1, 2, 3]
 
 
+def test_put_numeric_list_item(in_memory_project):
+    losses = [i / 3 for i in range(10_000)]
+    in_memory_project.put("list_item", losses)
+    assert in_memory_project.get_item("list_item").primitive_npy is not None
+    assert in_memory_project.get("list_item") == losses
+
+
 def test_put_dict_item(in_memory_project):
     in_memory_project.put("dict_item", {"key": "value"})
     assert in_memory_project.get("dict_item") == {"key": "value"}
@@ -73,6 +84,17 @@ def test_put_numpy_array(in_memory_project):
     numpy.testing.assert_array_equal(in_memory_project.get("numpy_array"), arr)
 
 
+def test_put_scipy_sparse_matrix(in_memory_project):
+    matrix = scipy.sparse.random(10, 5, density=0.2, format="csr", random_state=0)
+    in_memory_project.put("sparse_matrix", matrix)
+
+    result = in_memory_project.get("sparse_matrix")
+
+    assert isinstance(result, scipy.sparse.csr_matrix)
+    assert (result != matrix).nnz == 0
+    assert in_memory_project.get_summary("sparse_matrix")["nnz"] == 10
+
+
 def test_put_mpl_figure(in_memory_project, monkeypatch):
     # Add a Matplotlib figure
     def savefig(*args, **kwargs):
@@ -104,6 +126,68 @@ def test_put_pil_image(in_memory_project):
     assert isinstance(in_memory_project.get("pil_image"), bytes)
 
 
+def test_put_file(in_memory_project, monkeypatch, tmp_path):
+    monkeypatch.setattr("skore.item.MediaItem.CHUNK_SIZE", 4)
+    in_memory_project.item_repository.blob_storage = blob_storage = {}
+    path = tmp_path / "media.txt"
+    path.write_bytes(b"<content>")
+
+    in_memory_project.put("file", path)
+
+    assert sorted(blob_storage.values()) == [b"<con", b">", b"tent"]
+
+    with in_memory_project.get("file", lazy=True) as stream:
+        assert stream.read() == b"<content>"
+
+    with open(path, "rb") as file:
+        in_memory_project.put("file", file, background=True).result()
+
+    assert in_memory_project.get("file", lazy=True).read() == b"<content>"
+    assert in_memory_project.get("file") == b"<content>"
+
+
+def test_put_file_without_blob_storage(in_memory_project, monkeypatch, tmp_path):
+    monkeypatch.setattr("skore.item.MediaItem.CHUNK_SIZE", 4)
+    path = tmp_path / "media.txt"
+    path.write_bytes(b"<content>")
+
+    # Files read in chunks are not loaded in memory at once
+    with pytest.raises(ProjectPutError):
+        in_memory_project.put("file", path)
+
+    monkeypatch.setattr("skore.item.MediaItem.CHUNK_SIZE", 16)
+    in_memory_project.put("file", path)
+
+    assert in_memory_project.get("file") == b"<content>"
+
+
+def test_put_media_policy(in_memory_project):
+    fig, ax = plt.subplots(figsize=(4, 4), dpi=100)
+    pil_image = Image.new("RGB", (1000, 1000), color="red")
+    in_memory_project.media_policy = MediaPolicy(figure_format="png", dpi=50)
+
+    in_memory_project.put("mpl_figure", fig)
+    item = in_memory_project.get_item("mpl_figure")
+    assert item.media_type == "image/png"
+    assert Image.open(BytesIO(item.media_bytes)).size == (200, 200)
+    assert item.thumbnail_bytes is None
+
+    in_memory_project.put(
+        "pil_image", pil_image, media_policy=MediaPolicy(max_size=(500, 500))
+    )
+    item = in_memory_project.get_item("pil_image")
+    assert Image.open(BytesIO(item.media_bytes)).size == (500, 500)
+    assert Image.open(BytesIO(item.thumbnail_bytes)).size == (256, 256)
+
+    in_memory_project.put(
+        "pil_image",
+        pil_image,
+        background=True,
+        media_policy=MediaPolicy(thumbnail_size=None),
+    ).result()
+    assert in_memory_project.get_item("pil_image").thumbnail_bytes is None
+
+
 def test_put_rf_model(in_memory_project, monkeypatch):
     # Add a scikit-learn model
     monkeypatch.setattr("sklearn.utils.estimator_html_repr", lambda _: "")
@@ -132,6 +216,118 @@ def test_load(tmp_path):
     assert isinstance(p, Project)
 
 
+def test_load_readonly(tmp_path):
+    project_path = tmp_path / "project.skore"
+    os.mkdir(project_path)
+    os.mkdir(project_path / "items")
+    os.mkdir(project_path / "views")
+
+    writer = load(project_path)
+    writer.put("key", 1)
+    writer.put_view("view", View(layout=["key"]))
+
+    reader = load(project_path, readonly=True)
+    assert reader.get("key") == 1
+    assert reader.get_view("view") == View(layout=["key"])
+    assert reader.list_item_keys() == ["key"]
+
+    with pytest.raises(ProjectPutError):
+        reader.put("key", 2)
+
+    # Other modifications raise the error of the storage as is
+    with pytest.raises(StorageIsReadOnly):
+        reader.put_view("view", View(layout=[]))
+    with pytest.raises(StorageIsReadOnly):
+        reader.delete_view("view")
+    with pytest.raises(StorageIsReadOnly):
+        reader.delete_item("key")
+
+    writer.put("key", 2)
+    assert reader.get("key") == 2
+
+
+def test_get_no_copy(tmp_path):
+    project_path = tmp_path / "project.skore"
+    os.mkdir(project_path)
+    os.mkdir(project_path / "items")
+    os.mkdir(project_path / "views")
+
+    array = numpy.arange(2**14, dtype="float64")
+    dataframe = pandas.DataFrame({"a": array, "b": array.astype("int32")})
+
+    writer = load(project_path)
+    writer.put("array", array)
+    writer.put("dataframe", dataframe)
+
+    # Large buffers are stored once, apart from the items
+    assert len(list(writer.item_repository.blob_storage.keys())) == 2
+
+    reader = load(project_path, readonly=True)
+    view = reader.get("array", copy=False)
+    dataframe_view = reader.get("dataframe", copy=False)
+
+    numpy.testing.assert_array_equal(view, array)
+    pandas.testing.assert_frame_equal(dataframe_view, dataframe)
+    assert not view.flags.writeable
+    assert reader.get("array").flags.writeable
+
+    # Views remain valid once their item is overwritten
+    writer.put("array", array + 1)
+    numpy.testing.assert_array_equal(view, array)
+
+
+def test_get_chunked_array(tmp_path, monkeypatch):
+    monkeypatch.setattr(NumpyArrayItem, "CHUNKED_MIN_SIZE", 2**16)
+    monkeypatch.setattr(NumpyArrayItem, "CHUNK_SIZE", 2**12)
+
+    project_path = tmp_path / "project.skore"
+    os.mkdir(project_path)
+    os.mkdir(project_path / "items")
+    os.mkdir(project_path / "views")
+
+    # Arrays larger than memory are streamed chunk by chunk from their file
+    array = numpy.lib.format.open_memmap(
+        tmp_path / "array.npy", mode="w+", dtype="float64", shape=(256, 64)
+    )
+    array[:] = numpy.arange(256 * 64).reshape(256, 64)
+
+    project = load(project_path)
+    project.put("array", array)
+
+    # Chunked arrays are only loaded lazily on demand
+    numpy.testing.assert_array_equal(project.get("array"), array)
+    assert type(project.get("array")) is numpy.ndarray
+
+    value = project.get("array", lazy=True)
+
+    assert isinstance(value, ChunkedArray)
+    assert value.shape == (256, 64)
+    numpy.testing.assert_array_equal(value[10:200:7, [0, 63]], array[10:200:7, [0, 63]])
+    numpy.testing.assert_array_equal(numpy.asarray(value), array)
+
+
+def test_get_summary(tmp_path):
+    project_path = tmp_path / "project.skore"
+    os.mkdir(project_path)
+    os.mkdir(project_path / "items")
+    os.mkdir(project_path / "views")
+
+    project = load(project_path)
+    project.put("array", numpy.zeros(2**14))
+    project.put("dataframe", pandas.DataFrame({"a": [1, 2]}))
+    project.put("string", "value")
+
+    # Blobs are not loaded
+    project.item_repository.blob_storage = None
+
+    assert project.get_summary("array")["shape"] == [2**14]
+    assert project.get_summary("dataframe")["columns"][0]["max"] == 2
+    assert project.get_summary("string") is None
+
+    with pytest.raises(KeyError):
+        project.get_summary("missing")
+
+
 def test_put(in_memory_project):
     in_memory_project.put("key1", 1)
     in_memory_project.put("key2", 2)
@@ -234,6 +430,44 @@ def test_put_several_error(in_memory_project):
     assert in_memory_project.list_item_keys() == ["a"]
 
 
+def test_put_background(in_memory_project):
+    value = [1, 2, 3]
+    future = in_memory_project.put("key", value, background=True)
+    value.append(4)
+
+    assert future.result() is None
+    assert in_memory_project.get("key") == [1, 2, 3]
+
+
+def test_put_background_order(in_memory_project):
+    futures = [in_memory_project.put("key", i, background=True) for i in range(20)]
+    in_memory_project.put("key", 20)
+
+    assert all(future.done() for future in futures)
+    assert [item.primitive for item in in_memory_project.get_item_versions("key")] == (
+        list(range(21))
+    )
+
+
+def test_put_background_error(in_memory_project):
+    future = in_memory_project.put(
+        {"a": "foo", "b": (lambda: "unsupported object")}, background=True
+    )
+
+    with pytest.raises(ProjectPutError):
+        future.result()
+
+    assert in_memory_project.list_item_keys() == ["a"]
+
+
+def test_put_background_flush(in_memory_project):
+    in_memory_project.put({"a": 1, "b": numpy.arange(3)}, background=True)
+
+    assert in_memory_project.flush()
+    assert in_memory_project.get("a") == 1
+    numpy.testing.assert_array_equal(in_memory_project.get("b"), numpy.arange(3))
+
+
 def test_put_key_is_a_tuple(in_memory_project):
     """If key is not a string, warn."""
     with pytest.raises(ProjectPutError):
@@ -249,5 +483,43 @@ def test_put_key_is_a_set(in_memory_project):
 
 def test_put_wrong_key_and_value_raise(in_memory_project):
     """When `on_error` is "raise", raise the first error that occurs."""
-    with pytest.raises(ProjectPutError):
+    with pytest.raises(ProjectPutError) as excinfo:
         in_memory_project.put(0, (lambda: "unsupported object"))
+
+    # The key is checked before the value is converted
+    assert isinstance(excinfo.value.__cause__, TypeError)
+
+    with pytest.raises(ProjectPutError):
+        in_memory_project.put(0, "value", background=True)
+
+
+def test_instrumentation(in_memory_project):
+    from skore import instrumentation
+
+    events = []
+
+    with instrumentation.listening(events.append):
+        in_memory_project.put("key", "value")
+
+    assert [event.phase for event in events] == [
+        "object_to_item",
+        "storage.set",
+        "put_item",
+        "put",
+    ]
+    assert all(event.key == "key" for event in events)
+    assert events[-1].item_type == "PrimitiveItem"
+    assert events[-2].nbytes >= len("value")
+
+    events.clear()
+
+    with instrumentation.listening(events.append):
+        assert in_memory_project.get("key") == "value"
+
+    assert [event.phase for event in events] == [
+        "storage.get",
+        "get_item",
+        "decode",
+        "get",
+    ]
+    assert events[-1].item_type == "PrimitiveItem"